@@ -0,0 +1,11 @@
+# Helpers shared by the benchmark scripts, imported from the Benchmarks directory.
+
+def create(name, base, members, **kwds):
+    """
+    Creates the enum class `name` deriving from `base` with the `members` dict of names to values,
+    through its metaclass as a class statement would, so member counts aren't limited by a class body.
+    """
+    namespace = type(base).__prepare__(name, (base, ), **kwds)
+    for member_name, value in members.items():
+        namespace[member_name] = value
+    return type(base)(name, (base, ), namespace, **kwds)
@@ -0,0 +1,34 @@
+# Adding package path to reference enumex
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+# Times class bodies assigning auto() to every member, compared with the standard enum,
+# and a derived class adding auto() members to a large inherited class.
+# Usage: python Benchmarks/bench_auto.py
+
+import enum
+import time
+from enum import auto
+from enumex import EnumEx, FlagEx
+from _helpers import create
+
+SIZES = (1000, 5000, 10000)
+DERIVED = 1000
+
+def timed_create(name, base, count, prefix='M'):
+    members = {f"{prefix}{i}": auto() for i in range(count)}
+    start = time.perf_counter()
+    cls = create(name, base, members)
+    return cls, time.perf_counter() - start
+
+print(f"{'class':<24}{'members':>10}{'std ms':>12}{'enumex ms':>12}")
+for std_base, base in ((enum.Enum, EnumEx), (enum.Flag, FlagEx)):
+    for size in SIZES:
+        _, std = timed_create('Std', std_base, size)
+        _, ex = timed_create('Ex', base, size)
+        print(f"{base.__name__:<24}{size:>10}{std * 1000:>12.1f}{ex * 1000:>12.1f}")
+
+parent, _ = timed_create('Parent', EnumEx, SIZES[-1])
+_, derived = timed_create('Child', parent, DERIVED, prefix='D')
+print(f"{'EnumEx derived':<24}{DERIVED:>10}{'':>12}{derived * 1000:>12.1f}")
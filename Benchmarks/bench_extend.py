@@ -0,0 +1,27 @@
+# Adding package path to reference enumex
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+# Times adding members to a large class with extend(), against defining a subclass with the new members.
+# Usage: python Benchmarks/bench_extend.py
+
+import time
+from enumex import EnumEx, FlagEx
+from _helpers import create
+
+MEMBERS = 10_000
+ADDED = 10
+
+print(f"{'class':<10}{'subclass ms':>14}{'extend ms':>12}")
+for root, value in ((EnumEx, lambda i: i), (FlagEx, lambda i: 1 << i)):
+    cls = create('Large', root, {f"M{i}": value(i) for i in range(MEMBERS)}, extensible=True)
+    added = {f"N{i}": value(i) for i in range(MEMBERS, MEMBERS + ADDED)}
+    start = time.perf_counter()
+    larger = create('Larger', cls, added)
+    subclass = time.perf_counter() - start
+    # cls can't be extended any more, as Larger defines its own members
+    start = time.perf_counter()
+    larger.extend(**{f"E{i}": value(i) for i in range(MEMBERS + ADDED, MEMBERS + 2 * ADDED)})
+    extend = time.perf_counter() - start
+    print(f"{root.__name__:<10}{subclass * 1000:>14.1f}{extend * 1000:>12.2f}")
@@ -0,0 +1,35 @@
+# Adding package path to reference enumex
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+# Times creating derived FlagEx classes which define many negative ("all except") members.
+# Usage: python Benchmarks/bench_flag_inversion.py
+
+import time
+from enumex import FlagEx, report
+from _helpers import create
+
+BITS = 2000
+DEPTH = 5
+INVERTED = 200
+
+report.enable()
+start = time.perf_counter()
+cls = create('Wide', FlagEx, {f"F{bit}": 1 << bit for bit in range(BITS)})
+base_time = time.perf_counter() - start
+
+times = []
+for level in range(DEPTH):
+    members = {f"NOT_{level}_{i}": ~(1 << (level * INVERTED + i)) for i in range(INVERTED)}
+    start = time.perf_counter()
+    cls = create(f"Derived{level}", cls, members)
+    times.append(time.perf_counter() - start)
+
+report.disable()
+
+# prepare_members is the phase which scans for and inverts negative values
+records = report.records()
+print(f"{'class':<12}{'inherited':>10}{'total ms':>10}{'prepare_members ms':>20}")
+for record, seconds in zip(records, [base_time] + times):
+    print(f"{record['qualname']:<12}{record['inherited']:>10}{seconds * 1000:>10.1f}{record['phases']['prepare_members'] * 1000:>20.2f}")
@@ -0,0 +1,65 @@
+# Adding package path to reference enumex
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+# Measures the memory of a synthetic hierarchy of 50 classes defining 20,000 members in total:
+# 5 root classes (EnumEx, IntEnumEx, StrEnumEx, FlagEx, IntFlagEx), each extended by a chain of 9 subclasses.
+# Usage: python Benchmarks/bench_memory.py [--history FILE]
+#   --history appends the totals as a JSON line to FILE, to track them over time.
+
+import argparse
+import datetime
+import json
+import platform
+import tracemalloc
+from enumex import EnumEx, IntEnumEx, StrEnumEx, FlagEx, IntFlagEx, memory_report
+from _helpers import create
+
+ROOTS = (EnumEx, IntEnumEx, StrEnumEx, FlagEx, IntFlagEx)
+DEPTH = 10
+MEMBERS = 400           # per class, 5 * 10 * 400 = 20,000
+PSEUDO = 1000           # composite flags created per flag chain
+
+def build():
+    classes = []
+    for root in ROOTS:
+        cls = root
+        for level in range(DEPTH):
+            first = level * MEMBERS
+            if issubclass(root, FlagEx):
+                members = {f"{root.__name__}_{i}": 1 << i for i in range(first, first + MEMBERS)}
+            elif issubclass(root, StrEnumEx):
+                members = {f"{root.__name__}_{i}": str(i) for i in range(first, first + MEMBERS)}
+            else:
+                members = {f"{root.__name__}_{i}": i for i in range(first, first + MEMBERS)}
+            cls = create(f"{root.__name__}{level}", cls, members)
+            classes.append(cls)
+        if issubclass(root, FlagEx):
+            for i in range(PSEUDO):
+                cls(3 << i)
+    return classes
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--history', help="file to append the totals to")
+args = parser.parse_args()
+
+tracemalloc.start()
+classes = build()
+traced, _ = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+
+records = [record for cls in classes[::DEPTH] for record in memory_report(cls)]
+totals = {key: sum(record[key] for record in records) for key in (
+        'members', 'inherited', 'pseudo_members', 'class_bytes', 'member_bytes', 'inherited_bytes', 'pseudo_bytes', 'total',
+        )}
+totals['classes'] = len(records)
+totals['traced_bytes'] = traced
+
+for key, value in totals.items():
+    print(f"{key:<16}{value:>14,}")
+
+if args.history:
+    entry = {'date': datetime.datetime.now().isoformat(timespec='seconds'), 'python': platform.python_version(), **totals}
+    with open(args.history, 'a', encoding='utf-8') as file:
+        file.write(json.dumps(entry) + '\n')
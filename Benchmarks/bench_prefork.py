@@ -0,0 +1,72 @@
+# Adding package path to reference enumex
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+# Measures the private memory of forked workers using EnumEx classes, with and without prefork_freeze().
+# Linux only, private memory is read from /proc/self/smaps_rollup.
+# Usage: python Benchmarks/bench_prefork.py [--workers N]
+
+import argparse
+import gc
+import os
+import subprocess
+from enumex import IntEnumEx, FlagEx, prefork_freeze
+from _helpers import create
+
+CLASSES = 20
+MEMBERS = 5_000
+
+def private_kib():
+    with open('/proc/self/smaps_rollup') as file:
+        return sum(int(line.split()[1]) for line in file if line.startswith(('Private_Clean:', 'Private_Dirty:')))
+
+def work(classes):
+    """
+    A request touching every member, as a worker serving many requests eventually does.
+    """
+    for cls in classes:
+        for member in cls:
+            cls(member.value)
+            cls[member.name]
+            cls.lookup(member.name.lower())
+    # the oldest generation is collected at some point in a long running worker
+    gc.collect()
+
+def run(mode, workers):
+    classes = [
+            create(f"Int{i}", IntEnumEx, {f"M{j}": j for j in range(MEMBERS)})
+            for i in range(CLASSES)
+            ]
+    classes += [create(f"Flag{i}", FlagEx, {f"F{j}": 1 << j for j in range(60)}) for i in range(CLASSES)]
+    if mode == 'prefork_freeze':
+        prefork_freeze()
+    pids = []
+    read, write = os.pipe()
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            before = private_kib()
+            work(classes)
+            os.write(write, f"{private_kib() - before}\n".encode())
+            os._exit(0)
+        pids.append(pid)
+    os.close(write)
+    with os.fdopen(read) as file:
+        results = [int(line) for line in file]
+    for pid in pids:
+        os.waitpid(pid, 0)
+    print(f"{mode:<16}{sum(results) / len(results) / 1024:>24.1f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--mode', choices=('plain', 'prefork_freeze'))
+    args = parser.parse_args()
+    if args.mode:
+        run(args.mode, args.workers)
+    else:
+        print(f"{'mode':<16}{'private MiB per worker':>24}")
+        # each mode in a new interpreter, so they don't share memory
+        for mode in ('plain', 'prefork_freeze'):
+            subprocess.run([sys.executable, __file__, '--mode', mode, '--workers', str(args.workers)], check=True)
@@ -0,0 +1,46 @@
+# Adding package path to reference enumex
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+# Measures the first lookups of freshly created EnumEx classes, cold and after prewarm().
+# Usage: python Benchmarks/bench_prewarm.py
+
+import time
+from enumex import IntEnumEx, FlagEx, prewarm
+from _helpers import create
+
+CLASSES = 20
+MEMBERS = 2_000
+
+def classes(prefix):
+    created = [
+            create(f"{prefix}Int{i}", IntEnumEx, {f"M{j}": j for j in range(MEMBERS)})
+            for i in range(CLASSES)
+            ]
+    created += [create(f"{prefix}Flag{i}", FlagEx, {f"F{j}": 1 << j for j in range(16)}) for i in range(CLASSES)]
+    return created
+
+def first_lookups(created):
+    """
+    The first request after a deploy, one lookup and one composite per class.
+    """
+    start = time.perf_counter()
+    for cls in created:
+        if issubclass(cls, FlagEx):
+            cls(0b101)
+            ~cls.F0
+        else:
+            cls.lookup('m1')
+    return time.perf_counter() - start
+
+if __name__ == "__main__":
+    cold = first_lookups(classes('Cold'))
+    warm_classes = classes('Warm')
+    start = time.perf_counter()
+    prewarm(warm_classes)
+    warming = time.perf_counter() - start
+    warm = first_lookups(warm_classes)
+    print(f"{'':<12}{'first lookups ms':>18}{'prewarm ms':>12}")
+    print(f"{'cold':<12}{cold * 1000:>18.2f}{'':>12}")
+    print(f"{'prewarmed':<12}{warm * 1000:>18.2f}{warming * 1000:>12.1f}")
@@ -0,0 +1,41 @@
+# Adding package path to reference enumex
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+# Times executing a module of class statements, and the same module decorated with simple_enumex.
+# Usage: python Benchmarks/bench_simple_enumex.py
+
+import time
+
+CLASSES = 100
+MEMBERS = 50
+
+def source(simple):
+    lines = ['from abc import ABC, abstractmethod', 'from enumex import *']
+    for index in range(CLASSES):
+        base = 'IntFlagEx' if index % 2 else 'EnumEx'
+        if simple:
+            lines += [f"@simple_enumex({base})", f"class C{index}(ABC):"]
+        else:
+            lines.append(f"class C{index}(ABC, {base}):")
+        lines += [f"    M{i} = {1 << i}" for i in range(MEMBERS)]
+        lines += ['    @abstractmethod', '    def method(self):', '        pass']
+        # a subclass inheriting the members
+        if simple:
+            lines += [f"@simple_enumex(C{index})", f"class D{index}:"]
+        else:
+            lines.append(f"class D{index}(C{index}):")
+        lines += [f"    N{i} = {1 << (MEMBERS + i)}" for i in range(MEMBERS)]
+        lines += ['    def method(self):', '        return 1']
+    return compile('\n'.join(lines), f"module_{simple}", 'exec')
+
+print(f"{'':<16}{'ms':>10}")
+for simple in (False, True):
+    code = source(simple)
+    times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        exec(code, {'__name__': 'bench_module'})
+        times.append(time.perf_counter() - start)
+    print(f"{'simple_enumex' if simple else 'class statement':<16}{min(times) * 1000:>10.1f}")
@@ -0,0 +1,56 @@
+# Adding package path to reference enumex
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+# Compares str(), repr() and f-string formatting of members with and without cache_str=True.
+# Usage: python Benchmarks/bench_str_cache.py
+
+import timeit
+from enum import Enum, IntFlag, auto
+from enumex import EnumEx, IntFlagEx
+
+NUMBER = 200_000
+
+class StdColor(Enum):
+    RED = auto()
+    GREEN = auto()
+
+class Color(EnumEx):
+    RED = auto()
+    GREEN = auto()
+
+class CachedColor(EnumEx, cache_str=True):
+    RED = auto()
+    GREEN = auto()
+
+class StdPerm(IntFlag):
+    R = auto()
+    W = auto()
+    X = auto()
+
+class Perm(IntFlagEx):
+    R = auto()
+    W = auto()
+    X = auto()
+
+class CachedPerm(IntFlagEx, cache_str=True):
+    R = auto()
+    W = auto()
+    X = auto()
+
+def bench(label, member):
+    times = [
+            timeit.timeit(lambda: str(member), number=NUMBER),
+            timeit.timeit(lambda: repr(member), number=NUMBER),
+            timeit.timeit(lambda: f"{member}", number=NUMBER),
+            ]
+    print(f"{label:<32}" + ''.join(f"{t / NUMBER * 1e9:>10.0f}" for t in times))
+
+print(f"{'ns per call':<32}{'str':>10}{'repr':>10}{'format':>10}")
+bench('Enum', StdColor.RED)
+bench('EnumEx', Color.RED)
+bench('EnumEx cache_str', CachedColor.RED)
+bench('IntFlag pseudo-member', StdPerm.R | StdPerm.X)
+bench('IntFlagEx pseudo-member', Perm.R | Perm.X)
+bench('IntFlagEx cache_str pseudo', CachedPerm.R | CachedPerm.X)
@@ -0,0 +1,41 @@
+# Adding package path to reference enumex
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+# Times verifying every class of a deep hierarchy with enum.verify and enumex.verify.
+# Usage: python Benchmarks/bench_verify.py
+
+import enum
+import time
+from enum import UNIQUE, CONTINUOUS, NAMED_FLAGS
+from enumex import EnumEx, FlagEx, verify
+from _helpers import create
+
+DEPTH = 20
+MEMBERS = 500
+
+def hierarchy(root, value):
+    classes = []
+    cls = root
+    for level in range(DEPTH):
+        first = level * MEMBERS
+        cls = create(f"{root.__name__}{level}", cls, {f"M{i}": value(i) for i in range(first, first + MEMBERS)})
+        classes.append(cls)
+    return classes
+
+print(f"{'hierarchy':<12}{'checks':<36}{'enum.verify ms':>16}{'enumex.verify ms':>18}")
+for root, value, checks in (
+        (EnumEx, lambda i: i, (UNIQUE, CONTINUOUS)),
+        (FlagEx, lambda i: 1 << i, (UNIQUE, CONTINUOUS, NAMED_FLAGS)),
+    ):
+    results = []
+    for decorator in (enum.verify(*checks), verify(*checks)):
+        # a new hierarchy, so no summaries are cached
+        classes = hierarchy(root, value)
+        start = time.perf_counter()
+        for cls in classes:
+            decorator(cls)
+        results.append(time.perf_counter() - start)
+    names = ', '.join(check.name for check in checks)
+    print(f"{root.__name__:<12}{names:<36}{results[0] * 1000:>16.1f}{results[1] * 1000:>18.1f}")
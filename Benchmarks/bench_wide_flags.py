@@ -0,0 +1,39 @@
+# Adding package path to reference enumex
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+# Compares iterating, decomposing and sizing members of a 512-flag FlagEx with the standard Flag.
+# Usage: python Benchmarks/bench_wide_flags.py
+
+import random
+import timeit
+from enum import Flag
+from enumex import FlagEx
+from _helpers import create
+
+BITS = 512
+NUMBER = 200
+
+StdWide = create('StdWide', Flag, {f"F{bit}": 1 << bit for bit in range(BITS)})
+Wide = create('Wide', FlagEx, {f"F{bit}": 1 << bit for bit in range(BITS)})
+
+random.seed(0)
+values = [random.getrandbits(BITS) for _ in range(NUMBER)]
+sparse = [sum(1 << random.randrange(BITS) for _ in range(4)) for _ in range(NUMBER)]
+
+def bench(label, cls):
+    dense_members = [cls(value) for value in values]
+    sparse_members = [cls(value) for value in sparse]
+    times = [
+            # decomposing new values into pseudo-members
+            timeit.timeit(lambda: [cls._missing_(value) for value in values], number=1) / NUMBER,
+            timeit.timeit(lambda: [list(m) for m in dense_members], number=1) / NUMBER,
+            timeit.timeit(lambda: [list(m) for m in sparse_members], number=1) / NUMBER,
+            timeit.timeit(lambda: [len(m) for m in dense_members], number=100) / NUMBER / 100,
+            ]
+    print(f"{label:<12}" + ''.join(f"{t * 1e6:>14.2f}" for t in times))
+
+print(f"{'us per call':<12}{'decompose':>14}{'iter dense':>14}{'iter sparse':>14}{'len':>14}")
+bench('Flag', StdWide)
+bench('FlagEx', Wide)
@@ -1300,6 +1300,556 @@ class EnumExTests(unittest.TestCase):
         self.assertIs(_IntFlagEx._generate_next_value_, IntFlag._generate_next_value_)
         self.assertIs(_StrEnumEx._generate_next_value_, StrEnum._generate_next_value_)
 
+    def test_resolve(self):
+        class A(EnumEx):
+            V1 = auto()
+            V2 = auto()
+        class B(A):
+            V3 = auto()
+        class C(A):
+            V4 = 4
+        class D(B):
+            V5 = 5
+            V6 = 3      # alias of inherited V3
+
+        self.assertIs(A.V1,             A.resolve(1))
+        self.assertIs(B.V3,             A.resolve(3))
+        self.assertIs(C.V4,             A.resolve(4))
+        self.assertIs(D.V5,             A.resolve(5))
+        self.assertIs(D.V5,             B.resolve(5))
+        self.assertIs(B.V3,             B.resolve(3))
+        self.assertIs(D.V5,             D.resolve(5))
+        self.assertIs(D.V1,             D.resolve(1))
+
+        with self.assertRaises(ValueError):
+            B.resolve(4)                # Defined by sibling C
+        with self.assertRaises(ValueError):
+            A.resolve([])               # Unhashable
+        with self.assertRaises(ValueError):
+            EnumEx.resolve(1)
+
+        self.assertTupleEqual((A,),     A.resolve_name('V1'))
+        self.assertTupleEqual((B,),     A.resolve_name('V3'))
+        self.assertTupleEqual((D,),     A.resolve_name('V6'))
+        self.assertTupleEqual((),       C.resolve_name('V3'))
+        self.assertTupleEqual((D,),     D.resolve_name('V1'))
+        self.assertTupleEqual((),       A.resolve_name('V7'))
+
+    def test_resolve_flagex(self):
+        class A(IntFlagEx):
+            F1 = auto()
+            F2 = auto()
+        class B(A):
+            F3 = auto()
+
+        self.assertIs(B.F3,             A.resolve(4))
+        self.assertIs(A.F2,             A.resolve(2))
+        self.assertIs(B.F3,             B.resolve(4))
+        v = B.F1 | B.F3                 # Pseudo members are not indexed
+        with self.assertRaises(ValueError):
+            A.resolve(5)
+
+    def test_resolve_collected_subclass(self):
+        import gc
+        class A(EnumEx):
+            V1 = auto()
+
+        def define():
+            class B(A):
+                V2 = auto()
+            return A.resolve(2)
+
+        self.assertEqual('V2',          define().name)
+        gc.collect()
+        with self.assertRaises(ValueError):
+            A.resolve(2)
+        self.assertTupleEqual((),       A.resolve_name('V2'))
+        self.assertDictEqual({},        {k: v for k, v in A._value2class_map_.items() if k != 1})
+
+    def test_freeze(self):
+        class A(EnumEx):
+            V1 = auto()
+        class B(A):
+            V2 = auto()
+
+            def method(self):
+                return self.value
+
+        self.assertIs(B,                B.freeze())
+        self.assertIsInstance(B,        EnumExType)
+        self.assertIsInstance(B.V1,     B)
+        self.assertIsInstance(B.V1,     A)
+        self.assertNotIsInstance(A.V1,  B)
+        self.assertTrue(issubclass(B,   A))
+        self.assertIs(B.V2,             B(2))
+        self.assertIs(B.V2,             B['V2'])
+        self.assertIs(B.V2,             A.resolve(2))
+        self.assertEqual(2,             B.V2.method())
+        self.assertListEqual([B.V1, B.V2], list(B))
+        self.assertIs(B,                B.freeze())
+
+        with self.assertRaises(TypeError) as ec:
+            class C(B):
+                V3 = auto()
+        self.assertIn("cannot extend final", ec.exception.args[0])
+
+        with self.assertRaises(TypeError) as ec:
+            A.freeze()
+        self.assertIn("already been subclassed", ec.exception.args[0])
+
+    def test_freeze_final_keyword(self):
+        class A(IntFlagEx, final=True):
+            F1 = auto()
+            F2 = auto()
+
+        self.assertIsInstance(A.F1 | A.F2,  A)
+        self.assertEqual(3,             A.F1 | A.F2)
+        self.assertEqual(A.F1,          ~A.F2)
+        with self.assertRaises(TypeError):
+            class B(A):
+                F3 = auto()
+
+    def test_freeze_abstract(self):
+        class A(ABC, EnumEx):
+            V1 = auto()
+
+            @abstractmethod
+            def method(self):
+                pass
+
+            @property
+            @abstractmethod
+            def prop(self):
+                pass
+        class B(A):
+            V2 = auto()
+
+            def method(self):
+                return self.value
+
+            @property
+            def prop(self):
+                return self.name
+
+        with self.assertRaises(TypeError) as ec:
+            class C(A, final=True):
+                V2 = auto()
+        self.assertIn("cannot freeze abstract", ec.exception.args[0])
+
+        B.freeze()
+        self.assertIs(object.__getattribute__, B.__getattribute__)
+        self.assertIs(object.__setattr__, B.__setattr__)
+        self.assertEqual(2,             B.V2.method())
+        self.assertEqual('V2',          B.V2.prop)
+        self.assertIs(B.V1,             B(1))
+        with self.assertRaises(TypeError):
+            A.V1.method()
+        with self.assertRaises(TypeError):
+            A(1)
+
+
+    def test_cache_str(self):
+        class A(ABC, FlagEx, cache_str=True):
+            F1 = auto()
+            F2 = auto()
+
+            @abstractmethod
+            def method(self):
+                pass
+        class B(A):
+            F3 = auto()
+
+            def method(self):
+                pass
+
+            def __str__(self):
+                return f"B:{self._name_}"
+        class C(B, cache_str=False):
+            F4 = auto()
+
+        self.assertEqual('A.F1',                    str(A.F1))
+        self.assertEqual('<A.F1: 1>',               repr(A.F1))
+        self.assertEqual('A.F1',                    f"{A.F1}")
+        self.assertEqual('    A.F1',                f"{A.F1:>8}")
+        self.assertEqual('A.F1',                    A.F1.__dict__['_cached__str__'])
+        self.assertNotIn('_cached__str__',          dir(A.F1))
+        # Inherited, and applied to overridden methods
+        self.assertTrue(B._cache_str_)
+        self.assertEqual('B:F3',                    str(B.F3))
+        self.assertEqual('B:F3',                    B.F3.__dict__['_cached__str__'])
+        self.assertEqual('<B.F1|F3: 5>',            repr(B.F1 | B.F3))
+        self.assertIs(B.__format__,                 A.__format__)
+        # Pseudo-members are cached up to _STR_CACHE_SIZE results per class
+        self.assertEqual('<B.F1|F3: 5>',            (B.F1 | B.F3).__dict__['_cached__repr__'])
+        # Disabled for subclasses
+        self.assertFalse(C._cache_str_)
+        self.assertEqual('B:F4',                    str(C.F4))
+        self.assertNotIn('_cached__str__',          C.F4.__dict__)
+        self.assertNotIn('_cached__repr__',         (C.F1 | C.F4).__dict__)
+
+    def test_cache_str_pseudo_limit(self):
+        class A(IntFlagEx, cache_str=True):
+            F1 = auto()
+
+        # The data type's methods aren't wrapped
+        self.assertIs(int.__repr__,                 A.__str__)
+        self.assertEqual('<A.F1: 1>',               repr(A.F1))
+        members = [A(value) for value in range(2, enumex.enumex._STR_CACHE_SIZE + 12)]
+        reprs = [repr(m) for m in members]
+        self.assertEqual('<A.F1|2: 3>',             reprs[1])
+        self.assertListEqual(reprs,                 [repr(m) for m in members])
+        cached = sum('_cached__repr__' in m.__dict__ for m in members)
+        self.assertEqual(enumex.enumex._STR_CACHE_SIZE, cached)
+        self.assertEqual('<A.F1: 1>',               A.F1.__dict__['_cached__repr__'])
+
+
+    def test_lookup(self):
+        class A(StrEnumEx):
+            DEBUG = 'debug'
+            WARNING = 'warn'
+        class B(A):
+            CRITICAL = 'crit'
+        class C(IntEnumEx):
+            ONE = 1
+            UNO = 1
+
+        self.assertIs(A.DEBUG,              A.lookup('DEBUG'))
+        self.assertIs(A.DEBUG,              A.lookup('Debug'))
+        self.assertIs(A.WARNING,            A.lookup('warn'))
+        self.assertIs(A.WARNING,            A.lookup('WARN'))
+        with self.assertRaises(KeyError):
+            A.lookup('Debug', casefold=False)
+        with self.assertRaises(KeyError):
+            A.lookup('crit')
+        # Inherited names are looked up in the indexes of the base
+        self.assertIs(B.DEBUG,              B.lookup('debug'))
+        self.assertIs(B.CRITICAL,           B.lookup('Crit'))
+        for index in B._lookup_indexes_[True]:
+            self.assertNotIn('debug',       index)
+        self.assertTupleEqual((B, A),       B._lookup_chain_)
+        # Values as str, aliases resolve to the canonical member
+        self.assertIs(C.ONE,                C.lookup('1'))
+        self.assertIs(C.ONE,                C.lookup('uno'))
+        # Names take precedence over values across the hierarchy
+        class D(A):
+            CRIMSON = 'debug'
+        self.assertIs(D.DEBUG,              D.lookup('debug'))
+        self.assertIs(D.CRIMSON,            D.lookup('crimson'))
+        with self.assertRaises(TypeError):
+            C.lookup(1)
+        with self.assertRaises(TypeError):
+            C.lookup(None)
+
+    def test_lookup_register_alias(self):
+        class A(EnumEx):
+            RED = auto()
+            GREEN = auto()
+        class B(A):
+            BLUE = auto()
+
+        self.assertIs(A.GREEN,              A.lookup('green'))
+        A.register_alias('Verde', A.GREEN)
+        B.register_alias('azul', 'BLUE')
+        self.assertIs(A.GREEN,              A.lookup('verde'))
+        self.assertIs(B.GREEN,              B.lookup('Verde', casefold=False))
+        self.assertIs(B.BLUE,               B.lookup('AZUL'))
+        with self.assertRaises(KeyError):
+            A.lookup('azul')
+        with self.assertRaises(ValueError):
+            A.register_alias('RED', A.GREEN)
+        with self.assertRaises(ValueError):
+            A.register_alias('blue', B.BLUE)
+        # Inherited aliases take precedence over values, BLUE is 3
+        self.assertIs(B.BLUE,               B.lookup('3'))
+        A.register_alias('3', A.RED)
+        self.assertIs(B.RED,                B.lookup('3'))
+
+
+    def test_flag_set_algebra(self):
+        class A(FlagEx):
+            F1 = auto()
+            F2 = auto()
+            F3 = auto()
+        class B(A):
+            F4 = auto()
+        class C(IntFlagEx):
+            F1 = auto()
+            F2 = auto()
+            F3 = auto()
+
+        masks = [B.F1, B.F1 | B.F2, A.F3, B.F4, B.F2 | B.F4]
+        self.assertIs(B.F1 | B.F2 | B.F3 | B.F4,        B.union(masks))
+        self.assertIs(B(0),                             B.union([]))
+        self.assertIs(B.F2,                             B.intersection([B.F1 | B.F2, B.F2 | B.F4]))
+        self.assertIs(B(0),                             B.intersection(masks))
+        self.assertIs(B.F1 | B.F2 | B.F3 | B.F4,        B.intersection([]))
+        self.assertDictEqual({B.F1: 2, B.F2: 2, B.F3: 1, B.F4: 2}, B.count_bits(masks))
+        self.assertTrue(B.contains_any(masks,           B.F3))
+        self.assertFalse(B.contains_any(masks[:2],      B.F3 | B.F4))
+        # Data type values are accepted for IntFlagEx only
+        self.assertIs(C.F1 | C.F3,                      C.union([1, C.F3]))
+        self.assertDictEqual({C.F1: 1, C.F2: 1, C.F3: 0}, C.count_bits([3, 8, 0]))
+        with self.assertRaises(TypeError):
+            A.union([A.F1, 2])
+        with self.assertRaises(TypeError):
+            A.union([A.F1, C.F2])
+        # Boundary applies to the result
+        with self.assertRaises(ValueError):
+            A.union([A.F1, B.F4])
+        self.assertEqual(9,                             C.union([C.F1, 8]).value)
+
+
+    def test_wide_flag_iteration(self):
+        namespace = EnumExType.__prepare__('A', (FlagEx, ))
+        for bit in range(200):
+            namespace[f"F{bit}"] = 1 << bit
+        A = EnumExType('A', (FlagEx, ), namespace)
+        class B(FlagEx):
+            F3 = 8
+            F1 = 2
+            F2 = 4
+            F12 = 12
+
+        self.assertNotIn('_bit_members_',           A.__dict__)
+        value = (1 << 199) | (1 << 64) | 1
+        self.assertListEqual([A.F0, A.F64, A.F199], list(A(value)))
+        self.assertEqual(200,                       len(A._bit_members_))
+        self.assertEqual(3,                         len(A(value)))
+        self.assertEqual('A.F0|F64|F199',           str(A(value)))
+        self.assertEqual(200,                       len(~A(0)))
+        # Definition order, and multi-bit aliases
+        self.assertListEqual([B.F3, B.F1, B.F2],    list(B))
+        self.assertListEqual([B.F3, B.F2],          list(B.F12))
+        self.assertListEqual([B.F1, B.F2],          list(B._iter_member_by_value_(6)))
+        self.assertTupleEqual((None, B.F1, B.F2, B.F3), B._bit_members_)
+
+
+    def test_flag_negative_values(self):
+        class A(FlagEx):
+            F1 = auto()
+            F2 = auto()
+            NOT_F1 = -2
+        class B(A):
+            F3 = auto()
+            NOT_F2 = ~2
+            NONE = 0
+        class C(IntFlagEx):
+            F1 = 1
+            ALL = -1
+            F2 = 2
+        class D(FlagEx):
+            def __new__(cls, value, label):
+                member = object.__new__(cls)
+                member._value_ = value
+                member.label = label
+                return member
+            F1 = 1, 'one'
+            F2 = 2, 'two'
+            NOT_F1 = -2, 'not one'
+
+        self.assertIs(A.F2,                         A.NOT_F1)
+        # Inverted against the inherited members and the members defined after them
+        self.assertEqual(5,                         B.NOT_F2.value)
+        self.assertIs(B.F1 | B.F3,                  B.NOT_F2)
+        self.assertIs(B.F2,                         B.NOT_F1)
+        self.assertEqual(3,                         C.ALL.value)
+        self.assertIs(D.F2,                         D.NOT_F1)
+        self.assertEqual('two',                     D.NOT_F1.label)
+
+    def test_pseudo_cache_size(self):
+        class A(IntFlagEx, pseudo_cache_size=3):
+            F1 = auto()
+            F2 = auto()
+            F12 = 3
+        class B(A):
+            F3 = auto()
+        class C(B, pseudo_cache_size=None):
+            pass
+        class D(FlagEx, boundary=KEEP, pseudo_cache_size=0):
+            F1 = auto()
+
+        self.assertEqual(3,                         B._pseudo_cache_size_)
+        self.assertEqual(3,                         C._pseudo_cache_size_)
+        self.assertIsNone(IntFlagEx._pseudo_cache_size_)
+
+        canonical = dict(A._value2member_map_)
+        pseudo = [A(value) for value in range(4, 10)]
+        self.assertIs(pseudo[-1],                   A(9))
+        self.assertEqual(len(canonical) + 3,        len(A._value2member_map_))
+        self.assertListEqual([7, 8, 9],             list(A._pseudo_member_cache_))
+        # Hits move pseudo-members to the end, the least recently used is evicted
+        self.assertIs(pseudo[3],                    A(7))
+        A(10)
+        self.assertListEqual([9, 7, 10],            list(A._pseudo_member_cache_))
+        # Evicted pseudo-members are recreated
+        self.assertIsNot(pseudo[0],                 A(4))
+        self.assertEqual(pseudo[0],                 A(4))
+        # Canonical members keep their identity
+        for value, member in canonical.items():
+            self.assertIs(member,                   A(value))
+            self.assertIs(member,                   A._value2member_map_[value])
+        self.assertIs(A.F12,                        A.F1 | A.F2)
+        self.assertNotIn(3,                         A._pseudo_member_cache_)
+        # Negative values are a second key of the same pseudo-member
+        A(-1)
+        self.assertIn(-1,                           A._value2member_map_)
+        for value in range(20, 24):
+            A(value)
+        self.assertNotIn(-1,                        A._value2member_map_)
+        # Each class has its own cache
+        B(B.F3 | 16)
+        self.assertEqual(1,                         len(B._pseudo_member_cache_))
+        # Nothing is cached with a size of 0
+        self.assertEqual(3,                         D(3).value)
+        self.assertIsNot(D(3),                      D(3))
+        self.assertNotIn(3,                         D._value2member_map_)
+
+        # Final classes keep the bound
+        class E(IntFlagEx, pseudo_cache_size=1, final=True):
+            F1 = auto()
+        E(2), E(4)
+        self.assertListEqual([4],                   list(E._pseudo_member_cache_))
+        self.assertNotIn(2,                         E._value2member_map_)
+
+        # EJECT returns plain ints for values out of range, which aren't cached
+        for final in (False, True):
+            with self.subTest(final=final):
+                class J(IntFlagEx, boundary=EJECT, pseudo_cache_size=2, final=final):
+                    A = 1
+                    C = 4
+                self.assertIs(int,                  type(J(16)))
+                self.assertEqual(-2,                ~J.A)
+                self.assertIs(J.A | J.C,            J(5))
+                self.assertListEqual([5],           list(J._pseudo_member_cache_))
+        # Inversions aren't kept to evicted pseudo-members
+        for boundary in (STRICT, KEEP):
+            with self.subTest(boundary=boundary):
+                class P(FlagEx, boundary=boundary, pseudo_cache_size=1):
+                    A = auto()
+                    B = auto()
+                    C = auto()
+                inverted = ~P.A
+                self.assertIs(P.A,                  ~inverted)
+                P(P.A | P.B)
+                self.assertIsNot(inverted,          P(inverted.value))
+                self.assertIs(~P.A,                 P(inverted.value))
+                self.assertIs(P.A,                  ~P(inverted.value))
+
+        with self.assertRaises(ValueError):
+            class F(IntFlagEx, pseudo_cache_size=-1):
+                F1 = auto()
+        with self.assertRaises(TypeError):
+            class G(IntFlagEx, pseudo_cache_size='1'):
+                F1 = auto()
+
+    def test_ordinal(self):
+        class A(EnumEx):
+            V1 = auto()
+            V2 = auto()
+            ALIAS = 1
+        class B(A):
+            V3 = auto()
+        class F(FlagEx):
+            F1 = auto()
+            F2 = auto()
+
+        self.assertListEqual([0, 1],                [m.ordinal for m in A])
+        self.assertListEqual([0, 1, 2],             [m.ordinal for m in B])
+        self.assertEqual(A.V2.ordinal,              B.V2.ordinal)
+        self.assertEqual(0,                         A.ALIAS.ordinal)
+        self.assertIsNone((F.F1 | F.F2).ordinal)
+
+        # A member named ordinal doesn't clash with the property
+        class C(EnumEx):
+            ordinal = 5
+        self.assertEqual(0,                         C.ordinal.ordinal)
+
+    def test_ordered_enumex(self):
+        class A(OrderedEnumEx):
+            HIGH = 3
+            LOW = 1
+        class B(A):
+            MEDIUM = 2
+        class C(OrderedEnumEx):
+            V1 = 1
+
+        self.assertLess(A.HIGH,                     A.LOW)
+        self.assertLessEqual(A.LOW,                 A.LOW)
+        self.assertGreater(B.MEDIUM,                B.HIGH)
+        self.assertGreaterEqual(B.MEDIUM,           A.LOW)
+        self.assertLess(A.LOW,                      B.MEDIUM)
+        self.assertListEqual([B.HIGH, B.LOW, B.MEDIUM], sorted([B.MEDIUM, B.LOW, B.HIGH]))
+        self.assertListEqual([B.HIGH, B.LOW, B.MEDIUM], sorted([B.MEDIUM, B.LOW, B.HIGH], key=ordinal_key))
+        with self.assertRaises(TypeError):
+            A.HIGH < C.V1
+        with self.assertRaises(TypeError):
+            A.HIGH < 1
+        self.assertNotEqual(A.HIGH,                 B.HIGH)
+
+    def test_auto_values(self):
+        class A(EnumEx):
+            V1 = auto()
+            V2 = 5
+            V3 = auto()
+            V4 = 2
+            V5 = auto()
+        class B(A):
+            V6 = auto()
+        Std = Enum('Std', [('V1', 1), ('V2', 5), ('V3', 6), ('V4', 2), ('V5', 7)])
+        self.assertListEqual([m.value for m in Std],        [m.value for m in A])
+        self.assertEqual(8,                                 B.V6.value)
+
+        class F(FlagEx, boundary=KEEP):
+            F1 = auto()
+            F2 = auto()
+            F5 = 16
+            NOT_F1 = -2
+            F6 = auto()
+        class StdF(Flag, boundary=KEEP):
+            F1 = auto()
+            F2 = auto()
+            F5 = 16
+            NOT_F1 = -2
+            F6 = auto()
+        self.assertListEqual([(m.name, m.value) for m in StdF], [(m.name, m.value) for m in F])
+        class G(F):
+            F7 = auto()
+        self.assertEqual(64,                                G.F7.value)
+
+        class S(StrEnumEx):
+            FIRST = auto()
+        self.assertEqual('first',                           S.FIRST.value)
+
+        # Values which aren't ints use the std generator
+        with self.assertRaises(TypeError):
+            class M(EnumEx):
+                V1 = 'a'
+                V2 = auto()
+        class T(EnumEx):
+            V1 = 1.5
+            V2 = auto()
+            V3 = (auto(), 'x')
+        self.assertEqual(2.5,                               T.V2.value)
+        self.assertEqual((3.5, 'x'),                        T.V3.value)
+        class C(EnumEx):
+            def _generate_next_value_(name, start, count, last_values):
+                return (count, list(last_values))
+            V1 = 10
+            V2 = auto()
+        self.assertEqual((1, [10]),                         C.V2.value)
+        with self.assertRaises(TypeError):
+            class D(EnumEx):
+                V1 = auto()
+                def _generate_next_value_(name, start, count, last_values):
+                    return count
+
+        @simple_enumex(EnumEx)
+        class SA:
+            V1 = auto()
+            V2 = 5
+            V3 = auto()
+        self.assertListEqual([1, 5, 6],                     [m.value for m in SA])
+
 def _assert_invalidabstract(case:unittest.TestCase, cls:EnumEx, initvalue:Union[object,Callable], *args):
     with case.assertRaises(TypeError) as ec:
         if isinstance(initvalue, Callable):
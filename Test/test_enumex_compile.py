@@ -0,0 +1,195 @@
+# Add package directory to path for debugging
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import unittest
+import importlib
+import tempfile
+import textwrap
+import types
+from enumex import *
+from enumex import compile as enumex_compile
+
+SOURCE = textwrap.dedent('''\
+    """Hierarchy used by test_enumex_compile"""
+    from __future__ import annotations
+    from abc import ABC, abstractmethod
+    from enum import auto, KEEP
+    from enumex import *
+
+    class Color(ABC, EnumEx):
+        RED = auto()
+        GREEN = auto()
+
+        @abstractmethod
+        def method(self):
+            pass
+
+        def describe(self):
+            return f"{self.name}={self.value}"
+
+    class MoreColor(Color):
+        _order_ = 'RED GREEN BLUE'
+        BLUE = auto()
+
+        def method(self):
+            return self.name.lower()
+
+    class Perm(FlagEx, boundary=KEEP):
+        R = auto()
+        W = auto()
+        X = auto()
+        RW = R | W
+
+    class MorePerm(Perm):
+        D = auto()
+        NOT_R = -2
+
+    class Name(StrEnumEx):
+        FIRST = auto()
+        SECOND = 'two'
+
+        def upper(self):
+            return f"{__class__.__name__}.{super().upper()}"
+
+        @property
+        def label(self):
+            return super().title()
+
+    class Final(IntEnumEx, final=True):
+        ONE = 1
+        TWO = 2
+    ''')
+
+class EnumExCompileTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        path = Path(self.directory.name)
+        (path / 'compile_source_module.py').write_text(SOURCE)
+        sys.path.insert(0, str(path))
+        self.source = importlib.import_module('compile_source_module')
+        self.compiled_source = enumex_compile.compile_module('compile_source_module')
+        self.compiled = types.ModuleType('compile_compiled_module')
+        exec(compile(self.compiled_source, 'compile_compiled_module.py', 'exec'), vars(self.compiled))
+
+    def tearDown(self):
+        sys.path.remove(self.directory.name)
+        sys.modules.pop('compile_source_module', None)
+        self.directory.cleanup()
+
+    def test_generated_source(self):
+        self.assertIn('@simple_enumex(EnumEx)\nclass Color(ABC):',     self.compiled_source)
+        self.assertIn('@simple_enumex(FlagEx, boundary=KEEP)\n',       self.compiled_source)
+        self.assertIn('@simple_enumex(IntEnumEx, final=True)\n',       self.compiled_source)
+        self.assertIn("FIRST = 'first'",                                self.compiled_source)
+        self.assertIn('D = 8',                                          self.compiled_source)
+        self.assertNotIn('auto()',                                      self.compiled_source)
+        self.assertNotIn('_order_',                                     self.compiled_source)
+        # Imported after the docstring and __future__ imports
+        lines = self.compiled_source.splitlines()
+        self.assertEqual('from enumex import simple_enumex',            lines[2])
+
+    def test_equivalent_classes(self):
+        for name in ('Color', 'MoreColor', 'Perm', 'MorePerm', 'Name', 'Final'):
+            with self.subTest(name=name):
+                expected = getattr(self.source, name)
+                actual = getattr(self.compiled, name)
+                self.assertIsInstance(actual,                           type(expected))
+                self.assertListEqual(
+                        [(m.name, m.value) for m in expected],
+                        [(m.name, m.value) for m in actual],
+                        )
+                self.assertDictEqual(
+                        {k: m.value for k, m in expected.__members__.items()},
+                        {k: m.value for k, m in actual.__members__.items()},
+                        )
+                self.assertListEqual(expected._member_names_,           actual._member_names_)
+                self.assertListEqual(list(expected._value2member_map_), list(actual._value2member_map_))
+                self.assertEqual(expected._isabstractenum_,             actual._isabstractenum_)
+                self.assertEqual(expected.__mro__[1:],                  tuple(
+                        getattr(self.source, b.__name__, b) for b in actual.__mro__[1:]
+                        ))
+
+    def test_flags(self):
+        Perm, MorePerm = self.compiled.Perm, self.compiled.MorePerm
+        for attr in ('_flag_mask_', '_singles_mask_', '_all_bits_', '_boundary_'):
+            self.assertEqual(getattr(self.source.MorePerm, attr),   getattr(MorePerm, attr))
+        self.assertIs(MorePerm.RW,                                  MorePerm.R | MorePerm.W)
+        self.assertEqual(14,                                        MorePerm.NOT_R.value)
+        self.assertIs(MorePerm.D,                                   Perm.resolve(8))
+        self.assertEqual(32,                                        Perm(32).value)
+
+    def test_abstract(self):
+        Color, MoreColor = self.compiled.Color, self.compiled.MoreColor
+        with self.assertRaises(TypeError):
+            Color.RED.method()
+        with self.assertRaises(TypeError):
+            Color(1)
+        self.assertEqual('blue',                                    MoreColor.BLUE.method())
+        self.assertEqual('RED=1',                                   MoreColor.RED.describe())
+        self.assertIsInstance(MoreColor.BLUE,                       Color)
+        self.assertIs(MoreColor.BLUE,                               Color.resolve(3))
+
+    def test_super(self):
+        Name = self.compiled.Name
+        self.assertEqual('Name.FIRST',                              Name.FIRST.upper())
+        self.assertEqual('Two',                                     Name.SECOND.label)
+        self.assertEqual(self.source.Name.FIRST.upper(),            Name.FIRST.upper())
+
+    def test_contains(self):
+        for name in ('Color', 'MoreColor', 'Perm', 'MorePerm', 'Name', 'Final'):
+            with self.subTest(name=name):
+                actual = getattr(self.compiled, name)
+                for member in actual:
+                    self.assertIn(member.value,                     actual)
+
+    def test_final(self):
+        Final = self.compiled.Final
+        self.assertEqual(3,                                         Final.ONE + Final.TWO)
+        self.assertEqual('1',                                       str(Final.ONE))
+        with self.assertRaises(TypeError):
+            class Sub(Final):
+                THREE = 3
+
+    def test_unsupported(self):
+        namespace = {'__name__': 'compile_unsupported_module'}
+        source = textwrap.dedent('''\
+            from enum import auto
+            from enumex import EnumEx
+
+            class Point(EnumEx):
+                ORIGIN = (auto(), 0)
+            ''')
+        exec(source, namespace)
+        with self.assertRaises(ValueError):
+            enumex_compile.compile_source(source, namespace)
+
+    def test_trailing_comma(self):
+        namespace = {'__name__': 'compile_trailing_module'}
+        source = textwrap.dedent('''\
+            from abc import ABC
+            from enumex import EnumEx, FlagEx
+
+            class Color(EnumEx,):
+                RED = 1
+
+            class Shape(
+                ABC,
+                EnumEx,  # members below
+                cache_str=True,
+            ):
+                SQUARE = 4
+            ''')
+        exec(source, namespace)
+        compiled_source = enumex_compile.compile_source(source, namespace)
+        self.assertIn('@simple_enumex(EnumEx)\nclass Color():',       compiled_source)
+        self.assertIn('@simple_enumex(EnumEx, cache_str=True)\nclass Shape(ABC):', compiled_source)
+        compiled = {}
+        exec(compile(compiled_source, 'compile_trailing_module.py', 'exec'), compiled)
+        self.assertEqual(4,                                         compiled['Shape'].SQUARE.value)
+        self.assertListEqual(['RED'],                               compiled['Color']._member_names_)
+
+if __name__ == "__main__":
+    unittest.main()
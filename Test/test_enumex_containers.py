@@ -0,0 +1,306 @@
+# Add package directory to path for debugging
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import unittest
+import gc
+import pickle
+import weakref
+from array import array
+from enumex import *
+from enum import auto, STRICT, CONFORM, EJECT, KEEP
+from abc import ABC
+
+class Perm(IntFlagEx):
+    R = auto()
+    W = auto()
+    X = auto()
+
+class StrictPerm(FlagEx):
+    R = auto()
+    W = auto()
+    X = auto()
+
+class MorePerm(StrictPerm):
+    D = auto()
+
+class Color(EnumEx):
+    RED = auto()
+    GREEN = auto()
+    CRIMSON = 1
+
+class MoreColor(Color):
+    BLUE = auto()
+
+class FlagArrayTests(unittest.TestCase):
+
+    def test_specialization(self):
+        self.assertIs(FlagArray[Perm],                  FlagArray[Perm])
+        self.assertIsNot(FlagArray[StrictPerm],         FlagArray[MorePerm])
+        self.assertEqual('FlagArray[Perm]',             FlagArray[Perm].__name__)
+        with self.assertRaises(TypeError):
+            FlagArray()
+        with self.assertRaises(TypeError):
+            FlagArray[int]
+        with self.assertRaises(TypeError):
+            class A(EnumEx):
+                V1 = 1
+            FlagArray[A]
+
+    def test_sequence(self):
+        flags = FlagArray[Perm]([Perm.R, Perm.R | Perm.W, 4])
+        self.assertEqual(3,                             len(flags))
+        self.assertIs(Perm.R | Perm.W,                  flags[1])
+        self.assertIs(Perm.X,                           flags[-1])
+        self.assertListEqual([Perm.R, Perm.R | Perm.W, Perm.X], list(flags))
+        self.assertIn(Perm.X,                           flags)
+        self.assertNotIn(Perm.W,                        flags)
+        flags.append(Perm.W)
+        flags.insert(0, 0)
+        flags[1] = Perm.X
+        del flags[2]
+        self.assertListEqual([Perm(0), Perm.X, Perm.X, Perm.W], list(flags))
+        self.assertIsInstance(flags[1:],                FlagArray[Perm])
+        self.assertEqual(array('Q', [0, 4, 4, 2]),      flags.masks)
+        self.assertEqual(FlagArray[Perm]([4, 2]),       flags[2:])
+        self.assertEqual("FlagArray[Perm]([<Perm.X: 4>])", repr(flags[1:2]))
+
+    def test_operators(self):
+        flags = FlagArray[StrictPerm]([StrictPerm.R, StrictPerm.W | StrictPerm.X, StrictPerm(0)])
+        self.assertListEqual(
+                [StrictPerm.R | StrictPerm.X, StrictPerm.W | StrictPerm.X, StrictPerm.X],
+                list(flags | StrictPerm.X))
+        self.assertListEqual(
+                [StrictPerm(0), StrictPerm.W, StrictPerm(0)],
+                list(flags & StrictPerm.W))
+        self.assertListEqual(
+                [StrictPerm.W | StrictPerm.X, StrictPerm.R, StrictPerm.R | StrictPerm.W | StrictPerm.X],
+                list(~flags))
+        other = FlagArray[StrictPerm]([StrictPerm.W, StrictPerm.W, StrictPerm.R])
+        self.assertListEqual(
+                [StrictPerm.R | StrictPerm.W, StrictPerm.W | StrictPerm.X, StrictPerm.R],
+                list(flags | other))
+        self.assertListEqual([StrictPerm(0), StrictPerm.W, StrictPerm(0)], list(flags & other))
+        self.assertListEqual([StrictPerm.W | StrictPerm.X], list(flags.filter(StrictPerm.W)))
+        # The boundary still applies to values of the data type
+        with self.assertRaises(ValueError):
+            flags | 8
+        with self.assertRaises(TypeError):
+            flags | Perm.R
+        with self.assertRaises(ValueError):
+            flags | other[:1]
+        with self.assertRaises(TypeError):
+            flags | FlagArray[Perm]([1, 2, 3])
+
+    def test_no_pseudo_members(self):
+        # raw ints and ~ apply the boundary like the class, without caching pseudo-members
+        for boundary in (STRICT, CONFORM, EJECT, KEEP):
+            with self.subTest(boundary=boundary):
+                class Mode(IntFlagEx, boundary=boundary):
+                    R = 1
+                    W = 2
+                    X = 8
+                values = [0, 1, 3, 9, 11, 4, 20, -1, -3, -12]
+                expected_errors = set()
+                masks = FlagArray[Mode]()
+                for value in values:
+                    try:
+                        masks.append(value)
+                    except ValueError:
+                        expected_errors.add(value)
+                # members of a subclass are converted like their value
+                class MoreMode(Mode):
+                    D = 4
+                related = MoreMode.R | MoreMode.D
+                values.append(related._value_)
+                try:
+                    masks.append(related)
+                except ValueError:
+                    expected_errors.add(related._value_)
+                self.assertEqual(3,                     len(Mode._value2member_map_))
+                try:
+                    inverted = ~masks
+                except ValueError:
+                    inverted = None
+                self.assertEqual(3,                     len(Mode._value2member_map_))
+                for value in values:
+                    try:
+                        member = Mode(value)
+                    except ValueError:
+                        self.assertIn(value,            expected_errors)
+                        continue
+                    if not isinstance(member, Mode):
+                        # EJECT returns plain ints, which a FlagArray can't hold
+                        self.assertIn(value,            expected_errors)
+                        continue
+                    self.assertNotIn(value,             expected_errors)
+                expected = [~flag for flag in masks]
+                self.assertEqual(boundary is EJECT,     inverted is None)
+                if inverted is None:
+                    # EJECT inverts to plain ints when the flag has gaps, which the array rejects
+                    self.assertFalse(all(isinstance(flag, Mode) for flag in expected))
+                else:
+                    self.assertListEqual(expected,      list(inverted))
+
+    def test_buffer(self):
+        flags = FlagArray[Perm]([Perm.R, Perm.W | Perm.X])
+        view = memoryview(flags)
+        self.assertEqual('Q',                           view.format)
+        self.assertEqual(8,                             view.itemsize)
+        self.assertListEqual([1, 6],                    view.tolist())
+        flags[0] = Perm.X
+        self.assertEqual(4,                             view[0])
+        view.release()
+        flags.append(Perm.R)
+
+    def test_pickle(self):
+        flags = FlagArray[Perm]([Perm.R, Perm.W | Perm.X])
+        self.assertEqual(flags,                         pickle.loads(pickle.dumps(flags)))
+
+    def test_collected_with_enum_class(self):
+        class A(FlagEx):
+            F1 = auto()
+        flags = FlagArray[A]([A.F1])
+        ref = weakref.ref(A)
+        del A, flags
+        gc.collect()
+        self.assertIsNone(ref())
+
+class EnumExMapTests(unittest.TestCase):
+
+    def test_ordinals(self):
+        self.assertTupleEqual((Color.RED, Color.GREEN),             Color._members_by_ordinal_)
+        self.assertTupleEqual((0, 1, 2),                            tuple(m._ordinal_ for m in MoreColor))
+        self.assertEqual(Color.GREEN._ordinal_,                     MoreColor.GREEN._ordinal_)
+        self.assertEqual(0,                                         Color.CRIMSON._ordinal_)
+        self.assertEqual(MorePerm.D._ordinal_,                      3)
+
+    def test_mapping(self):
+        counts = EnumExMap[MoreColor]()
+        self.assertIs(EnumExMap[MoreColor],                         type(counts))
+        self.assertEqual(0,                                         len(counts))
+        counts[MoreColor.BLUE] = 3
+        counts[MoreColor.RED] = 1
+        counts[MoreColor.CRIMSON] += 1
+        self.assertListEqual([MoreColor.RED, MoreColor.BLUE],       list(counts))
+        self.assertListEqual([2, 3],                                list(counts.values()))
+        self.assertEqual(2,                                         len(counts))
+        self.assertIn(MoreColor.RED,                                counts)
+        self.assertNotIn(MoreColor.GREEN,                           counts)
+        self.assertIsNone(counts.get(MoreColor.GREEN))
+        self.assertEqual(3,                                         counts.pop(MoreColor.BLUE))
+        with self.assertRaises(KeyError):
+            counts[MoreColor.GREEN]
+        with self.assertRaises(KeyError):
+            del counts[MoreColor.GREEN]
+        self.assertEqual({MoreColor.RED: 2},                        counts)
+        counts.clear()
+        self.assertEqual(0,                                         len(counts))
+        with self.assertRaises(TypeError):
+            EnumExMap()
+        with self.assertRaises(TypeError):
+            EnumExMap[int]
+
+    def test_inherited_members(self):
+        counts = EnumExMap[MoreColor]({Color.RED: 1})
+        self.assertEqual(1,                                         counts[MoreColor.RED])
+        self.assertEqual(1,                                         counts[Color.CRIMSON])
+        colors = EnumExMap[Color]({MoreColor.GREEN: 2})
+        self.assertEqual(2,                                         colors[Color.GREEN])
+        with self.assertRaises(KeyError):
+            colors[MoreColor.BLUE]
+        with self.assertRaises(KeyError):
+            counts[Perm.R]
+        with self.assertRaises(KeyError):
+            counts['RED']
+        # Members aren't copied from a base which isn't first
+        class Other(ABC, Color):
+            YELLOW = auto()
+        with self.assertRaises(KeyError):
+            EnumExMap[Other]()[Color.RED]
+        with self.assertRaises(KeyError):
+            EnumExMap[Perm]()[Perm.R | Perm.W]
+
+    def test_fill_copy(self):
+        counts = EnumExMap[MoreColor]()
+        counts.fill(0)
+        self.assertDictEqual(dict.fromkeys(MoreColor, 0),           dict(counts))
+        copy = counts.copy()
+        copy[MoreColor.RED] = 1
+        self.assertEqual(0,                                         counts[MoreColor.RED])
+        self.assertNotEqual(counts,                                 copy)
+        self.assertEqual(copy,                                      pickle.loads(pickle.dumps(copy)))
+        self.assertEqual(
+                "EnumExMap[MoreColor]({<MoreColor.RED: 1>: 1, <MoreColor.GREEN: 2>: 0, <MoreColor.BLUE: 3>: 0})",
+                repr(copy),
+                )
+
+class EnumExSetTests(unittest.TestCase):
+
+    def test_set(self):
+        colors = EnumExSet[MoreColor]([MoreColor.BLUE, MoreColor.RED])
+        self.assertIs(EnumExSet[MoreColor],                         type(colors))
+        self.assertListEqual([MoreColor.RED, MoreColor.BLUE],       list(colors))
+        self.assertEqual(0b101,                                     colors.bits)
+        self.assertEqual(2,                                         len(colors))
+        self.assertIn(MoreColor.CRIMSON,                            colors)
+        self.assertNotIn(MoreColor.GREEN,                           colors)
+        self.assertNotIn('RED',                                     colors)
+        colors.add(MoreColor.GREEN)
+        colors.discard(MoreColor.RED)
+        colors.discard(Perm.R)
+        self.assertListEqual([MoreColor.GREEN, MoreColor.BLUE],     list(colors))
+        colors.remove(MoreColor.GREEN)
+        with self.assertRaises(KeyError):
+            colors.remove(MoreColor.GREEN)
+        with self.assertRaises(KeyError):
+            colors.add(Perm.R)
+        colors.clear()
+        self.assertFalse(colors)
+        with self.assertRaises(TypeError):
+            EnumExSet()
+
+    def test_operators(self):
+        Set = EnumExSet[MoreColor]
+        red_green = Set([MoreColor.RED, MoreColor.GREEN])
+        green_blue = Set([MoreColor.GREEN, MoreColor.BLUE])
+        self.assertEqual(Set(MoreColor),                            red_green | green_blue)
+        self.assertEqual(Set([MoreColor.GREEN]),                    red_green & green_blue)
+        self.assertEqual(Set([MoreColor.RED]),                      red_green - green_blue)
+        self.assertEqual(Set([MoreColor.RED, MoreColor.BLUE]),      red_green ^ green_blue)
+        self.assertEqual(Set([MoreColor.BLUE]),                     ~red_green)
+        self.assertEqual(Set([MoreColor.GREEN]),                    red_green & [MoreColor.GREEN, Perm.R])
+        self.assertEqual(red_green,                                 {MoreColor.RED, MoreColor.GREEN})
+        self.assertTrue(Set([MoreColor.RED]) < red_green)
+        self.assertTrue(red_green >= red_green)
+        self.assertFalse(red_green <= green_blue)
+        self.assertTrue(Set([MoreColor.RED]).isdisjoint(green_blue))
+        with self.assertRaises(KeyError):
+            red_green | [Perm.R]
+        colors = red_green.copy()
+        colors |= green_blue
+        colors -= [MoreColor.RED]
+        self.assertEqual(green_blue,                                colors)
+        self.assertNotEqual(green_blue,                             red_green)
+
+    def test_inherited_members(self):
+        base = EnumExSet[Color]([Color.GREEN])
+        derived = EnumExSet[MoreColor]([MoreColor.RED, MoreColor.BLUE])
+        self.assertEqual(EnumExSet[MoreColor](MoreColor),           derived | base)
+        self.assertEqual(EnumExSet[Color](Color),                   base | (derived - [MoreColor.BLUE]))
+        self.assertEqual(EnumExSet[Color]([Color.RED]),             EnumExSet[Color](Color) & derived)
+        with self.assertRaises(KeyError):
+            base | derived
+        self.assertIn(Color.RED,                                    derived)
+
+    def test_pickle(self):
+        colors = EnumExSet[MoreColor]([MoreColor.BLUE, MoreColor.RED])
+        self.assertEqual(colors,                                    pickle.loads(pickle.dumps(colors)))
+        self.assertEqual(
+                "EnumExSet[MoreColor]([<MoreColor.RED: 1>, <MoreColor.BLUE: 3>])",
+                repr(colors),
+                )
+
+if __name__ == "__main__":
+    unittest.main()
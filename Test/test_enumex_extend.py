@@ -0,0 +1,239 @@
+# Add package directory to path for debugging
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import unittest
+import gc
+import pickle
+from abc import ABC, abstractmethod
+from enum import auto, KEEP, UNIQUE, CONTINUOUS
+from enumex import *
+
+class Feature(IntEnumEx, extensible=True):
+    SEARCH = 1
+    EXPORT = 2
+
+class MoreFeature(Feature):
+    IMPORT = 3
+
+class Shape(ABC, EnumEx, extensible=True):
+    SQUARE = 4
+
+    @abstractmethod
+    def sides(self):
+        pass
+
+class ConcreteShape(Shape):
+
+    def sides(self):
+        return self.value
+
+class Closed(EnumEx):
+    ONE = 1
+
+class EnumExExtendTests(unittest.TestCase):
+
+    def _features(self):
+        class Base(IntEnumEx, extensible=True):
+            SEARCH = 1
+            EXPORT = 2
+
+        class Sub(Base):
+
+            def describe(self):
+                return self.name.lower()
+
+        class SubSub(Sub):
+            pass
+        return Base, Sub, SubSub
+
+    def test_members(self):
+        Base, Sub, SubSub = self._features()
+        Base.extend(SHARE=auto(), PRINT=10, COPY=2)
+        for cls in (Base, Sub, SubSub):
+            with self.subTest(cls=cls.__name__):
+                self.assertIsInstance(cls.SHARE,                    cls)
+                self.assertEqual(3,                                 cls.SHARE.value)
+                self.assertIs(cls.PRINT,                            cls(10))
+                self.assertIs(cls.EXPORT,                           cls.COPY)
+                self.assertIs(cls.SHARE,                            cls['SHARE'])
+                self.assertIn('PRINT',                              cls.__members__)
+                self.assertIn(10,                                   cls)
+                self.assertIn(10,                                   cls._hashable_values_)
+                self.assertListEqual(['SEARCH', 'EXPORT', 'SHARE', 'PRINT'], cls._member_names_)
+        self.assertEqual('share',                                   SubSub.SHARE.describe())
+        self.assertIs(Base.SHARE,                                   Base(3))
+        self.assertEqual(1,                                         Sub._hashable_values_.count(2))
+        self.assertListEqual([Base.SEARCH, Base.EXPORT, Base.SHARE, Base.PRINT], list(Base))
+        self.assertEqual(4,                                         len(Base))
+        # subclasses created after inherit the new members
+        class Later(Base):
+            LAST = 11
+        self.assertListEqual(['SEARCH', 'EXPORT', 'SHARE', 'PRINT', 'LAST'], Later._member_names_)
+
+    def test_ordinals(self):
+        Base, Sub, SubSub = self._features()
+        Base.extend(SHARE=4)
+        for cls in (Base, Sub, SubSub):
+            self.assertEqual(2,                                     cls.SHARE.ordinal)
+            self.assertTupleEqual(tuple(cls),                       cls._members_by_ordinal_)
+        members = EnumExSet[Sub]([Base.SHARE, SubSub.SEARCH])
+        self.assertSetEqual({Sub.SHARE, Sub.SEARCH},                set(members))
+        self.assertSetEqual({Sub.EXPORT},                           set(~members))
+        # inherited members keep the ordinal of the parent's member
+        class Level(OrderedEnumEx, extensible=True):
+            LOW = 1
+        class MoreLevel(Level):
+            pass
+        Level.extend(HIGH=2)
+        self.assertTrue(MoreLevel.LOW < Level.HIGH)
+        self.assertFalse(Level.HIGH <= MoreLevel.LOW)
+        self.assertTrue(Level.HIGH >= MoreLevel.HIGH)
+
+    def test_subclass_members(self):
+        # the ordinals after the inherited members are taken by the members of the subclass
+        Base, Sub, SubSub = self._features()
+        class Own(Base):
+            IMPORT = 3
+        with self.assertRaises(TypeError):
+            Base.extend(SHARE=4)
+        for cls in (Base, Sub, SubSub, Own):
+            self.assertNotIn('SHARE',                               cls.__members__)
+        # a class whose subclasses don't define members can still be extended
+        Own.extend(SHARE=4)
+        self.assertEqual(3,                                         Own.SHARE.ordinal)
+        self.assertIs(Own.SHARE,                                    Base.resolve(4))
+
+    def test_containers_created_before(self):
+        Base, Sub, SubSub = self._features()
+        counts = EnumExMap[Base]({Base.SEARCH: 1})
+        members = EnumExSet[Base]([Base.EXPORT])
+        Base.extend(SHARE=4)
+        self.assertNotIn(Base.SHARE,                                counts)
+        self.assertIsNone(counts.get(Base.SHARE))
+        with self.assertRaises(KeyError):
+            counts[Base.SHARE]
+        counts[Base.SHARE] = 2
+        self.assertDictEqual({Base.SEARCH: 1, Base.SHARE: 2},       dict(counts))
+        counts.fill(0)
+        self.assertEqual(3,                                         len(counts))
+        self.assertSetEqual({Base.SEARCH, Base.SHARE},              set(~members))
+
+    def test_flags(self):
+        class Perm(FlagEx, boundary=KEEP, extensible=True):
+            R = 4
+            W = 2
+
+        class MorePerm(Perm):
+            pass
+        pseudo = Perm(6)
+        inverted = ~Perm.R
+        kept = Perm(9)
+        Perm.extend(D=auto(), E=1, NOT_W=-3, RD=12)
+        self.assertEqual(8,                                         Perm.D.value)
+        self.assertEqual(13,                                        Perm.NOT_W.value)
+        self.assertEqual(15,                                        Perm._flag_mask_)
+        self.assertEqual(15,                                        Perm._singles_mask_)
+        self.assertEqual(15,                                        Perm._all_bits_)
+        self.assertIs(Perm.R | Perm.D,                              Perm.RD)
+        self.assertIn(8,                                            Perm._hashable_values_)
+        # pseudo-members and inversions are recreated
+        self.assertIsNot(pseudo,                                    Perm(6))
+        self.assertIs(Perm.R | Perm.W,                              Perm(6))
+        self.assertEqual(Perm.W | Perm.D | Perm.E,                  ~Perm.R)
+        self.assertNotEqual(inverted,                               ~Perm.R)
+        self.assertEqual('Perm.D|E',                                str(Perm(9)))
+        self.assertNotEqual(str(kept),                              str(Perm(9)))
+        # single bits smaller than the existing ones are iterated in definition order
+        self.assertListEqual([Perm.R, Perm.W, Perm.D, Perm.E],      list(Perm))
+        self.assertListEqual([Perm.R, Perm.D],                      list(Perm.RD))
+        self.assertIs(Perm.NOT_W,                                   Perm.union([Perm.RD, Perm.E]))
+        self.assertEqual(15,                                        MorePerm._flag_mask_)
+        self.assertIs(MorePerm.D,                                   MorePerm(8))
+        self.assertEqual(13,                                        MorePerm.NOT_W.value)
+        self.assertEqual(MorePerm.R | MorePerm.D,                   MorePerm.RD)
+
+    def test_lookup_and_resolve(self):
+        Base, Sub, SubSub = self._features()
+        self.assertIs(Base.SEARCH,                                  Base.lookup('search'))
+        Base.extend(SHARE=4)
+        self.assertIs(Base.SHARE,                                   Base.lookup('share'))
+        self.assertIs(Sub.SHARE,                                    Sub.lookup('4'))
+        self.assertIs(Base.SHARE,                                   Base.resolve(4))
+        self.assertIs(Sub.SHARE,                                    Sub.resolve(4))
+        self.assertTupleEqual((Base, ),                             Base.resolve_name('SHARE'))
+        MoreFeature.extend(ZIP=10)
+        self.assertIs(MoreFeature.ZIP,                              Feature.resolve(10))
+        self.assertIn(MoreFeature,                                  Feature.resolve_name('ZIP'))
+        with self.assertRaises(ValueError):
+            Feature(10)
+
+    def test_released(self):
+        Base, Sub, SubSub = self._features()
+        Sub.extend(ZIP=10)
+        self.assertIs(Sub.ZIP,                                      Base.resolve(10))
+        self.assertIs(SubSub.ZIP,                                   SubSub.resolve(10))
+        del Sub, SubSub
+        gc.collect()
+        with self.assertRaises(ValueError):
+            Base.resolve(10)
+        self.assertTupleEqual((),                                   Base.resolve_name('ZIP'))
+
+    def test_verify(self):
+        Base, Sub, SubSub = self._features()
+        verify(UNIQUE, CONTINUOUS)(Sub)
+        Base.extend(SHARE=5)
+        with self.assertRaises(ValueError):
+            verify(CONTINUOUS)(Sub)
+        verify(UNIQUE)(SubSub)
+        Base.extend(COPY=3, PASTE=4)
+        verify(CONTINUOUS)(Sub)
+        Base.extend(CUT=4)
+        with self.assertRaises(ValueError):
+            unique(Base)
+        with self.assertRaises(ValueError):
+            unique(SubSub)
+
+    def test_abstract(self):
+        Shape.extend(PENTAGON=5)
+        self.assertEqual(5,                                         ConcreteShape.PENTAGON.sides())
+        self.assertIsInstance(Shape.PENTAGON,                       Shape)
+        with self.assertRaises(TypeError):
+            Shape.PENTAGON.sides()
+
+    def test_pickle(self):
+        MoreFeature.extend(PICKLED=20)
+        self.assertIs(MoreFeature.PICKLED,                          pickle.loads(pickle.dumps(MoreFeature.PICKLED)))
+
+    def test_errors(self):
+        Base, Sub, SubSub = self._features()
+        with self.assertRaises(TypeError):
+            Closed.extend(TWO=2)
+        with self.assertRaises(TypeError):
+            Base.extend(SEARCH=4)
+        with self.assertRaises(TypeError):
+            Sub.extend(describe=4)
+        with self.assertRaises(TypeError):
+            Shape.extend(sides=4)
+        with self.assertRaises(TypeError):
+            Feature.extend(SHARE=4)
+        with self.assertRaises(ValueError):
+            Base.extend(_sunder_=4)
+        class Fixed(Base, extensible=False):
+            pass
+        with self.assertRaises(TypeError):
+            Base.extend(SHARE=4)
+        self.assertNotIn('SHARE',                                   Base.__members__)
+        self.assertNotIn('SHARE',                                   Sub.__members__)
+        self.assertFalse(Fixed._extensible_)
+        self.assertTrue(Sub._extensible_)
+
+    def test_simple_enumex(self):
+        Simple = simple_enumex(FlagEx, extensible=True)(type('Simple', (), {'A': 1}))
+        Simple.extend(B=auto())
+        self.assertEqual(2,                                         Simple.B.value)
+        self.assertEqual(3,                                         Simple._flag_mask_)
+
+if __name__ == "__main__":
+    unittest.main()
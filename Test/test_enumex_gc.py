@@ -0,0 +1,158 @@
+# Add package directory to path for debugging
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import unittest
+import gc
+import os
+import weakref
+from abc import ABC, abstractmethod
+from enum import auto, KEEP, UNIQUE, CONTINUOUS
+from enumex import *
+from enumex import instrumentation
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+class Base(ABC, EnumEx):
+    A = 1
+
+    @abstractmethod
+    def method(self):
+        pass
+
+    @property
+    @abstractmethod
+    def prop(self):
+        pass
+
+class Perm(FlagEx, boundary=KEEP):
+    R = auto()
+    W = auto()
+
+def _abstract_class(index):
+    class Tenant(Base):
+        B = index + 2
+
+        def method(self):
+            return self.name
+
+        @property
+        def prop(self):
+            return self.value
+    Tenant.B.method()
+    Tenant.B.prop
+    Base.resolve(index + 2)
+    Base.resolve_name('B')
+    return Tenant
+
+def _flag_class(index):
+    class TenantPerm(Perm, cache_str=True, pseudo_cache_size=2):
+        X = auto()
+    str(TenantPerm.X)
+    repr(TenantPerm.R | TenantPerm.X)
+    TenantPerm(index | 64)
+    TenantPerm.union([TenantPerm.R, TenantPerm.X])
+    list(TenantPerm(7))
+    return TenantPerm
+
+def _indexed_class(index):
+    class Tenant(IntEnumEx):
+        ONE = 1
+        TWO = 2
+    Tenant.register_alias('first', Tenant.ONE)
+    Tenant.lookup('FIRST')
+    Tenant.lookup('2')
+    EnumExMap[Tenant]({Tenant.ONE: index})
+    EnumExSet[Tenant]([Tenant.TWO])
+    verify(UNIQUE, CONTINUOUS)(Tenant)
+    return Tenant
+
+def _final_class(index):
+    class Tenant(StrEnumEx, final=True):
+        NAME = auto()
+    format(Tenant.NAME)
+    return Tenant
+
+def _simple_class(index):
+    Tenant = simple_enumex(Base)(type('Tenant', (), {
+            'C': index + 2,
+            'method': lambda self: self.name,
+            'prop': property(lambda self: self.value),
+            }))
+    Tenant.C.method()
+    return Tenant
+
+FACTORIES = (_abstract_class, _flag_class, _indexed_class, _final_class, _simple_class)
+
+class EnumExGCTests(unittest.TestCase):
+
+    def test_collectable(self):
+        for factory in FACTORIES:
+            with self.subTest(factory=factory.__name__):
+                ref = weakref.ref(factory(0))
+                gc.collect()
+                self.assertIsNone(ref())
+
+    def test_collectable_instrumented(self):
+        instrumentation.enable()
+        try:
+            refs = [weakref.ref(factory(0)) for factory in FACTORIES]
+            gc.collect()
+            self.assertListEqual([None] * len(refs), [ref() for ref in refs])
+        finally:
+            instrumentation.disable()
+            instrumentation.reset()
+
+    def test_indexes_released(self):
+        values, names = dict(Base._value2class_map_), dict(Base._name2classes_map_)
+        classes = [_abstract_class(index) for index in range(10)] + [_simple_class(10)]
+        self.assertEqual(len(values) + 11,                          len(Base._value2class_map_))
+        self.assertEqual(10,                                        len(Base.resolve_name('B')))
+        del classes
+        gc.collect()
+        self.assertDictEqual(values,                                Base._value2class_map_)
+        self.assertDictEqual(names,                                 Base._name2classes_map_)
+        self.assertListEqual([],                                    type.__subclasses__(Base))
+        with self.assertRaises(ValueError):
+            Base.resolve(2)
+
+    def test_abstract_wrappers(self):
+        # Subclasses wrap the original methods rather than the inherited wrappers
+        Tenant = _abstract_class(0)
+        for name, original in (
+                ('__getattribute__', '_original_getattribute_'),
+                ('__setattr__', '_original_setattribute_'),
+                ('__delattr__', '_original__delattr__'),
+            ):
+            with self.subTest(name=name):
+                wrapper, base_wrapper = Tenant.__dict__[name], Base.__dict__[name]
+                self.assertIsNot(wrapper,                           base_wrapper)
+                self.assertIs(getattr(base_wrapper, original),      getattr(wrapper, original))
+                self.assertFalse(hasattr(getattr(wrapper, original), original))
+
+    @unittest.skipIf(resource is None, "requires the resource module")
+    @unittest.skipUnless(os.environ.get('ENUMEX_SLOW_TESTS'), "set ENUMEX_SLOW_TESTS=1 to run")
+    def test_bounded_rss(self):
+        # Creates and drops 100k classes, the peak RSS mustn't grow after the first batch
+        batch = 10_000
+        def create(start):
+            for index in range(start, start + batch):
+                FACTORIES[index % len(FACTORIES)](index)
+            gc.collect()
+        scale = 1 if sys.platform == 'darwin' else 1024
+        create(0)
+        warm = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+        for start in range(batch, 100_000, batch):
+            create(start)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+        self.assertLess(peak - warm,                                16 * 1024 * 1024)
+        self.assertListEqual([],                                    gc.garbage)
+        self.assertListEqual([],                                    type.__subclasses__(Base))
+        self.assertListEqual([],                                    type.__subclasses__(Perm))
+
+if __name__ == "__main__":
+    unittest.main()
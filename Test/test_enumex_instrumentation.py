@@ -0,0 +1,99 @@
+# Add package directory to path for debugging
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import unittest
+from enumex import *
+from enumex import instrumentation
+from enum import auto, EnumMeta
+from abc import ABC, abstractmethod
+
+class EnumExInstrumentationTests(unittest.TestCase):
+
+    def setUp(self):
+        instrumentation.reset()
+        instrumentation.enable()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_counters(self):
+        class A(FlagEx):
+            F1 = auto()
+            F2 = auto()
+        class B(A):
+            F3 = auto()
+
+        name = f"{B.__module__}.{B.__qualname__}"
+        instrumentation.reset()
+
+        B(1)
+        B(1)
+        B['F2']
+        v = B.F1 | B.F3
+        v = B.F1 | B.F3
+
+        counters = instrumentation.snapshot()[name]
+        self.assertEqual(4,                 counters['value_lookups'])
+        self.assertEqual(1,                 counters['name_lookups'])
+        self.assertGreaterEqual(counters['flag_get_value'], 2)
+        self.assertEqual(1,                 counters['pseudo_members'])
+        self.assertGreater(counters['type_getattribute'], 0)
+        self.assertEqual(0,                 counters['abstract_wrappers'])
+
+    def test_pseudo_evictions(self):
+        class A(IntFlagEx, pseudo_cache_size=2):
+            F1 = auto()
+
+        name = f"{A.__module__}.{A.__qualname__}"
+        for value in range(2, 7):
+            A(value)
+        A(1)
+
+        counters = instrumentation.snapshot()[name]
+        self.assertEqual(5,                 counters['pseudo_members'])
+        self.assertEqual(3,                 counters['pseudo_evictions'])
+
+    def test_abstract_wrappers(self):
+        class A(ABC, EnumEx):
+            V1 = auto()
+
+            @abstractmethod
+            def method(self):
+                pass
+
+        name = f"{A.__module__}.{A.__qualname__}"
+        instrumentation.reset()
+
+        with self.assertRaises(TypeError):
+            A.V1.method()
+        with self.assertRaises(TypeError):
+            A.method()
+
+        self.assertEqual(2,                 instrumentation.snapshot()[name]['abstract_wrappers'])
+
+    def test_disabled(self):
+        class A(EnumEx):
+            V1 = auto()
+
+        instrumentation.disable()
+        instrumentation.reset()
+        self.assertFalse(instrumentation.is_enabled())
+
+        A(1)
+        A['V1']
+        self.assertDictEqual({},            instrumentation.snapshot())
+        self.assertIs(type(A).__getitem__,  EnumMeta.__getitem__)
+
+        instrumentation.enable()
+        self.assertTrue(instrumentation.is_enabled())
+        A(1)
+        A['V1']
+        counters = instrumentation.snapshot()[f"{A.__module__}.{A.__qualname__}"]
+        self.assertEqual(1,                 counters['value_lookups'])
+        self.assertEqual(1,                 counters['name_lookups'])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+# Add package directory to path for debugging
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import unittest
+import io
+import types
+from enumex import *
+from enumex import memory
+from enum import auto
+
+class Color(EnumEx):
+    RED = auto()
+    GREEN = auto()
+    CRIMSON = 1
+
+class MoreColor(Color):
+    BLUE = auto()
+
+class Perm(FlagEx):
+    R = auto()
+    W = auto()
+    X = auto()
+
+class MemoryReportTests(unittest.TestCase):
+
+    def test_class(self):
+        records = {record['qualname']: record for record in memory_report(Color)}
+        self.assertListEqual(['Color', 'MoreColor'],            list(records))
+        color, more = records['Color'], records['MoreColor']
+        self.assertEqual(2,                                     color['members'])
+        self.assertEqual(0,                                     color['inherited'])
+        self.assertEqual(0,                                     color['inherited_bytes'])
+        self.assertEqual(3,                                     more['members'])
+        self.assertEqual(2,                                     more['inherited'])
+        self.assertGreater(more['inherited_bytes'],             0)
+        self.assertLess(more['inherited_bytes'],                more['class_bytes'] + more['member_bytes'])
+        for record in records.values():
+            self.assertFalse(record['flag'])
+            self.assertEqual(
+                    record['class_bytes'] + record['member_bytes'] + record['pseudo_bytes'],
+                    record['total'],
+                    )
+
+    def test_pseudo_members(self):
+        class P(Perm):
+            D = auto()
+        before, = memory_report(P)
+        self.assertTrue(before['flag'])
+        P(3)
+        P(13)
+        after, = memory_report(P)
+        self.assertEqual(before['pseudo_members'] + 2,          after['pseudo_members'])
+        self.assertGreater(after['pseudo_bytes'],               before['pseudo_bytes'])
+        self.assertEqual(before['members'],                     after['members'])
+
+    def test_module(self):
+        module = types.ModuleType('memory_report_module')
+        module.Color = Color
+        exec("from enumex import IntEnumEx\nclass Local(IntEnumEx):\n    ONE = 1", vars(module))
+        self.assertListEqual(['Local'],                         [r['qualname'] for r in memory_report(module)])
+        with self.assertRaises(TypeError):
+            memory_report(1)
+
+    def test_print(self):
+        file = io.StringIO()
+        memory.print_memory_report(Color, file=file)
+        lines = file.getvalue().splitlines()
+        self.assertEqual(4,                                     len(lines))
+        self.assertTrue(lines[-1].startswith('total'))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -43,6 +43,9 @@ class StrEnumExB(StrEnumExA):
     V3 = auto()
     V4 = auto()
 
+class FlagExFinal(FlagExA, final=True):
+    V3 = auto()
+
 class EnumExPickleTests(unittest.TestCase):
 
     def test_pickle_enumex_member(self):
@@ -65,6 +68,10 @@ class EnumExPickleTests(unittest.TestCase):
         _test_pickle_member(self, StrEnumExA.V1)
         _test_pickle_member(self, StrEnumExB.V1)
 
+    def test_pickle_final_member(self):
+        _test_pickle_member(self, FlagExFinal.V3)
+        _test_pickle_member(self, FlagExFinal.V1 | FlagExFinal.V3)
+
     def test_pickle_enumex_types(self):
         def test_pickle_type(enum_type:type[EnumEx]):
             self.assertTrue(issubclass(enum_type, EnumEx), msg=f"Type to pickle is EnumEx subclass")
@@ -84,6 +91,7 @@ class EnumExPickleTests(unittest.TestCase):
         test_pickle_type(IntFlagExB)
         test_pickle_type(StrEnumExA)
         test_pickle_type(StrEnumExB)
+        test_pickle_type(FlagExFinal)
 
 
 def _test_pickle_member(case:unittest.TestCase, enum_member:EnumEx, msg:str = None):
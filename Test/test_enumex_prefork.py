@@ -0,0 +1,86 @@
+# Add package directory to path for debugging
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import unittest
+import gc
+import os
+from abc import ABC, abstractmethod
+from enum import auto
+from enumex import *
+from enumex import warming
+
+class Color(StrEnumEx, cache_str=True):
+    RED = auto()
+    GREEN = auto()
+
+class Perm(FlagEx):
+    R = auto()
+    W = auto()
+    X = auto()
+
+class Shape(ABC, EnumEx, cache_str=True):
+    SQUARE = 4
+
+    @abstractmethod
+    def sides(self):
+        pass
+
+class PreforkTests(unittest.TestCase):
+
+    def tearDown(self):
+        gc.unfreeze()
+
+    def test_classes(self):
+        classes = warming._classes([EnumEx])
+        for cls in (Color, Perm, Shape):
+            self.assertIn(cls,                                      classes)
+        for cls in (EnumEx, FlagEx, IntFlagEx, StrEnumEx):
+            self.assertNotIn(cls,                                   classes)
+
+    def test_warm(self):
+        class Mode(FlagEx):
+            R = auto()
+            W = auto()
+            X = auto()
+            D = auto()
+        self.assertLessEqual(len(warming._classes([EnumEx])),        prefork_freeze(freeze=False))
+        self.assertEqual(0,                                         gc.get_freeze_count())
+        for cls in (Color, Perm, Shape):
+            self.assertIsNotNone(cls.__dict__.get('_lookup_indexes_'))
+        self.assertTupleEqual((Perm.R, Perm.W, Perm.X),             Perm.__dict__['_bit_members_'])
+        # inversions only, no composites of 2 bits by default
+        self.assertIs(Mode.W | Mode.X | Mode.D,                     ~Mode.R)
+        self.assertNotIn(3,                                         Mode._value2member_map_)
+        # str() of StrEnumEx is str.__str__, which isn't cached
+        self.assertIn('_cached__repr__',                            Color.RED.__dict__)
+        self.assertIn('_cached__str__',                             Shape.SQUARE.__dict__)
+        self.assertIn('_cached__repr__',                            Shape.SQUARE.__dict__)
+
+    def test_freeze(self):
+        prefork_freeze()
+        self.assertGreater(gc.get_freeze_count(),                   0)
+        self.assertIs(Color.GREEN,                                  Color.lookup('Green'))
+
+    @unittest.skipUnless(hasattr(os, 'fork'), "requires os.fork")
+    def test_fork(self):
+        prefork_freeze()
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.close(read)
+                gc.collect()
+                result = f"{Perm.R | Perm.W}|{Color.lookup('red')}|{Shape.resolve(4).name}"
+                os.write(write, result.encode())
+            finally:
+                os._exit(0)
+        os.close(write)
+        with os.fdopen(read) as file:
+            result = file.read()
+        os.waitpid(pid, 0)
+        self.assertEqual('Perm.R|W|red|SQUARE',                     result)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+# Add package directory to path for debugging
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import unittest
+import concurrent.futures
+from abc import ABC, abstractmethod
+from enum import auto
+from enumex import *
+from enumex import warming
+
+class Perm(FlagEx, cache_str=True):
+    R = auto()
+    W = auto()
+    X = auto()
+
+class Color(StrEnumEx, cache_str=True):
+    RED = auto()
+    GREEN = auto()
+
+class AbstractPerm(ABC, FlagEx):
+    R = auto()
+    W = auto()
+
+    @abstractmethod
+    def check(self):
+        pass
+
+class EnumExPrewarmTests(unittest.TestCase):
+
+    def test_timings(self):
+        timings = prewarm([Color, AbstractPerm])
+        self.assertSetEqual({Color, AbstractPerm},                  set(timings))
+        for seconds in timings.values():
+            self.assertGreaterEqual(seconds,                        0)
+
+    def test_lookup_indexes(self):
+        class Size(IntEnumEx):
+            SMALL = 1
+            LARGE = 2
+        self.assertIsNone(Size.__dict__.get('_lookup_indexes_'))
+        prewarm(Size)
+        self.assertIsNotNone(Size.__dict__.get('_lookup_indexes_'))
+        self.assertIs(Size.LARGE,                                   Size.lookup('large'))
+
+    def test_flags(self):
+        class Mode(Perm):
+            D = auto()
+        prewarm(Mode, flags_up_to_bits=3)
+        self.assertTupleEqual((Mode.R, Mode.W, Mode.X, Mode.D),     Mode.__dict__['_bit_members_'])
+        # 6 pairs and 4 triples of the 4 bits
+        self.assertEqual(4 + 6 + 4,                                 len(Mode._value2member_map_))
+        self.assertIs(Mode.R | Mode.W | Mode.D,                     Mode(11))
+        self.assertIn('_cached__str__',                             Mode(11).__dict__)
+        self.assertIn('_cached__repr__',                            Mode.D.__dict__)
+        self.assertIn('_inverted_',                                 Mode.R.__dict__)
+        self.assertIs(~Mode.R,                                      Mode.W | Mode.X | Mode.D)
+
+    def test_no_composites(self):
+        values = [1 << bit for bit in range(64)]
+        Wide = simple_enumex(FlagEx)(type('Wide', (), {f"F{bit}": value for bit, value in enumerate(values)}))
+        prewarm(Wide)
+        self.assertIsNotNone(Wide.__dict__['_bit_members_'])
+        # the members and their inversions, but no composites by default
+        self.assertNotIn(1 | 2,                                     Wide._value2member_map_)
+        self.assertLessEqual(len(Wide._value2member_map_),          3 * 64)
+
+    def test_pseudo_cache_size(self):
+        class Mode(FlagEx, pseudo_cache_size=2):
+            R = auto()
+            W = auto()
+            X = auto()
+        prewarm(Mode, flags_up_to_bits=2)
+        self.assertEqual(3 + 2,                                     len(Mode._value2member_map_))
+        self.assertNotIn('_inverted_',                              Mode.R.__dict__)
+        prewarm(Mode, flags_up_to_bits=1)
+        self.assertEqual(3 + 2,                                     len(Mode._value2member_map_))
+
+    def test_abstract(self):
+        timings = prewarm(AbstractPerm)
+        self.assertIn(AbstractPerm,                                 timings)
+        self.assertEqual(2,                                         len(AbstractPerm._value2member_map_))
+
+    def test_module(self):
+        classes = set(prewarm(sys.modules[__name__]))
+        self.assertTrue({Perm, Color, AbstractPerm} <= classes)
+        for cls in (EnumEx, FlagEx, StrEnumEx):
+            self.assertNotIn(cls,                                   classes)
+        self.assertTrue({Perm, Color, AbstractPerm} <= set(warming._classes([EnumEx])))
+
+    def test_background(self):
+        class Mode(FlagEx):
+            R = auto()
+            W = auto()
+        future = prewarm(Mode, background=True)
+        self.assertIsInstance(future,                               concurrent.futures.Future)
+        self.assertListEqual([Mode],                                list(future.result(timeout=10)))
+        self.assertIs(Mode.R | Mode.W,                              Mode(3))
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            prewarm(int)
+        with self.assertRaises(TypeError):
+            prewarm([Perm, 'Color'])
+
+if __name__ == "__main__":
+    unittest.main()
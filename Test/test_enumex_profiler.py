@@ -0,0 +1,108 @@
+# Add package directory to path for debugging
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import unittest
+import tempfile
+import os
+from enumex import *
+from enumex import profiler
+from enum import auto, Enum
+
+class EnumExProfilerTests(unittest.TestCase):
+
+    def setUp(self):
+        profiler.reset()
+
+    def tearDown(self):
+        profiler.stop()
+        profiler.reset()
+
+    def test_stats(self):
+        with profiler.profile():
+            self.assertTrue(profiler.is_running())
+            class A(IntFlagEx):
+                F1 = auto()
+                F2 = auto()
+
+            A(1)
+            A['F2']
+            v = A.F1 | A.F2
+            v = A.F1.value
+            Enum('Plain', 'X')['X']
+
+        self.assertFalse(profiler.is_running())
+        stats = profiler.stats()
+        self.assertNotIn('value_lookup',    stats.get('<unknown>', {}))  # Plain['X']
+        name = f"{A.__module__}.{A.__qualname__}"
+        self.assertIn(name,                 stats)
+        self.assertEqual(2,                 stats[name]['class_creation']['calls'])  # __prepare__ and __new__
+        self.assertEqual(3,                 stats[name]['value_lookup']['calls'])  # A(1), A['F2'] and A(F1|F2)
+        self.assertIn('attribute',          stats[name])
+        self.assertIn('flag_op',            stats[name])
+        for operation in stats[name].values():
+            self.assertGreaterEqual(operation['time'], 0)
+
+    def test_exceptions(self):
+        class A(EnumEx):
+            V1 = auto()
+
+        with profiler.profile():
+            with self.assertRaises(ValueError):
+                A(2)
+            A(1)
+
+        name = f"{A.__module__}.{A.__qualname__}"
+        self.assertEqual(2,                 profiler.stats()[name]['value_lookup']['calls'])
+
+    def test_generators(self):
+        class F(IntFlagEx):
+            F1 = auto()
+            F2 = auto()
+            F4 = auto()
+
+        with profiler.profile():
+            # the generator iterating the members is left suspended
+            members = iter(F(7))
+            next(members)
+            F(1)
+            F(2)
+            F(4)
+            next(members)
+
+        name = f"{F.__module__}.{F.__qualname__}"
+        stats = profiler.stats()[name]
+        self.assertEqual(4,                 stats['value_lookup']['calls'])
+        self.assertEqual(1,                 stats['other']['calls'])
+
+    def test_dump_collapsed(self):
+        class A(EnumEx):
+            V1 = auto()
+
+        with profiler.profile():
+            A(1)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'enumex.folded')
+            profiler.dump_collapsed(path)
+            with open(path) as file:
+                lines = file.read().splitlines()
+
+        name = f"{A.__module__}.{A.__qualname__}"
+        self.assertIn(f"{name};value_lookup;EnumEx.__new__", [line.rsplit(' ', 1)[0] for line in lines])
+        for line in lines:
+            stack, nanoseconds = line.rsplit(' ', 1)
+            self.assertGreaterEqual(int(nanoseconds), 0)
+
+    def test_stopped(self):
+        class A(EnumEx):
+            V1 = auto()
+
+        with profiler.profile():
+            pass
+        A(1)
+        self.assertDictEqual({},            profiler.stats())
+
+if __name__ == "__main__":
+    unittest.main()
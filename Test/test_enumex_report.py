@@ -0,0 +1,79 @@
+# Add package directory to path for debugging
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import unittest
+import io
+from enumex import *
+from enumex import report
+from enum import auto
+from abc import ABC, abstractmethod
+
+class EnumExReportTests(unittest.TestCase):
+
+    def setUp(self):
+        report.reset()
+        report.enable()
+
+    def tearDown(self):
+        report.disable()
+        report.reset()
+
+    def test_records(self):
+        class A(ABC, FlagEx):
+            F1 = auto()
+            F2 = auto()
+
+            @abstractmethod
+            def method(self):
+                pass
+        class B(A):
+            F3 = auto()
+
+            def method(self):
+                pass
+
+        records = report.records()
+        self.assertListEqual(['A', 'B'],    [r['qualname'].rsplit('.', 1)[-1] for r in records])
+        self.assertEqual(2,                 records[0]['members'])
+        self.assertEqual(0,                 records[0]['inherited'])
+        self.assertEqual(3,                 records[1]['members'])
+        self.assertEqual(2,                 records[1]['inherited'])
+        for record in records:
+            self.assertSetEqual(set(report.PHASES), set(record['phases']))
+            self.assertGreater(record['total'], 0)
+            self.assertAlmostEqual(record['total'], sum(t for p, t in record['phases'].items() if p != 'class_body'))
+
+    def test_disabled(self):
+        report.disable()
+        self.assertFalse(report.is_enabled())
+
+        class A(EnumEx):
+            V1 = auto()
+
+        self.assertListEqual([],            report.records())
+
+    def test_print_report(self):
+        class SlowestCandidate(EnumEx):
+            V1 = auto()
+
+        file = io.StringIO()
+        report.print_report(file=file)
+        output = file.getvalue()
+        self.assertIn('SlowestCandidate',   output)
+        self.assertIn('1 classes, 1 members', output)
+
+    def test_main(self):
+        report.disable()
+        file = io.StringIO()
+        stdout, sys.stdout = sys.stdout, file
+        try:
+            report.main(['-n', '5', 'test_enumex_pickle'])
+        finally:
+            sys.stdout = stdout
+        self.assertIn('classes',            file.getvalue())
+        self.assertFalse(report.is_enabled())
+
+if __name__ == "__main__":
+    unittest.main()
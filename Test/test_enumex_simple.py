@@ -0,0 +1,161 @@
+# Add package directory to path for debugging
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import unittest
+import pickle
+from enumex import *
+from enum import auto, KEEP
+from abc import ABC, abstractmethod
+
+# Each class is defined with the class statement, and as Simple<name> with simple_enumex
+
+class Color(ABC, EnumEx):
+    RED = 1
+    GREEN = 2
+
+    @abstractmethod
+    def method(self):
+        pass
+
+@simple_enumex(EnumEx)
+class SimpleColor(ABC):
+    RED = 1
+    GREEN = 2
+
+    @abstractmethod
+    def method(self):
+        pass
+
+class MoreColor(Color):
+    BLUE = 3
+    CRIMSON = 1
+
+    def method(self):
+        return self.name.lower()
+
+@simple_enumex(SimpleColor)
+class SimpleMoreColor:
+    BLUE = 3
+    CRIMSON = 1
+
+    def method(self):
+        return self.name.lower()
+
+class Perm(FlagEx, boundary=KEEP):
+    R = auto()
+    W = auto()
+    X = auto()
+    RW = R | W
+
+@simple_enumex(FlagEx, boundary=KEEP)
+class SimplePerm:
+    R = 1
+    W = 2
+    X = 4
+    RW = 3
+
+class MorePerm(Perm, pseudo_cache_size=4):
+    D = auto()
+    NOT_R = -2
+
+@simple_enumex(SimplePerm, pseudo_cache_size=4)
+class SimpleMorePerm:
+    D = auto()
+    NOT_R = -2
+
+class Mode(IntFlagEx):
+    READ = auto()
+    WRITE = auto()
+
+@simple_enumex(IntFlagEx)
+class SimpleMode:
+    READ = auto()
+    WRITE = auto()
+
+class Name(StrEnumEx, cache_str=True):
+    FIRST = auto()
+    SECOND = 'two'
+
+    def upper(self):
+        return f"{__class__.__name__}.{super().upper()}"
+
+@simple_enumex(StrEnumEx, cache_str=True)
+class SimpleName:
+    FIRST = auto()
+    SECOND = 'two'
+
+    def upper(self):
+        return f"{__class__.__name__}.{super().upper()}"
+
+class Number(IntEnumEx, final=True):
+    ONE = 1
+    TWO = 2
+
+@simple_enumex(IntEnumEx, final=True)
+class SimpleNumber:
+    ONE = 1
+    TWO = 2
+
+PAIRS = ('Color', 'MoreColor', 'Perm', 'MorePerm', 'Mode', 'Name', 'Number')
+
+class SimpleEnumExTests(unittest.TestCase):
+
+    def test_identical_classes(self):
+        for name in PAIRS:
+            with self.subTest(name=name):
+                expected = globals()[name]
+                actual = globals()[f"Simple{name}"]
+                self.assertIs(type(expected),                       type(actual))
+                self.assertListEqual(
+                        [(m.name, m.value, m.ordinal) for m in expected],
+                        [(m.name, m.value, m.ordinal) for m in actual],
+                        )
+                self.assertDictEqual(
+                        {k: m.value for k, m in expected.__members__.items()},
+                        {k: m.value for k, m in actual.__members__.items()},
+                        )
+                # pseudo-members are left out, as other tests create them
+                self.assertListEqual(
+                        [v for v, m in expected._value2member_map_.items() if m.ordinal is not None],
+                        [v for v, m in actual._value2member_map_.items() if m.ordinal is not None],
+                        )
+                self.assertListEqual(expected._hashable_values_,    actual._hashable_values_)
+                for attr in (
+                        '_isabstractenum_', '_member_type_', '_cache_str_', '_pseudo_cache_size_',
+                        '_flag_mask_', '_singles_mask_', '_all_bits_', '_boundary_',
+                    ):
+                    self.assertEqual(getattr(expected, attr, None), getattr(actual, attr, None), msg=attr)
+                self.assertEqual(
+                        [b.__name__ for b in expected.__mro__[1:]],
+                        [b.__name__.removeprefix('Simple') for b in actual.__mro__[1:]],
+                        )
+                for expected_member, member in zip(expected, actual):
+                    self.assertIn(expected_member.value,            expected)
+                    self.assertIn(member.value,                     actual)
+                    for text in (str, format, repr):
+                        self.assertEqual(
+                                text(expected_member).replace(name, ''),
+                                text(member).replace(f"Simple{name}", ''),
+                                )
+                    if not expected._isabstractenum_:
+                        self.assertIs(member,                       pickle.loads(pickle.dumps(member)))
+
+    def test_behavior(self):
+        with self.assertRaises(TypeError):
+            SimpleColor.RED.method()
+        self.assertEqual('blue',                                    SimpleMoreColor.BLUE.method())
+        self.assertIs(SimpleMoreColor.BLUE,                         SimpleColor.resolve(3))
+        self.assertIs(SimpleMoreColor.RED,                          SimpleMoreColor.lookup('crimson'))
+        self.assertIs(SimpleMorePerm.RW,                            SimpleMorePerm.R | SimpleMorePerm.W)
+        self.assertEqual(MorePerm.NOT_R.value,                      SimpleMorePerm.NOT_R.value)
+        self.assertEqual(~MorePerm.D,                               MorePerm(~SimpleMorePerm.D.value))
+        self.assertEqual(3,                                         SimpleNumber.ONE + SimpleNumber.TWO)
+        self.assertEqual('SimpleName.FIRST',                        SimpleName.FIRST.upper())
+        with self.assertRaises(TypeError):
+            class Sub(SimpleNumber):
+                THREE = 3
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+# Add package directory to path for debugging
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import unittest
+import threading
+from enumex import *
+from enum import auto
+from abc import ABC, abstractmethod
+
+THREADS = 8
+ITERATIONS = 200
+
+class EnumExThreadingTests(unittest.TestCase):
+    """
+    Stress tests for creating, reading and combining EnumEx members from many threads.
+    These are most meaningful on a free-threaded build (python3.15t), but must pass on any build.
+    """
+
+    def test_concurrent_class_creation(self):
+        class A(IntFlagEx):
+            F1 = auto()
+            F2 = auto()
+
+        created = [[] for _ in range(THREADS)]
+
+        def work(index):
+            for i in range(ITERATIONS // 4):
+                value = 1 << (8 + index * ITERATIONS + i)
+                name = f"F_{index}_{i}"
+                B = type(A)(f"B_{index}_{i}", (A,), _class_dict(A, f"B_{index}_{i}", **{name: value}))
+                created[index].append((B, B[name]))
+
+        _run_threads(self, work)
+
+        for index, classes in enumerate(created):
+            for B, member in classes:
+                self.assertIs(member,           A.resolve(member.value))
+                self.assertTupleEqual((B,),     A.resolve_name(member.name))
+                self.assertListEqual([B.F1, B.F2, member], list(B))
+
+    def test_concurrent_member_reads(self):
+        class A(EnumEx):
+            V1 = auto()
+            V2 = auto()
+        class B(A):
+            V3 = auto()
+
+        def work(index):
+            for i in range(ITERATIONS):
+                self.assertIs(B.V3,             B(3))
+                self.assertIs(B.V1,             B['V1'])
+                self.assertIs(B.V3,             A.resolve(3))
+                self.assertEqual(1,             B.V1.value)
+                self.assertListEqual([B.V1, B.V2, B.V3], list(B))
+
+        _run_threads(self, work)
+
+    def test_concurrent_flag_operators(self):
+        class A(FlagEx):
+            F1 = auto()
+            F2 = auto()
+            F3 = auto()
+            F4 = auto()
+        class B(A):
+            F5 = auto()
+
+        results = [[] for _ in range(THREADS)]
+
+        def work(index):
+            for i in range(ITERATIONS):
+                value = i % 32
+                results[index].append(B(value))
+                results[index].append(B.F1 | B.F5)
+                results[index].append(~B.F2)
+
+        _run_threads(self, work)
+
+        # Pseudo-members are shared, every thread must have received the same objects
+        for result in results[1:]:
+            self.assertEqual(len(results[0]), len(result))
+            for expected, actual in zip(results[0], result):
+                self.assertIs(expected, actual)
+
+    def test_concurrent_abstract_reads(self):
+        class A(ABC, EnumEx):
+            V1 = auto()
+
+            @abstractmethod
+            def method(self):
+                pass
+
+            def concrete(self):
+                return self.value
+        class B(A):
+            V2 = auto()
+
+            def method(self):
+                return self.name
+
+        def work(index):
+            for i in range(ITERATIONS):
+                self.assertEqual('V2',          B.V2.method())
+                self.assertEqual(1,             A.V1.concrete())
+                with self.assertRaises(TypeError):
+                    A.V1.method()
+                with self.assertRaises(TypeError):
+                    A(1)
+
+        _run_threads(self, work)
+
+def _class_dict(base, name, **members):
+    classdict = type(base).__prepare__(name, (base,))
+    for key, value in members.items():
+        classdict[key] = value
+    return classdict
+
+def _run_threads(case:unittest.TestCase, work):
+    barrier = threading.Barrier(THREADS)
+    errors = []
+
+    def run(index):
+        barrier.wait()
+        try:
+            work(index)
+        except BaseException as ex:
+            errors.append(ex)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+# Add package directory to path for debugging
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import unittest
+import enum
+from enumex import *
+from enum import auto, UNIQUE, CONTINUOUS, NAMED_FLAGS, KEEP
+
+class VerificationTests(unittest.TestCase):
+
+    def assertSameError(self, decorator, std_decorator, cls):
+        with self.assertRaises(ValueError) as context:
+            decorator(cls)
+        with self.assertRaises(ValueError) as std_context:
+            std_decorator(cls)
+        self.assertEqual(str(std_context.exception),       str(context.exception))
+
+    def test_unique(self):
+        @unique
+        class A(EnumEx):
+            V1 = 1
+            V2 = 2
+        @verify(UNIQUE)
+        class B(A):
+            V3 = 3
+        self.assertEqual(0,                                 B._verify_state_[UNIQUE])
+        class C(B):
+            V4 = 1
+        self.assertSameError(unique, enum.unique,          C)
+        self.assertSameError(verify(UNIQUE), enum.verify(UNIQUE), C)
+
+    def test_continuous(self):
+        @verify(CONTINUOUS)
+        class A(IntEnumEx):
+            V1 = 1
+            V3 = 3
+            V2 = 2
+        self.assertTupleEqual((1, 3, 3),                    A._verify_state_[CONTINUOUS])
+        @verify(CONTINUOUS)
+        class B(A):
+            V0 = 0
+            V4 = 4
+        self.assertTupleEqual((0, 4, 5),                    B._verify_state_[CONTINUOUS])
+        class C(B):
+            V6 = 6
+        self.assertSameError(verify(CONTINUOUS), enum.verify(CONTINUOUS), C)
+        # The summary of a failing class is kept, so its subclasses are checked incrementally
+        @verify(CONTINUOUS)
+        class D(C):
+            V5 = 5
+        self.assertTupleEqual((0, 6, 7),                    D._verify_state_[CONTINUOUS])
+
+        # Values which aren't ints are checked by enum.verify
+        with self.assertRaises(TypeError):
+            @verify(CONTINUOUS)
+            class E(EnumEx):
+                V1 = 'a'
+                V2 = 'b'
+
+    def test_continuous_flag(self):
+        @verify(CONTINUOUS)
+        class A(FlagEx):
+            F2 = 2
+            F4 = 4
+            F6 = 6
+        class B(A):
+            F16 = 16
+        self.assertSameError(verify(CONTINUOUS), enum.verify(CONTINUOUS), B)
+
+    def test_named_flags(self):
+        class A(FlagEx, boundary=KEEP):
+            F1 = 1
+            F2 = 2
+            ALL = 7
+        self.assertSameError(verify(NAMED_FLAGS), enum.verify(NAMED_FLAGS), A)
+        self.assertTupleEqual(('ALL', ),                    A._verify_state_[NAMED_FLAGS])
+        # New members can name the missing bits of inherited aliases
+        @verify(NAMED_FLAGS)
+        class B(A):
+            F4 = 4
+            BOTH = 3
+        self.assertTupleEqual((),                           B._verify_state_[NAMED_FLAGS])
+
+    def test_hierarchy(self):
+        class A(EnumEx):
+            V1 = 1
+        class B(A):
+            V2 = 2
+        class C(B):
+            V3 = 3
+        # Verifying a subclass summarizes its parents once
+        verify(UNIQUE, CONTINUOUS)(C)
+        self.assertIn(CONTINUOUS,                           A._verify_state_)
+        self.assertTupleEqual((1, 2, 2),                    B._verify_state_[CONTINUOUS])
+        # Enums which aren't EnumEx classes are checked by enum.verify
+        class S(enum.Enum):
+            V1 = 1
+            V2 = 1
+        with self.assertRaises(ValueError):
+            verify(UNIQUE)(S)
+        with self.assertRaises(ValueError):
+            unique(S)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import os
 import sys
 
 __version__ = "3.15.0"
@@ -10,11 +11,24 @@ if sys.version_info[:2] != (3, 15):
 
 from .enumex import(
     EnumExType, EnumExMeta,
-    EnumEx, IntEnumEx, StrEnumEx, FlagEx, IntFlagEx, ReprEnumEx,
+    EnumEx, IntEnumEx, StrEnumEx, FlagEx, IntFlagEx, ReprEnumEx, OrderedEnumEx,
+    ordinal_key, simple_enumex,
 )
+from .containers import FlagArray, EnumExMap, EnumExSet
+from .memory import memory_report
+from .prefork import prefork_freeze
+from .warming import prewarm
+from .verification import verify, unique
 
 
 __all__ = [
         'EnumExType', 'EnumExMeta',
-        'EnumEx', 'IntEnumEx', 'StrEnumEx', 'FlagEx', 'IntFlagEx', 'ReprEnumEx',
+        'EnumEx', 'IntEnumEx', 'StrEnumEx', 'FlagEx', 'IntFlagEx', 'ReprEnumEx', 'OrderedEnumEx',
+        'ordinal_key', 'simple_enumex',
+        'FlagArray', 'EnumExMap', 'EnumExSet', 'memory_report', 'prefork_freeze', 'prewarm',
+        'verify', 'unique',
         ]
+
+if os.environ.get('ENUMEX_INSTRUMENTATION'):
+    from . import instrumentation
+    instrumentation.enable()
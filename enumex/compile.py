@@ -0,0 +1,205 @@
+"""
+Generates a module equivalent to an existing module, in which every top level EnumEx class
+is created by a fast constructor instead of the EnumExType class statement.
+
+    python -m enumex.compile mymodule -o mymodule_compiled.py
+
+The module is imported, and each top level class statement creating an EnumEx class is rewritten to
+
+    @simple_enumex(Base)
+    class Name:
+        MEMBER = 1
+
+auto() values are replaced with the literal values they generated, and _order_ is dropped once
+it has been checked by the import. Everything else in the module is kept as written, so the
+generated module is a drop-in replacement which skips EnumExType.__prepare__, _copy_existing_members
+and _proto_member when imported.
+"""
+import argparse
+import ast
+import importlib
+import inspect
+import sys
+from . import enumex as _enumex
+
+__all__ = ['compile_module', 'compile_source', 'main']
+
+_IMPORT = 'from enumex import simple_enumex\n'
+_KEYWORDS = ('boundary', 'final', 'cache_str', 'pseudo_cache_size', 'extensible')
+
+def compile_module(module):
+    """
+    Returns the source of the generated module for `module`, a module object or name.
+
+    Raises a ValueError if an EnumEx class can't be rewritten.
+    """
+    if isinstance(module, str):
+        module = importlib.import_module(module)
+    return compile_source(inspect.getsource(module), vars(module))
+
+def compile_source(source, namespace):
+    """
+    Returns `source` with its top level EnumEx classes rewritten, where `namespace` holds the
+    classes created by executing `source` (e.g. the module's `vars()`).
+    """
+    tree = ast.parse(source)
+    line_offsets = [0]
+    for line in source.splitlines(keepends=True):
+        line_offsets.append(line_offsets[-1] + len(line))
+
+    def offset(lineno, col_offset):
+        if not col_offset:
+            return line_offsets[lineno - 1]
+        # col_offset is in utf-8 bytes
+        line = source[line_offsets[lineno - 1]:line_offsets[lineno]]
+        return line_offsets[lineno - 1] + len(line.encode('utf-8')[:col_offset].decode('utf-8'))
+
+    def segment(node):
+        return source[offset(node.lineno, node.col_offset):offset(node.end_lineno, node.end_col_offset)]
+
+    # Only the last class statement of a name is bound in the module
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    edits = []
+    for name, node in classes.items():
+        enum_class = namespace.get(name)
+        if (
+                not isinstance(enum_class, _enumex.EnumExType)
+                or type.__getattribute__(enum_class, '__module__') != namespace.get('__name__')
+                or type.__getattribute__(enum_class, '__qualname__') != name
+            ):
+            continue
+        edits.extend(_class_edits(enum_class, node, source, segment, offset))
+    if not edits:
+        return source
+    #
+    # the decorator is imported after the docstring and __future__ imports
+    import_line = 1
+    for index, node in enumerate(tree.body):
+        if (
+                index == 0 and isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant)
+                and isinstance(node.value.value, str)
+                or isinstance(node, ast.ImportFrom) and node.module == '__future__'
+            ):
+            import_line = node.end_lineno + 1
+        else:
+            break
+    position = line_offsets[min(import_line, len(line_offsets)) - 1]
+    prefix = '' if position == 0 or source[position - 1] == '\n' else '\n'
+    edits.append((position, position, prefix + _IMPORT))
+
+    for start, end, text in sorted(edits, reverse=True):
+        source = source[:start] + text + source[end:]
+    return source
+
+def _closing_parenthesis(source, position):
+    """
+    Returns the position after the parenthesis closing the bases of a class statement, where
+    `position` is the end of its last base or keyword. Trailing commas and comments are skipped.
+    """
+    while source[position] != ')':
+        if source[position] == '#':
+            position = source.index('\n', position)
+        position += 1
+    return position + 1
+
+def _class_edits(enum_class, node, source, segment, offset):
+    """
+    Returns the (start, end, text) edits which rewrite the class statement `node` of `enum_class`.
+    """
+    name = node.name
+    if not node.bases or any(isinstance(base, ast.Starred) for base in node.bases):
+        raise ValueError(f"{name}: the bases of the class must be listed explicitly")
+    if not isinstance(enum_class.__bases__[-1], _enumex.EnumExType):
+        raise ValueError(f"{name}: the last base of the class must be an EnumEx class")
+    for keyword in node.keywords:
+        if keyword.arg not in _KEYWORDS:
+            raise ValueError(f"{name}: class keyword {keyword.arg or '**'!r} is not supported")
+    member_map = type.__getattribute__(enum_class, '_member_map_')
+    # auto() values passed to a custom __new__ may not be the _value_ of the member
+    new_member = type.__getattribute__(enum_class, '_new_member_')
+    custom_new = (
+            type.__getattribute__(enum_class, '_use_args_')
+            and getattr(new_member, '__module__', None) not in (None, 'builtins', 'enum', _enumex.__name__)
+            )
+    edits = []
+    #
+    # header: class Name(*bases, Base, **keywords) -> @simple_enumex(Base, **keywords) class Name(*bases)
+    *bases, etype = node.bases
+    arguments = [segment(etype)] + [f"{keyword.arg}={segment(keyword.value)}" for keyword in node.keywords]
+    header_start = offset(node.lineno, 0)
+    indent = ' ' * node.col_offset
+    header_end = max(
+            (item.end_lineno, item.end_col_offset)
+            for item in node.bases + [keyword.value for keyword in node.keywords]
+            )
+    header = (
+            f"{indent}@simple_enumex({', '.join(arguments)})\n"
+            f"{indent}class {name}({', '.join(segment(base) for base in bases)})"
+            )
+    # the trailing comma and line breaks of the bases are replaced with the closing parenthesis
+    edits.append((header_start, _closing_parenthesis(source, offset(*header_end)), header))
+    #
+    # body: resolve auto() and drop _order_
+    for statement in node.body:
+        targets = getattr(statement, 'targets', None)
+        target = targets[0].id if targets and len(targets) == 1 and isinstance(targets[0], ast.Name) else None
+        if target == '_order_':
+            empty = len(node.body) == 1
+            edits.append((
+                    offset(statement.lineno, 0),
+                    offset(statement.end_lineno + 1, 0),
+                    f"{' ' * statement.col_offset}pass\n" if empty else '',
+                    ))
+            continue
+        if not isinstance(statement, ast.Assign) or not _contains_auto(statement.value):
+            continue
+        if target not in member_map or not _is_auto(statement.value):
+            raise ValueError(f"{name}: only members assigned a single auto() are supported (line {statement.lineno})")
+        if custom_new:
+            raise ValueError(f"{name}.{target}: auto() is not supported with a custom __new__")
+        value = member_map[target]._value_
+        literal = repr(value)
+        try:
+            same = type(ast.literal_eval(literal)) is type(value) and ast.literal_eval(literal) == value
+        except (ValueError, SyntaxError):
+            same = False
+        if not same:
+            raise ValueError(f"{name}.{target}: {literal} is not a literal value")
+        value_node = statement.value
+        edits.append((
+                offset(value_node.lineno, value_node.col_offset),
+                offset(value_node.end_lineno, value_node.end_col_offset),
+                literal,
+                ))
+    return edits
+
+def _is_auto(node):
+    if not isinstance(node, ast.Call):
+        return False
+    func = node.func
+    return isinstance(func, ast.Name) and func.id == 'auto' or isinstance(func, ast.Attribute) and func.attr == 'auto'
+
+def _contains_auto(node):
+    return any(_is_auto(child) for child in ast.walk(node))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+            prog='python -m enumex.compile',
+            description="Generates a faster to import copy of a module defining EnumEx classes.",
+            )
+    parser.add_argument('module', help="module to compile")
+    parser.add_argument('-o', '--output', help="file to write the generated module to (default: stdout)")
+    args = parser.parse_args(argv)
+
+    try:
+        source = compile_module(args.module)
+    except ValueError as ex:
+        parser.exit(1, f"{parser.prog}: error: {ex}\n")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(source)
+    else:
+        sys.stdout.write(source)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,585 @@
+"""
+Compact containers of EnumEx members.
+
+    FlagArray[Perm]([Perm.R, Perm.R | Perm.W])
+    EnumExMap[Color]({Color.RED: 1})
+    EnumExSet[Color]([Color.RED, Color.GREEN])
+"""
+from array import array
+from collections.abc import Iterable, MutableMapping, MutableSequence, MutableSet
+from enum import CONFORM, EJECT, KEEP
+from .enumex import EnumExType, EnumEx, FlagEx, _is_abstract_enum, _lock
+
+__all__ = ['FlagArray', 'EnumExMap', 'EnumExSet']
+
+# Marks the missing values of an EnumExMap
+_EMPTY = object()
+
+def _specialize(cls, enum_class, attr, base_type):
+    """
+    Returns the subclass of the container `cls` for enum_class, cached on enum_class as `attr`.
+    """
+    if not isinstance(enum_class, EnumExType) or not issubclass(enum_class, base_type):
+        raise TypeError(f"{cls.__name__}[] requires a {base_type.__name__} class, not {enum_class!r}")
+    specialized = type.__getattribute__(enum_class, '__dict__').get(attr)
+    if specialized is None or specialized.__base__ is not cls:
+        with _lock:
+            specialized = type.__getattribute__(enum_class, '__dict__').get(attr)
+            if specialized is None or specialized.__base__ is not cls:
+                specialized = type(cls)(
+                        f"{cls.__name__}[{enum_class.__qualname__}]",
+                        (cls, ),
+                        {'__slots__': (), '__module__': cls.__module__, '_enum_class_': enum_class},
+                        )
+                # Stored on the enum class, so it lives exactly as long as the enum class
+                type.__setattr__(enum_class, attr, specialized)
+    return specialized
+
+def _flag_value(enum_class, value):
+    """
+    Returns the mask enum_class(value) would have for the int `value`, applying the boundary of
+    enum_class as Flag._missing_ does, without creating a pseudo-member.
+    """
+    getattribute = type.__getattribute__
+    flag_mask = getattribute(enum_class, '_flag_mask_')
+    all_bits = getattribute(enum_class, '_all_bits_')
+    boundary = getattribute(enum_class, '_boundary_')
+    if not ~all_bits <= value <= all_bits or value & (all_bits ^ flag_mask):
+        if boundary is CONFORM:
+            value &= flag_mask
+        elif boundary is KEEP:
+            if value < 0:
+                value += max(all_bits + 1, 2 ** value.bit_length())
+        else:
+            # STRICT rejects the value, EJECT returns a plain int rather than a flag
+            raise ValueError(f"{value!r} is not a valid {enum_class.__qualname__}")
+    if value < 0:
+        value += all_bits + 1
+    if value & ~flag_mask and boundary is not KEEP:
+        raise ValueError(f"{value!r} is not a valid {enum_class.__qualname__}")
+    return value
+
+def _flag_array(enum_class, masks):
+    """
+    Recreates a pickled FlagArray.
+    """
+    flags = FlagArray[enum_class]()
+    flags._masks = masks
+    return flags
+
+class FlagArray(MutableSequence):
+    """
+    Mutable sequence of the flags of one FlagEx class, stored as raw masks in an array('Q'),
+    so each flag costs 8 bytes instead of a member object.
+
+    Members are only created when items are read. Flags must fit in 64 bits, and values an EJECT
+    class returns as plain ints raise a ValueError, including those produced by ~.
+
+        perms = FlagArray[Perm]([Perm.R, Perm.R | Perm.W])
+        perms | Perm.X                  # Elementwise |, & and ~ return new arrays
+        perms.filter(Perm.W)            # Flags containing Perm.W
+        memoryview(perms)               # Zero copy view of the masks
+    """
+    __slots__ = ('_masks', )
+    _enum_class_ = None
+
+    def __class_getitem__(cls, enum_class):
+        return _specialize(cls, enum_class, '_flag_array_', FlagEx)
+
+    def __init__(self, iterable=()):
+        if self._enum_class_ is None:
+            raise TypeError("FlagArray must be specialized with a FlagEx class, e.g. FlagArray[Perm]")
+        self._masks = array('Q', map(self._mask, iterable))
+
+    def _mask(self, flag):
+        """
+        Returns the raw mask of a flag. The boundary is applied to ints without creating pseudo-members,
+        other values of the data type are converted by the class.
+        """
+        enum_class = self._enum_class_
+        if type(flag) is enum_class:
+            return flag._value_
+        if isinstance(flag, FlagEx):
+            if (
+                    (isinstance(flag, enum_class) or issubclass(enum_class, type(flag)))
+                    and not _is_abstract_enum(enum_class)
+                ):
+                # members of a base or subclass, as accepted by the FlagEx operators
+                return _flag_value(enum_class, flag._value_)
+            return enum_class.union((flag, ))._value_
+        if isinstance(flag, int) and not _is_abstract_enum(enum_class):
+            return _flag_value(enum_class, flag)
+        return enum_class(flag)._value_
+
+    def _masks_of(self, other):
+        """
+        Returns an iterable of the masks to combine elementwise with this array.
+        """
+        if isinstance(other, FlagArray):
+            if other._enum_class_ is not self._enum_class_:
+                raise TypeError(f"can't combine {type(self).__name__} with {type(other).__name__}")
+            if len(other._masks) != len(self._masks):
+                raise ValueError("FlagArrays must have the same length")
+            return other._masks
+        return None
+
+    def _new(self, masks):
+        flags = type(self).__new__(type(self))
+        flags._masks = masks
+        return flags
+
+    @property
+    def masks(self):
+        """
+        The array('Q') of raw masks.
+        """
+        return self._masks
+
+    def __len__(self):
+        return len(self._masks)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._new(self._masks[index])
+        return self._enum_class_(self._masks[index])
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self._masks[index] = array('Q', map(self._mask, value))
+        else:
+            self._masks[index] = self._mask(value)
+
+    def __delitem__(self, index):
+        del self._masks[index]
+
+    def insert(self, index, value):
+        self._masks.insert(index, self._mask(value))
+
+    def append(self, value):
+        self._masks.append(self._mask(value))
+
+    def extend(self, values):
+        if isinstance(values, FlagArray) and values._enum_class_ is self._enum_class_:
+            self._masks.extend(values._masks)
+        else:
+            self._masks.extend(map(self._mask, values))
+
+    def __iter__(self):
+        return map(self._enum_class_, self._masks)
+
+    def __contains__(self, flag):
+        try:
+            return self._mask(flag) in self._masks
+        except (TypeError, ValueError):
+            return False
+
+    def __or__(self, other):
+        masks = self._masks_of(other)
+        if masks is None:
+            mask = self._mask(other)
+            return self._new(array('Q', [value | mask for value in self._masks]))
+        return self._new(array('Q', [value | mask for value, mask in zip(self._masks, masks)]))
+
+    def __and__(self, other):
+        masks = self._masks_of(other)
+        if masks is None:
+            mask = self._mask(other)
+            return self._new(array('Q', [value & mask for value in self._masks]))
+        return self._new(array('Q', [value & mask for value, mask in zip(self._masks, masks)]))
+
+    __ror__ = __or__
+    __rand__ = __and__
+
+    def __invert__(self):
+        # ~ depends on the boundary, inverted as Flag.__invert__ does without creating pseudo-members.
+        # Where ~member of an EJECT class with gaps returns an int, this raises a ValueError instead
+        enum_class = self._enum_class_
+        if _is_abstract_enum(enum_class):
+            # raises, as abstract classes can't create pseudo-members
+            return self._new(array('Q', [(~enum_class(value))._value_ for value in self._masks]))
+        keep = type.__getattribute__(enum_class, '_boundary_') in (EJECT, KEEP)
+        singles_mask = type.__getattribute__(enum_class, '_singles_mask_')
+        inverted = {}
+        result = array('Q')
+        for value in self._masks:
+            mask = inverted.get(value)
+            if mask is None:
+                mask = inverted[value] = _flag_value(enum_class, ~value if keep else singles_mask & ~value)
+            result.append(mask)
+        return self._new(result)
+
+    def filter(self, flag):
+        """
+        Returns a FlagArray of the flags which contain all the bits of `flag`.
+        """
+        mask = self._mask(flag)
+        return self._new(array('Q', [value for value in self._masks if value & mask == mask]))
+
+    def __eq__(self, other):
+        if isinstance(other, FlagArray):
+            return other._enum_class_ is self._enum_class_ and other._masks == self._masks
+        return NotImplemented
+
+    def __buffer__(self, flags):
+        return memoryview(self._masks)
+
+    def __release_buffer__(self, view):
+        view.release()
+
+    def __reduce__(self):
+        return _flag_array, (self._enum_class_, self._masks)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
+
+def _ordinal_of(enum_class, member):
+    """
+    Returns the ordinal in enum_class of `member`, a member of enum_class or of one of its bases or subclasses
+    which enum_class shares, or raises a KeyError.
+    """
+    if type(member) is enum_class:
+        try:
+            return member._ordinal_
+        except AttributeError:
+            # pseudo-members have no ordinal
+            raise KeyError(member) from None
+    member_class = type(member)
+    if isinstance(member_class, EnumExType) and (
+            issubclass(enum_class, member_class) or issubclass(member_class, enum_class)
+        ):
+        ordinal = member.__dict__.get('_ordinal_')
+        members = type.__getattribute__(enum_class, '_members_by_ordinal_')
+        # members are only shared when they were copied from the first base
+        if ordinal is not None and ordinal < len(members) and members[ordinal]._name_ == member._name_:
+            return ordinal
+    raise KeyError(member)
+
+def _enumex_map(enum_class, items):
+    """
+    Recreates a pickled EnumExMap.
+    """
+    return EnumExMap[enum_class](items)
+
+class EnumExMap(MutableMapping):
+    """
+    Mutable mapping whose keys are the members of one EnumEx class, with the values stored in a list
+    indexed by the ordinal of each member, so lookups don't hash the member.
+
+    Members of the bases of the class (and of its subclasses) are accepted for the members the
+    class inherited from them. Keys are iterated in definition order.
+
+        counts = EnumExMap[Color]()
+        counts[Color.RED] = 1
+        counts.fill(0)                  # Sets every member to 0
+    """
+    __slots__ = ('_values', '_len')
+    _enum_class_ = None
+
+    def __class_getitem__(cls, enum_class):
+        return _specialize(cls, enum_class, '_enumex_map_', EnumEx)
+
+    def __init__(self, other=()):
+        enum_class = self._enum_class_
+        if enum_class is None:
+            raise TypeError("EnumExMap must be specialized with an EnumEx class, e.g. EnumExMap[Color]")
+        self._values = [_EMPTY] * len(type.__getattribute__(enum_class, '_members_by_ordinal_'))
+        self._len = 0
+        if other:
+            self.update(other)
+
+    # Maps created before the class was extended (see EnumExType.extend) are shorter than its ordinals,
+    # and only grow when a new member is set.
+
+    def __getitem__(self, member):
+        try:
+            value = self._values[_ordinal_of(self._enum_class_, member)]
+        except IndexError:
+            raise KeyError(member) from None
+        if value is _EMPTY:
+            raise KeyError(member)
+        return value
+
+    def get(self, member, default=None):
+        try:
+            value = self._values[_ordinal_of(self._enum_class_, member)]
+        except (KeyError, IndexError):
+            return default
+        return default if value is _EMPTY else value
+
+    def __setitem__(self, member, value):
+        values = self._values
+        ordinal = _ordinal_of(self._enum_class_, member)
+        if ordinal >= len(values):
+            values.extend([_EMPTY] * (ordinal + 1 - len(values)))
+        if values[ordinal] is _EMPTY:
+            self._len += 1
+        values[ordinal] = value
+
+    def __delitem__(self, member):
+        values = self._values
+        ordinal = _ordinal_of(self._enum_class_, member)
+        if ordinal >= len(values) or values[ordinal] is _EMPTY:
+            raise KeyError(member)
+        values[ordinal] = _EMPTY
+        self._len -= 1
+
+    def __contains__(self, member):
+        try:
+            return self._values[_ordinal_of(self._enum_class_, member)] is not _EMPTY
+        except (KeyError, IndexError):
+            return False
+
+    def __iter__(self):
+        members = type.__getattribute__(self._enum_class_, '_members_by_ordinal_')
+        return (members[ordinal] for ordinal, value in enumerate(self._values) if value is not _EMPTY)
+
+    def __len__(self):
+        return self._len
+
+    def clear(self):
+        self._values = [_EMPTY] * len(self._values)
+        self._len = 0
+
+    def fill(self, value):
+        """
+        Sets the value of every member of the class to `value`.
+        """
+        self._values = [value] * len(type.__getattribute__(self._enum_class_, '_members_by_ordinal_'))
+        self._len = len(self._values)
+
+    def copy(self):
+        """
+        Returns a shallow copy of the map.
+        """
+        copy = type(self).__new__(type(self))
+        copy._values = self._values.copy()
+        copy._len = self._len
+        return copy
+
+    __copy__ = copy
+
+    def __eq__(self, other):
+        if (
+                isinstance(other, EnumExMap) and other._enum_class_ is self._enum_class_
+                and len(other._values) == len(self._values)
+            ):
+            return other._values == self._values
+        return super().__eq__(other)
+
+    def __reduce__(self):
+        return _enumex_map, (self._enum_class_, list(self.items()))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+def _shared_ordinals(enum_class, other_class):
+    """
+    Returns the number of leading ordinals of enum_class which number the same members in other_class,
+    0 unless one class inherited its members from the other.
+    """
+    if enum_class is other_class:
+        return len(type.__getattribute__(enum_class, '_members_by_ordinal_'))
+    if not (issubclass(enum_class, other_class) or issubclass(other_class, enum_class)):
+        return 0
+    members = type.__getattribute__(enum_class, '_members_by_ordinal_')
+    other_members = type.__getattribute__(other_class, '_members_by_ordinal_')
+    shared = min(len(members), len(other_members))
+    # members are only shared when they were copied from the first base
+    if shared and members[shared - 1]._name_ != other_members[shared - 1]._name_:
+        return 0
+    return shared
+
+def _enumex_set(enum_class, bits):
+    """
+    Recreates a pickled EnumExSet.
+    """
+    members = EnumExSet[enum_class]()
+    members._bits = bits
+    return members
+
+class EnumExSet(MutableSet):
+    """
+    Mutable set of the members of one EnumEx class, stored as an int with a bit per member ordinal,
+    so membership is a bit test and set operations combine the ints.
+
+    Members of the bases of the class (and of its subclasses) are accepted for the members the
+    class inherited from them. Members are iterated in definition order.
+
+        colors = EnumExSet[Color]([Color.RED])
+        colors | {Color.GREEN}          # |, &, - and ^ return new sets
+        ~colors                         # Every other member of Color
+    """
+    __slots__ = ('_bits', )
+    _enum_class_ = None
+
+    def __class_getitem__(cls, enum_class):
+        return _specialize(cls, enum_class, '_enumex_set_', EnumEx)
+
+    def __init__(self, iterable=()):
+        if self._enum_class_ is None:
+            raise TypeError("EnumExSet must be specialized with an EnumEx class, e.g. EnumExSet[Color]")
+        self._bits = self._bits_of(iterable, True) if iterable else 0
+
+    def _bits_of(self, iterable, strict):
+        """
+        Returns the bits of the members in iterable, ignoring members which aren't in the class unless strict.
+        """
+        enum_class = self._enum_class_
+        if isinstance(iterable, EnumExSet):
+            other_class = iterable._enum_class_
+            if other_class is enum_class:
+                return iterable._bits
+            shared = _shared_ordinals(enum_class, other_class)
+            bits = iterable._bits & ((1 << shared) - 1)
+            if bits == iterable._bits or not strict:
+                return bits
+        bits = 0
+        for member in iterable:
+            try:
+                bits |= 1 << _ordinal_of(enum_class, member)
+            except KeyError:
+                if strict:
+                    raise
+        return bits
+
+    def _new(self, bits):
+        members = type(self).__new__(type(self))
+        members._bits = bits
+        return members
+
+    @property
+    def bits(self):
+        """
+        The int with a bit set for the ordinal of each member in the set.
+        """
+        return self._bits
+
+    def __contains__(self, member):
+        try:
+            if type(member) is self._enum_class_:
+                return bool(self._bits >> member._ordinal_ & 1)
+            return bool(self._bits >> _ordinal_of(self._enum_class_, member) & 1)
+        except (KeyError, AttributeError):
+            return False
+
+    def __iter__(self):
+        members = type.__getattribute__(self._enum_class_, '_members_by_ordinal_')
+        bits = self._bits
+        while bits:
+            bit = bits & -bits
+            yield members[bit.bit_length() - 1]
+            bits ^= bit
+
+    def __len__(self):
+        return self._bits.bit_count()
+
+    def add(self, member):
+        self._bits |= 1 << _ordinal_of(self._enum_class_, member)
+
+    def discard(self, member):
+        try:
+            self._bits &= ~(1 << _ordinal_of(self._enum_class_, member))
+        except KeyError:
+            pass
+
+    def remove(self, member):
+        bit = 1 << _ordinal_of(self._enum_class_, member)
+        if not self._bits & bit:
+            raise KeyError(member)
+        self._bits ^= bit
+
+    def clear(self):
+        self._bits = 0
+
+    def copy(self):
+        return self._new(self._bits)
+
+    __copy__ = copy
+
+    def __or__(self, other):
+        if type(other) is type(self):
+            return self._new(self._bits | other._bits)
+        if not isinstance(other, Iterable):
+            return NotImplemented
+        return self._new(self._bits | self._bits_of(other, True))
+
+    def __and__(self, other):
+        if type(other) is type(self):
+            return self._new(self._bits & other._bits)
+        if not isinstance(other, Iterable):
+            return NotImplemented
+        return self._new(self._bits & self._bits_of(other, False))
+
+    def __sub__(self, other):
+        if type(other) is type(self):
+            return self._new(self._bits & ~other._bits)
+        if not isinstance(other, Iterable):
+            return NotImplemented
+        return self._new(self._bits & ~self._bits_of(other, False))
+
+    def __xor__(self, other):
+        if type(other) is type(self):
+            return self._new(self._bits ^ other._bits)
+        if not isinstance(other, Iterable):
+            return NotImplemented
+        return self._new(self._bits ^ self._bits_of(other, True))
+
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    def __ior__(self, other):
+        self._bits |= self._bits_of(other, True)
+        return self
+
+    def __iand__(self, other):
+        self._bits &= self._bits_of(other, False)
+        return self
+
+    def __isub__(self, other):
+        self._bits &= ~self._bits_of(other, False)
+        return self
+
+    def __ixor__(self, other):
+        self._bits ^= self._bits_of(other, True)
+        return self
+
+    def __invert__(self):
+        count = len(type.__getattribute__(self._enum_class_, '_members_by_ordinal_'))
+        return self._new(~self._bits & ((1 << count) - 1))
+
+    def isdisjoint(self, other):
+        return not self._bits & self._bits_of(other, False)
+
+    def __le__(self, other):
+        if type(other) is type(self):
+            return self._bits & other._bits == self._bits
+        return super().__le__(other)
+
+    def __ge__(self, other):
+        if type(other) is type(self):
+            return self._bits & other._bits == other._bits
+        return super().__ge__(other)
+
+    def __lt__(self, other):
+        if type(other) is type(self):
+            return self._bits != other._bits and self._bits & other._bits == self._bits
+        return super().__lt__(other)
+
+    def __gt__(self, other):
+        if type(other) is type(self):
+            return self._bits != other._bits and self._bits & other._bits == other._bits
+        return super().__gt__(other)
+
+    def __eq__(self, other):
+        if type(other) is type(self):
+            return self._bits == other._bits
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return _enumex_set, (self._enum_class_, self._bits)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
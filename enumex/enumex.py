@@ -1,26 +1,45 @@
+import collections
+import functools
+import itertools
+import operator
 import threading
+import time
+import types
+import weakref
 from abc import ABC, ABCMeta, update_abstractmethods
 import enum
 from enum import Enum, IntEnum, Flag, IntFlag, StrEnum, ReprEnum
-from enum import _is_single_bit, _proto_member
+from enum import _is_descriptor, _is_single_bit, _proto_member
 from enum import _EnumDict
 from enum import STRICT, CONFORM, EJECT, KEEP
 from typing import Callable
 
 __all__ = [
         'EnumExType', 'EnumExMeta',
-        'EnumEx', 'IntEnumEx', 'StrEnumEx', 'FlagEx', 'IntFlagEx', 'ReprEnumEx',
+        'EnumEx', 'IntEnumEx', 'StrEnumEx', 'FlagEx', 'IntFlagEx', 'ReprEnumEx', 'OrderedEnumEx',
+        'ordinal_key', 'simple_enumex',
         ]
 
+# Counter hook set by enumex.instrumentation, called as _instrument(enum_class, counter_name).
+# None when instrumentation is disabled, so hot paths only pay for a global lookup.
+_instrument = None
+
+# Class creation hook set by enumex.report, called as _creation_timing(timer, enum_class)
+# with the _CreationTimer of each new class. None when creation timing is disabled.
+_creation_timing = None
+
 # Dummy value for Enum and Flag as there are explicit checks for them
 # before they have been created.
 # This is also why there are checks in EnumType like `if Enum is not None`
-EnumEx = FlagEx = ReprEnumEx = None
+EnumEx = FlagEx = ReprEnumEx = OrderedEnumEx = None
 # EnumEx = FlagEx = _stdlib_enumexs = ReprEnumEx = None
 
 def _is_std_enum_type(type):
     return type in (Enum, IntEnum, Flag, IntFlag, StrEnum, ReprEnum)
 
+def _is_enumex_base_type(type):
+    return type in (EnumEx, ReprEnumEx, IntEnumEx, FlagEx, IntFlagEx, StrEnumEx, OrderedEnumEx)
+
 def _is_abstract_enum(cls):
     if issubclass(cls, EnumEx):
         # Call EnumMeta directly to avoid checking thread state
@@ -46,6 +65,8 @@ def _enforce_abstract(cls):
 
 class _AbstractEnumMethodWrapper:
     def __init__(self, func:Callable, enum_class):
+        if _instrument is not None:
+            _instrument(enum_class, 'abstract_wrappers')
         self.func = func
         self.enum_class = enum_class
         self.__name__ = func.__name__
@@ -64,6 +85,8 @@ class _AbstractEnumMethodWrapper:
     
 class _AbstractEnumPropertyWrapper(property):
     def __init__(self, prop:property, name, enum_class):
+        if _instrument is not None:
+            _instrument(enum_class, 'abstract_wrappers')
         super().__init__(prop.fget, prop.fset, prop.fdel, prop.__doc__)
         self.prop = prop
         self.enum_class = enum_class
@@ -89,6 +112,274 @@ class _AbstractEnumPropertyWrapper(property):
             )
 
 
+# Concurrency model (including free-threaded builds):
+# - Class creation only mutates the new class (and the _proto_members/classdict it owns) until
+#   EnumExType.__new__ returns, so no other thread can observe a partially built class.
+#   The abstract hooks installed by _install_abstract_* are installed before that point as well.
+# - The only shared state class creation writes to is the resolve index of each EnumEx ancestor,
+#   which is guarded by _lock. _lock also guards extend(), add_alias(), the pseudo-member caches of
+#   pseudo_cache_size classes, verify summaries, container specializations, and the lazily built
+#   _lookup_indexes_ and _bit_members_ tables, which are built once under it and then read without it.
+# - The cached str/repr/format results of cache_str classes are written without the lock: each is
+#   stored in the __dict__ of its own member, so concurrent first calls at worst compute it twice.
+# - Read paths (member access, lookups, resolve, flag operators) take no locks, except value lookups
+#   of pseudo_cache_size classes returning a pseudo-member, which update its cache under _lock.
+#   Reentrancy guards are per thread, and pseudo-members are published with dict.setdefault
+#   by the std enum, so every thread sees the same pseudo-member for a value.
+_lock = threading.RLock()
+
+# Maximum number of str/repr/format results cached on the pseudo-members of each class, see cache_str
+_STR_CACHE_SIZE = 1024
+
+def _cache_str_result(member, member_dict, key, result):
+    """
+    Stores result in the __dict__ of member, for pseudo-members only until the class has cached _STR_CACHE_SIZE results.
+    """
+    cls = type(member)
+    if enum.EnumMeta.__getattribute__(cls, '_member_map_').get(member_dict.get('_name_')) is not member:
+        if next(enum.EnumMeta.__getattribute__(cls, '_str_cache_count_')) >= _STR_CACHE_SIZE:
+            return
+    member_dict[key] = result
+
+def _cached_str_method(method, name):
+    """
+    Returns a wrapper of the __str__ or __repr__ method which caches its result on the member.
+    """
+    key = f"_cached{name}"
+
+    @functools.wraps(method)
+    def cached(self):
+        member_dict = self.__dict__
+        try:
+            return member_dict[key]
+        except KeyError:
+            pass
+        result = method(self)
+        _cache_str_result(self, member_dict, key, result)
+        return result
+    return cached
+
+def _cached_format_method(method, name):
+    """
+    Returns a wrapper of the __format__ method which caches the result of the default format spec on the member.
+    """
+    key = f"_cached{name}"
+
+    @functools.wraps(method)
+    def cached(self, format_spec):
+        if format_spec:
+            return method(self, format_spec)
+        member_dict = self.__dict__
+        try:
+            return member_dict[key]
+        except KeyError:
+            pass
+        result = method(self, format_spec)
+        _cache_str_result(self, member_dict, key, result)
+        return result
+    return cached
+
+def _pseudo_cache_size(size, first_enum):
+    """
+    Returns the validated pseudo_cache_size class keyword, or the size of first_enum if it isn't given.
+    """
+    if size is None:
+        return getattr(first_enum, '_pseudo_cache_size_', None)
+    size = operator.index(size)
+    if size < 0:
+        raise ValueError(f"pseudo_cache_size must be >= 0, not {size}")
+    return size
+
+def _track_pseudo_member(cls, value, member):
+    """
+    Records member as the most recently used entry of the pseudo-member cache of cls, a class created
+    with pseudo_cache_size=N, and evicts the least recently used pseudo-members from _value2member_map_
+    while the cache holds more than N of them.
+
+    Canonical members are never evicted, only the negative values flags map to them, so they keep their
+    identity. An evicted pseudo-member is recreated by the next lookup of its value, as a new object,
+    and the inversions cached from and to it are dropped so ~ returns the same object as the lookup.
+    """
+    if not isinstance(member, cls):
+        # flags with boundary=EJECT return out of range values as plain ints, which aren't cached
+        return
+    getattribute = type.__getattribute__
+    if getattribute(cls, '_member_map_').get(member._name_) is member:
+        # Flags store negative values as extra keys of the member they resolve to,
+        # only those keys are cached for canonical members
+        if not isinstance(value, int) or value >= 0:
+            return
+        key = value
+        candidates = (value, )
+    else:
+        key = member._value_
+        candidates = (key, value)
+    value2member_map = getattribute(cls, '_value2member_map_')
+    with _lock:
+        cache = getattribute(cls, '__dict__').get('_pseudo_member_cache_')
+        if cache is None:
+            cache = collections.OrderedDict()
+            type.__setattr__(cls, '_pseudo_member_cache_', cache)
+        entry = cache.pop(key, None)
+        keys = entry[1] if entry is not None and entry[0] is member else ()
+        for map_key in candidates:
+            try:
+                if map_key not in keys and value2member_map.get(map_key) is member:
+                    keys += (map_key, )
+            except TypeError:
+                pass
+        if not keys:
+            return
+        cache[key] = (member, keys)
+        size = getattribute(cls, '_pseudo_cache_size_')
+        while len(cache) > size:
+            evicted, evicted_keys = cache.popitem(last=False)[1]
+            for map_key in evicted_keys:
+                if value2member_map.get(map_key) is evicted:
+                    del value2member_map[map_key]
+            _unlink_inversions(cls, evicted, value2member_map)
+            if _instrument is not None:
+                _instrument(cls, 'pseudo_evictions')
+
+def _unlink_inversions(cls, member, value2member_map):
+    """
+    Drops the inversion cached on `member`, an evicted pseudo-member of flag cls, and the inversions
+    of the members ~ maps to it: for KEEP and EJECT the member of its complement in _all_bits_,
+    otherwise the member of its complement in _singles_mask_.
+    """
+    inverse = member.__dict__.pop('_inverted_', None)
+    if inverse is not None and inverse.__dict__.get('_inverted_') is member:
+        del inverse.__dict__['_inverted_']
+    value = member._value_
+    if not isinstance(value, int):
+        return
+    getattribute = type.__getattribute__
+    for key in (getattribute(cls, '_all_bits_') ^ value, getattribute(cls, '_singles_mask_') & ~value):
+        inverse = value2member_map.get(key)
+        if inverse is not None and inverse.__dict__.get('_inverted_') is member:
+            del inverse.__dict__['_inverted_']
+
+class _CreationTimer:
+    """
+    Accumulates the time spent in each phase of creating an enum class, see enumex.report.
+    """
+    def __init__(self):
+        self.phases = {}
+        self.inherited = 0
+        self._last = time.perf_counter()
+
+    def lap(self, phase):
+        """
+        Adds the time since the previous lap to `phase`.
+        """
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._last
+        self._last = now
+
+# The std generators which _next_auto_value computes without the previous values
+_enum_next_value = Enum._generate_next_value_
+_flag_next_value = Flag._generate_next_value_
+_str_next_value = StrEnum._generate_next_value_
+
+def _next_auto_value(generate_next_value, name, count, max_int, ints_only):
+    """
+    Returns the value the std generate_next_value returns for member `name` after `count` members,
+    where max_int is the largest previous value (None without values) if ints_only,
+    or None when it depends on the list of previous values.
+    """
+    if generate_next_value is _str_next_value:
+        return name.lower()
+    if not ints_only:
+        return None
+    if generate_next_value is _enum_next_value:
+        return 1 if max_int is None else max_int + 1
+    if generate_next_value is _flag_next_value:
+        return 1 if not count or max_int is None else 1 << max_int.bit_length()
+    return None
+
+def _resolve_auto_values(generate_next_value, values, last_values):
+    """
+    Replaces the auto() values of the dict `values` with the values they generate, as members of a class body
+    following members with the values `last_values`. The values of `values` are appended to last_values.
+    """
+    max_int, ints_only = None, True
+    for value in last_values:
+        if type(value) is not int:
+            ints_only = False
+            break
+        if max_int is None or value > max_int:
+            max_int = value
+    for name, value in values.items():
+        if isinstance(value, enum.auto):
+            if value.value is enum._auto_null:
+                next_value = _next_auto_value(generate_next_value, name, len(last_values), max_int, ints_only)
+                if next_value is None:
+                    next_value = generate_next_value(name, 1, len(last_values), last_values[:])
+                value.value = next_value
+            value = values[name] = value.value
+        last_values.append(value)
+        if ints_only:
+            if type(value) is not int:
+                ints_only = False
+            elif max_int is None or value > max_int:
+                max_int = value
+
+def _invert_negative_flags(values, bits):
+    """
+    Replaces the negative int values (or first items of tuple values) of the dict `values` with their
+    inversion within `bits` and the bits of the other values, as negative members of a flag class body.
+    """
+    inverted = []
+    for name, value in values.items():
+        first = value[0] if isinstance(value, tuple) and value else value
+        if isinstance(first, int):
+            if first < 0:
+                inverted.append(name)
+            else:
+                bits |= first
+    for name in inverted:
+        value = values[name]
+        if isinstance(value, int):
+            values[name] = bits & value
+        else:
+            values[name] = (bits & value[0], ) + value[1:]
+
+class _EnumExDict(_EnumDict):
+    """
+    Namespace of EnumEx class bodies.
+
+    Tracks the largest value assigned while every value is an int, so auto() with the std generators
+    doesn't copy (and sort) all the previous, including inherited, values for each member.
+    """
+    def __init__(self, *args, **kwds):
+        super().__init__(*args, **kwds)
+        self._max_int = None
+        self._ints_only = True
+
+    def __setitem__(self, key, value):
+        generated = False
+        if type(value) is enum.auto and value.value is enum._auto_null:
+            next_value = _next_auto_value(
+                    getattr(self, '_generate_next_value', None), key,
+                    len(self._member_names), self._max_int, self._ints_only,
+                    )
+            if next_value is not None:
+                value.value = next_value
+                generated = True
+        last_values = self._last_values
+        known = len(last_values)
+        super().__setitem__(key, value)
+        if len(last_values) > known:
+            if generated:
+                self._auto_called = True
+            if self._ints_only:
+                for last_value in last_values[known:]:
+                    if type(last_value) is not int:
+                        self._ints_only = False
+                        break
+                    if self._max_int is None or last_value > self._max_int:
+                        self._max_int = last_value
+
 _thread_state = threading.local()
 
 def _reentering(key):
@@ -109,10 +400,14 @@ class EnumExType(enum.EnumMeta, ABCMeta):
 
     @classmethod
     def __prepare__(metacls, cls, bases, **kwds):
+        metacls._check_for_existing_members_(cls, bases)
+        timer = _CreationTimer() if _creation_timing is not None else None
         # create the namespace dict
-        enum_dict = _EnumDict(cls)
+        enum_dict = _EnumExDict(cls)
         # inherit previous flags and _generate_next_value_ function
         member_type, first_enum, first_std_base = metacls._get_mixins_(cls, bases)
+        if timer is not None:
+            timer.lap('get_mixins')
         if first_enum is not None:
             enum_dict['_generate_next_value_'] = getattr(
                     first_std_base, '_generate_next_value_', None,
@@ -120,6 +415,11 @@ class EnumExType(enum.EnumMeta, ABCMeta):
         
         # Copy member values to enum_dict from base for _generate_next_value_
         metacls._copy_existing_members(cls, bases, enum_dict)
+        if timer is not None:
+            timer.lap('copy_existing_members')
+            timer.inherited = len(enum_dict._member_names)
+            # Picked up by __new__
+            enum_dict._creation_timer = timer
         return enum_dict
     
     @staticmethod
@@ -130,7 +430,7 @@ class EnumExType(enum.EnumMeta, ABCMeta):
                 for k, v in members.items():
                     enum_dict[k] = v.value
 
-    def __new__(metacls, cls, bases, classdict, *, boundary=None, _simple=False, **kwds):
+    def __new__(metacls, cls, bases, classdict, *, boundary=None, _simple=False, final=False, cache_str=None, pseudo_cache_size=None, extensible=None, **kwds):
         # an Enum class is final once enumeration items have been defined; it
         # cannot be mixed with other types (int, float, etc.) if it has an
         # inherited __new__ unless a new __new__ is defined (or the resulting
@@ -139,6 +439,10 @@ class EnumExType(enum.EnumMeta, ABCMeta):
         if _simple:
             return type.__new__(metacls, cls, bases, classdict, **kwds)
         #
+        timer = getattr(classdict, '_creation_timer', None)
+        if timer is not None:
+            timer.lap('class_body')
+        #
         # remove any keys listed in _ignore_
         classdict.setdefault('_ignore_', []).append('_ignore_')
         ignore = classdict['_ignore_']
@@ -166,7 +470,11 @@ class EnumExType(enum.EnumMeta, ABCMeta):
             classdict['_generate_next_value_'] = _gnv
         #
         # data type of member and the controlling Enum class
+        if timer is not None:
+            timer.lap('prepare_members')
         member_type, first_enum, std_base = metacls._get_mixins_(cls, bases)
+        if timer is not None:
+            timer.lap('get_mixins')
         __new__, save_new, use_args = metacls._find_new_(
                 classdict, member_type, first_enum,
                 )
@@ -186,8 +494,25 @@ class EnumExType(enum.EnumMeta, ABCMeta):
         classdict['_unhashable_values_'] = []       # e.g. frozenset() with set()
         classdict['_unhashable_values_map_'] = {}
         classdict['_member_type_'] = member_type
+        # hierarchy wide indexes of which class first defined a value/name (see resolve())
+        classdict['_value2class_map_'] = {}
+        classdict['_name2classes_map_'] = {}
         # now set the __repr__ for the value
         classdict['_value_repr_'] = metacls._find_data_repr_(cls, bases)
+        # str/repr/format caching is inherited unless overridden (see _install_str_cache_)
+        classdict['_cache_str_'] = (
+                cache_str
+                if cache_str is not None
+                else getattr(first_enum, '_cache_str_', False)
+                )
+        # bound of the pseudo-member cache, inherited unless overridden (see _track_pseudo_member)
+        classdict['_pseudo_cache_size_'] = _pseudo_cache_size(pseudo_cache_size, first_enum)
+        # whether members can be added with extend(), inherited unless overridden
+        classdict['_extensible_'] = (
+                extensible
+                if extensible is not None
+                else getattr(first_enum, '_extensible_', False)
+                )
         #
         # Flag structures (will be removed if final class is not a Flag)
         classdict['_boundary_'] = (
@@ -200,27 +525,25 @@ class EnumExType(enum.EnumMeta, ABCMeta):
         classdict['_inverted_'] = None
         # check for negative flag values and invert if found (using _proto_members)
         if FlagEx is not None and bases and issubclass(bases[-1], FlagEx):
-            bits = 0
+            bits, inherited = EnumExType._inherited_flag_bits_(bases)
             inverted = []
-            for n in member_names:
+            for n in itertools.islice(member_names, inherited, None):
                 p = classdict[n]
-                if isinstance(p.value, int):
-                    if p.value < 0:
-                        inverted.append(p)
-                    else:
-                        bits |= p.value
-                elif p.value is None:
-                    pass
-                elif isinstance(p.value, tuple) and p.value and isinstance(p.value[0], int):
-                    if p.value[0] < 0:
+                value = p.value
+                if isinstance(value, tuple) and value:
+                    value = value[0]
+                if isinstance(value, int):
+                    if value < 0:
                         inverted.append(p)
                     else:
-                        bits |= p.value[0]
+                        bits |= value
             for p in inverted:
                 if isinstance(p.value, int):
                     p.value = bits & p.value
                 else:
                     p.value = (bits & p.value[0], ) + p.value[1:]
+        if timer is not None:
+            timer.lap('prepare_members')
         try:
             exc = None
             classdict['_%s__in_progress' % cls] = True
@@ -233,54 +556,12 @@ class EnumExType(enum.EnumMeta, ABCMeta):
             if hasattr(e, '__notes__'):
                 del e.__notes__
             raise
+        if timer is not None:
+            timer.lap('type_new')
         #
         # update classdict with any changes made by __init_subclass__
         classdict.update(enum_class.__dict__)
-        #
-        # double check that repr and friends are not the mixin's or various
-        # things break (such as pickle)
-        # however, if the method is defined in the Enum itself, don't replace
-        # it
-        #
-        # Also, special handling for ReprEnum
-        if ReprEnumEx is not None and ReprEnumEx in bases:
-            if member_type is object:
-                raise TypeError(
-                        'ReprEnum subclasses must be mixed with a data type (i.e.'
-                        ' int, str, float, etc.)'
-                        )
-            if '__format__' not in classdict:
-                enum_class.__format__ = member_type.__format__
-                classdict['__format__'] = enum_class.__format__
-            if '__str__' not in classdict:
-                method = member_type.__str__
-                if method is object.__str__:
-                    # if member_type does not define __str__, object.__str__ will use
-                    # its __repr__ instead, so we'll also use its __repr__
-                    method = member_type.__repr__
-                enum_class.__str__ = method
-                classdict['__str__'] = enum_class.__str__
-        for name in ('__repr__', '__str__', '__format__', '__reduce_ex__'):
-            if name not in classdict:
-                # check for mixin overrides before replacing
-                enum_method = getattr(first_enum, name)
-                found_method = getattr(enum_class, name)
-                object_method = getattr(object, name)
-                data_type_method = getattr(member_type, name)
-                if found_method in (data_type_method, object_method):
-                    setattr(enum_class, name, enum_method)
-        #
-        # for Flag, add __or__, __and__, __xor__, and __invert__
-        if FlagEx is not None and issubclass(enum_class, FlagEx):
-            for name in (
-                    '__or__', '__and__', '__xor__',
-                    '__ror__', '__rand__', '__rxor__',
-                    '__invert__'
-                ):
-                if name not in classdict:
-                    enum_method = getattr(FlagEx, name)
-                    setattr(enum_class, name, enum_method)
-                    classdict[name] = enum_method
+        metacls._update_methods_(enum_class, classdict, bases, member_type, first_enum)
         #
         # replace any other __new__ with our own (as long as Enum is not None,
         # anyway) -- again, this is to support pickle
@@ -299,6 +580,8 @@ class EnumExType(enum.EnumMeta, ABCMeta):
         # - remove any aliases from _order_
         # - check that _order_ and _member_names_ match
         #
+        if timer is not None:
+            timer.lap('methods')
         # step 1: ensure we have a list
         if _order_ is not None:
             if isinstance(_order_, str):
@@ -343,6 +626,45 @@ class EnumExType(enum.EnumMeta, ABCMeta):
                         'member order does not match _order_:\n  %r\n  %r'
                         % (enum_class._member_names_, _order_)
                         )
+        if timer is not None:
+            timer.lap('flag')
+        metacls._finalize_(enum_class, bases, final, timer)
+
+        if timer is not None and _creation_timing is not None:
+            _creation_timing(timer, enum_class)
+        return enum_class
+
+    @staticmethod
+    def _inherited_flag_bits_(bases):
+        """
+        Returns the union of the bits of the members inherited from bases[0], and the number of members inherited.
+
+        Inherited members are copied first and are never negative, so their union is the _flag_mask_ of bases[0]
+        and only the members defined by the new class need to be scanned for negative values.
+        """
+        member_map = getattr(bases[0], '_member_map_', None)
+        if not member_map:
+            return 0, 0
+        return getattr(bases[0], '_flag_mask_', None) or 0, len(member_map)
+
+    @staticmethod
+    def _finalize_(enum_class, bases, final=False, timer=None):
+        """
+        Completes enum_class once its members have been created.
+        """
+        #
+        # record the members first defined here, on this class and its EnumEx ancestors
+        EnumExType._index_defined_members_(enum_class, bases)
+        EnumExType._number_members_(enum_class)
+        # classes whose lookup indexes hold the members of enum_class (see lookup)
+        base = bases[0] if bases else None
+        if isinstance(base, EnumExType) and not _is_enumex_base_type(base):
+            parent_chain = type.__getattribute__(base, '_lookup_chain_')
+        else:
+            parent_chain = ()
+        type.__setattr__(enum_class, '_lookup_chain_', (enum_class, ) + parent_chain)
+        if timer is not None:
+            timer.lap('index')
             
         if issubclass(enum_class, ABC):
             enum_class.__abstractmethods__ = None
@@ -354,7 +676,11 @@ class EnumExType(enum.EnumMeta, ABCMeta):
         else:
             setattr(enum_class,'_isabstractenum_', False)
 
-        return enum_class
+        if final:
+            enum_class.freeze()
+
+        if timer is not None:
+            timer.lap('abstract')
 
 
     # Override type checks so ABCMeta doesn't raise errors
@@ -365,9 +691,489 @@ class EnumExType(enum.EnumMeta, ABCMeta):
     def __instancecheck__(cls, instance):
         return cls.__subclasscheck__(instance.__class__)
 
+    @staticmethod
+    def _update_methods_(enum_class, classdict, bases, member_type, first_enum):
+        """
+        Replaces the mixin's __repr__ and friends, and adds the FlagEx operators to enum_class.
+        classdict is updated with the methods which were set.
+        """
+        # double check that repr and friends are not the mixin's or various
+        # things break (such as pickle)
+        # however, if the method is defined in the Enum itself, don't replace
+        # it
+        #
+        # Also, special handling for ReprEnum
+        if ReprEnumEx is not None and ReprEnumEx in bases:
+            if member_type is object:
+                raise TypeError(
+                        'ReprEnum subclasses must be mixed with a data type (i.e.'
+                        ' int, str, float, etc.)'
+                        )
+            if '__format__' not in classdict:
+                enum_class.__format__ = member_type.__format__
+                classdict['__format__'] = enum_class.__format__
+            if '__str__' not in classdict:
+                method = member_type.__str__
+                if method is object.__str__:
+                    # if member_type does not define __str__, object.__str__ will use
+                    # its __repr__ instead, so we'll also use its __repr__
+                    method = member_type.__repr__
+                enum_class.__str__ = method
+                classdict['__str__'] = enum_class.__str__
+        for name in ('__repr__', '__str__', '__format__', '__reduce_ex__'):
+            if name not in classdict:
+                # check for mixin overrides before replacing
+                enum_method = getattr(first_enum, name)
+                found_method = getattr(enum_class, name)
+                object_method = getattr(object, name)
+                data_type_method = getattr(member_type, name)
+                if found_method in (data_type_method, object_method):
+                    setattr(enum_class, name, enum_method)
+        #
+        # for Flag, add __or__, __and__, __xor__, and __invert__
+        if FlagEx is not None and issubclass(enum_class, FlagEx):
+            for name in (
+                    '__or__', '__and__', '__xor__',
+                    '__ror__', '__rand__', '__rxor__',
+                    '__invert__'
+                ):
+                if name not in classdict:
+                    enum_method = getattr(FlagEx, name)
+                    setattr(enum_class, name, enum_method)
+                    classdict[name] = enum_method
+        EnumExType._install_str_cache_(enum_class)
+
+    @staticmethod
+    def _install_str_cache_(enum_class):
+        """
+        When enum_class was created with cache_str=True, wraps __str__, __repr__ and __format__
+        so their results are stored on each member. Members are immutable, so the cached results
+        are never invalidated. Otherwise, removes the wrappers inherited from a cached base.
+        """
+        enabled = enum.EnumMeta.__getattribute__(enum_class, '_cache_str_')
+        if enabled:
+            type.__setattr__(enum_class, '_str_cache_count_', itertools.count())
+        for name in ('__str__', '__repr__', '__format__'):
+            method = getattr(enum_class, name)
+            owner = getattr(method, '_cached_owner_', None)
+            if owner is not None:
+                if enabled and name not in enum.EnumMeta.__getattribute__(enum_class, '__dict__'):
+                    # inherited from a cached base, which stores the results on the members already
+                    continue
+                method = method.__wrapped__
+            # methods of the data type (e.g. int.__repr__ for IntEnumEx.__str__) are faster than the cache
+            if enabled and isinstance(method, types.FunctionType):
+                wrapper = _cached_format_method(method, name) if name == '__format__' else _cached_str_method(method, name)
+                wrapper._cached_owner_ = enum_class
+                type.__setattr__(enum_class, name, wrapper)
+            elif owner is not None:
+                type.__setattr__(enum_class, name, method)
+
+    @staticmethod
+    def _number_members_(enum_class):
+        """
+        Assigns each distinct member of enum_class (aliases share their member) its ordinal, its position
+        in definition order, and stores the members by ordinal in _members_by_ordinal_.
+        Inherited members are defined first, so they keep the ordinal of the parent's member.
+        """
+        member_map = enum.EnumMeta.__getattribute__(enum_class, '_member_map_')
+        members = tuple({id(member): member for member in member_map.values()}.values())
+        for ordinal, member in enumerate(members):
+            member.__dict__['_ordinal_'] = ordinal
+        type.__setattr__(enum_class, '_members_by_ordinal_', members)
+
+    # Records the values and names first defined by enum_class in the resolve indexes of every
+    # EnumEx ancestor, so ancestor.resolve(value) is a single dict lookup.
+    # enum_class indexes all of its own members, inherited or not, as it is the root of its own hierarchy.
+    # Classes are held weakly so dynamically created subclasses can still be collected.
+    @staticmethod
+    def _index_defined_members_(enum_class, bases):
+        getattribute = enum.EnumMeta.__getattribute__
+        value2member_map = getattribute(enum_class, '_value2member_map_')
+        member_map = getattribute(enum_class, '_member_map_')
+        if not member_map:
+            return
+
+        ref = weakref.ref(enum_class)
+        getattribute(enum_class, '_value2class_map_').update(dict.fromkeys(value2member_map, ref))
+        getattribute(enum_class, '_name2classes_map_').update((name, (ref,)) for name in member_map)
+
+        # Members are inherited (copied) from the first base, see _copy_existing_members
+        parent = bases[0] if bases else None
+        parent_values = getattr(parent, '_value2member_map_', None) or {}
+        parent_names = getattr(parent, '_member_map_', None) or {}
+        values = [v for v in value2member_map if v not in parent_values]
+        names = [n for n in member_map if n not in parent_names]
+        EnumExType._index_in_ancestors_(enum_class, values, names)
+
+    @staticmethod
+    def _index_in_ancestors_(enum_class, values, names):
+        """
+        Records `values` and `names`, first defined by enum_class, in the resolve indexes of its EnumEx ancestors.
+        """
+        getattribute = enum.EnumMeta.__getattribute__
+        indexes = [
+                (getattribute(base, '_value2class_map_'), getattribute(base, '_name2classes_map_'))
+                for base in getattribute(enum_class, '__mro__')[1:]
+                if isinstance(base, EnumExType)
+                and not _is_enumex_base_type(base)
+                and '_value2class_map_' in getattribute(base, '__dict__')
+                ]
+        if not indexes or not (values or names):
+            return
+
+        def unindex(ref):
+            with _lock:
+                for value_map, name_map in indexes:
+                    for value in values:
+                        if value_map.get(value) is ref:
+                            del value_map[value]
+                    for name in names:
+                        refs = tuple(r for r in name_map.get(name, ()) if r is not ref)
+                        if refs:
+                            name_map[name] = refs
+                        else:
+                            name_map.pop(name, None)
+
+        ref = weakref.ref(enum_class, unindex)
+        with _lock:
+            for value_map, name_map in indexes:
+                for value in values:
+                    # The first class to define a value owns it
+                    value_map.setdefault(value, ref)
+                for name in names:
+                    # Replaced rather than mutated, so readers never need the lock
+                    name_map[name] = name_map.get(name, ()) + (ref,)
+
+    def resolve(cls, value):
+        """
+        Returns the member with `value` from the class in cls's hierarchy (cls and its subclasses)
+        which first defined it. Values cls inherited resolve to cls's own members.
+
+        Raises a ValueError if neither cls nor any of its subclasses define `value`.
+        """
+        getattribute = enum.EnumMeta.__getattribute__
+        try:
+            defining_class = getattribute(cls, '_value2class_map_')[value]()
+        except (KeyError, TypeError):
+            defining_class = None
+        if defining_class is None:
+            raise ValueError(f"{value!r} is not defined in the {cls.__qualname__!r} hierarchy")
+        return getattribute(defining_class, '_value2member_map_')[value]
+
+    def resolve_name(cls, name):
+        """
+        Returns a tuple of the classes in cls's hierarchy (cls and its subclasses) which define
+        a member called `name`, excluding subclasses which only inherited it.
+        """
+        refs = enum.EnumMeta.__getattribute__(cls, '_name2classes_map_').get(name, ())
+        return tuple(c for c in (ref() for ref in refs) if c is not None)
+
+    def lookup(cls, name, *, casefold=True):
+        """
+        Returns the member called `name`, registered with `name` as an alias (see register_alias),
+        or whose value converted to str is `name`, in that order of precedence across the whole hierarchy,
+        so an inherited name takes precedence over the value of a member of a subclass.
+        When casefold is True, names are compared case-insensitively.
+
+        The indexes are built on first use, and each class only indexes the members it first defined,
+        so inherited names are looked up in the indexes of the base classes rather than duplicated.
+
+        Raises a TypeError if name isn't a str, and a KeyError if no member matches.
+        """
+        if not isinstance(name, str):
+            raise TypeError(f"lookup() requires a str, not {type(name).__qualname__!r}")
+        getattribute = enum.EnumMeta.__getattribute__
+        member_map = getattribute(cls, '_member_map_')
+        member = member_map.get(name)
+        if member is not None:
+            return member
+        key = name.casefold() if casefold else name
+        chain = []
+        for klass in getattribute(cls, '_lookup_chain_'):
+            indexes = type.__getattribute__(klass, '__dict__').get('_lookup_indexes_')
+            if indexes is None:
+                indexes = EnumExType._build_lookup_indexes_(klass)
+            chain.append(indexes[casefold])
+        # names, then aliases, then values
+        for tier in range(3):
+            for indexes in chain:
+                found = indexes[tier].get(key)
+                if found is not None and found in member_map:
+                    return member_map[found]
+        raise KeyError(name)
+
+    def register_alias(cls, alias, member):
+        """
+        Registers `alias` as an additional name of `member` (a member of cls, or its name) for lookup.
+        Aliases are inherited by subclasses.
+        """
+        member_map = enum.EnumMeta.__getattribute__(cls, '_member_map_')
+        if isinstance(member, str):
+            member = member_map[member]
+        if member_map.get(member._name_) is not member:
+            raise ValueError(f"{member!r} is not a member of {cls.__qualname__!r}")
+        if alias in member_map:
+            raise ValueError(f"{alias!r} is already a member of {cls.__qualname__!r}")
+        with _lock:
+            aliases = dict(type.__getattribute__(cls, '__dict__').get('_lookup_aliases_', {}))
+            aliases[alias] = member._name_
+            type.__setattr__(cls, '_lookup_aliases_', aliases)
+            # rebuilt by the next lookup
+            type.__setattr__(cls, '_lookup_indexes_', None)
+
+    @staticmethod
+    def _build_lookup_indexes_(enum_class):
+        """
+        Returns the exact and casefolded lookup indexes of the members first defined by enum_class,
+        as a tuple indexed by casefold of the (names, aliases, values) indexes.
+        """
+        # built under the lock, so an index built from the members before extend() isn't stored after it
+        with _lock:
+            indexes = type.__getattribute__(enum_class, '__dict__').get('_lookup_indexes_')
+            if indexes is not None:
+                return indexes
+            getattribute = enum.EnumMeta.__getattribute__
+            member_map = getattribute(enum_class, '_member_map_')
+            base = type.__getattribute__(enum_class, '__bases__')[0]
+            inherited = getattribute(base, '_member_map_') if isinstance(base, EnumExType) else {}
+            own = [(name, member) for name, member in member_map.items() if name not in inherited]
+            aliases = type.__getattribute__(enum_class, '__dict__').get('_lookup_aliases_', {})
+            tiers = (
+                    [(name, name) for name, member in own],
+                    list(aliases.items()),
+                    [(str(member._value_), member._name_) for name, member in own],
+                    )
+            indexes = (
+                    tuple(dict(keys) for keys in tiers),
+                    tuple({key.casefold(): name for key, name in keys} for keys in tiers),
+                    )
+            type.__setattr__(enum_class, '_lookup_indexes_', indexes)
+            return indexes
+
+    def extend(cls, **members):
+        """
+        Adds the members `name=value` to cls, which must have been created with extensible=True, and to each
+        subclass which inherited the members of cls. Values are given as in the class body, including auto()
+        and negative flag values.
+
+        The new members are appended to the members of each class and numbered after its existing members,
+        and the caches enumex builds from the members (flag masks and tables, lookup and resolve indexes,
+        verify summaries) are updated or dropped, without recreating the existing members or classes.
+        Flag classes also drop their pseudo-members and cached inversions, which depend on the bits of the class.
+        Classes are updated under the enumex lock, and members are published once they are complete.
+
+        The subclasses which inherit the members of cls must not define members of their own, as the inherited
+        members keep the ordinals of cls and the ordinals after them are taken by the members of the subclass.
+
+        Raises a TypeError if cls or one of its subclasses isn't extensible or already defines a name, or if
+        a subclass defines its own members, in which case no member is added.
+        """
+        getattribute = enum.EnumMeta.__getattribute__
+        invalid_names = [
+                name for name in members
+                if name in ('mro', '') or enum._is_dunder(name) or enum._is_sunder(name)
+                or enum._is_private(cls.__name__, name)
+                ]
+        if invalid_names:
+            raise ValueError('invalid enum member name(s) %s'  % (
+                    ','.join(repr(n) for n in invalid_names)
+                    ))
+        if not members:
+            return
+        with _lock:
+            # cls, then the subclasses which copied the members of their first base
+            classes = [cls]
+            for enum_class in classes:
+                classes.extend(
+                        subclass for subclass in type.__subclasses__(enum_class)
+                        if type.__getattribute__(subclass, '__bases__')[0] is enum_class
+                        )
+            for enum_class in classes:
+                if not getattribute(enum_class, '_extensible_'):
+                    raise TypeError(f"cannot extend {enum_class.__qualname__!r}, it wasn't created with extensible=True")
+                if enum_class is not cls and len(getattribute(enum_class, '_member_map_')) != len(
+                        getattribute(type.__getattribute__(enum_class, '__bases__')[0], '_member_map_')
+                    ):
+                    raise TypeError(
+                            f"cannot extend {cls.__qualname__!r}, its subclass {enum_class.__qualname__!r} "
+                            f"defines its own members"
+                            )
+                class_dict = type.__getattribute__(enum_class, '__dict__')
+                for name in members:
+                    if name in class_dict:
+                        raise TypeError(f"{name!r} already defined in {enum_class.__qualname__!r}")
+            #
+            # resolve auto() values, and invert negative flag values
+            values = dict(members)
+            if any(isinstance(value, enum.auto) for value in values.values()):
+                last_values = [member._value_ for member in getattribute(cls, '_member_map_').values()]
+                _resolve_auto_values(getattribute(cls, '_generate_next_value_'), values, last_values)
+            if FlagEx is not None and issubclass(cls, FlagEx):
+                _invert_negative_flags(values, getattribute(cls, '_flag_mask_'))
+            #
+            # create every member before adding any
+            created = []
+            for enum_class in classes:
+                abstract_methods = type.__getattribute__(enum_class, '__dict__').get('__abstractmethods__')
+                if abstract_methods:
+                    # members are created before the abstract methods are set, see _finalize_
+                    type.__setattr__(enum_class, '__abstractmethods__', frozenset())
+                try:
+                    new_member = getattribute(enum_class, '_new_member_')
+                    use_args = getattribute(enum_class, '_use_args_')
+                    member_type = getattribute(enum_class, '_member_type_')
+                    created.append([
+                            _create_member(enum_class, name, value, new_member, use_args, member_type)
+                            for name, value in values.items()
+                            ])
+                finally:
+                    if abstract_methods:
+                        type.__setattr__(enum_class, '__abstractmethods__', abstract_methods)
+            for enum_class, new_members in zip(classes, created):
+                EnumExType._add_members_(enum_class, new_members, enum_class is cls)
+
+    @staticmethod
+    def _add_members_(enum_class, new_members, defined):
+        """
+        Adds the members created by extend to enum_class, as _proto_member.__set_name__, and updates its caches.
+        `defined` is True for the class the members were added to, False for the subclasses inheriting them.
+        """
+        getattribute = enum.EnumMeta.__getattribute__
+        member_names = getattribute(enum_class, '_member_names_')
+        member_map = getattribute(enum_class, '_member_map_')
+        value2member_map = getattribute(enum_class, '_value2member_map_')
+        hashable_values = getattribute(enum_class, '_hashable_values_')
+        is_flag = FlagEx is not None and issubclass(enum_class, FlagEx)
+        mro = type.__getattribute__(enum_class, '__mro__')[1:]
+        if is_flag:
+            flag_mask = getattribute(enum_class, '_flag_mask_')
+            singles_mask = getattribute(enum_class, '_singles_mask_')
+            sorted_values = True
+        by_ordinal = getattribute(enum_class, '_members_by_ordinal_')
+        members = []
+        values = []
+        for member in new_members:
+            name, value = member._name_, member._value_
+            member._sort_order_ = len(member_names)
+            try:
+                hashable = True
+                existing = value2member_map.get(value)
+            except TypeError:
+                hashable = False
+                existing = next((m for m in member_map.values() if m._value_ == value), None)
+            canonical = False
+            if existing is not None and member_map.get(existing._name_) is existing and existing._value_ == value:
+                # an alias, rather than a pseudo-member or another key of a member
+                member = existing
+            else:
+                if is_flag and isinstance(value, int):
+                    flag_mask |= value
+                    if _is_single_bit(value):
+                        if value < singles_mask:
+                            sorted_values = False
+                        singles_mask |= value
+                canonical = not is_flag or isinstance(value, int) and _is_single_bit(value)
+                # ordinals continue after the existing members (see _number_members_), set before publishing
+                member.__dict__['_ordinal_'] = len(by_ordinal) + len(members)
+                members.append(member)
+            if any(_is_descriptor(type.__getattribute__(base, '__dict__').get(name)) for base in mro):
+                # redirect to the descriptor
+                enum.EnumMeta._add_member_(enum_class, name, member)
+            else:
+                type.__setattr__(enum_class, name, member)
+                member_map[name] = member
+            # listed once it can be looked up by name
+            if canonical:
+                member_names.append(name)
+            if not hashable:
+                getattribute(enum_class, '_unhashable_values_').append(value)
+                getattribute(enum_class, '_unhashable_values_map_').setdefault(name, []).append(value)
+            else:
+                if member is not existing:
+                    value2member_map[value] = member
+                    values.append(value)
+                if value not in hashable_values:
+                    hashable_values.append(value)
+        # replaced rather than mutated, so readers never see a partial table
+        type.__setattr__(enum_class, '_members_by_ordinal_', by_ordinal + tuple(members))
+        if is_flag:
+            type.__setattr__(enum_class, '_flag_mask_', flag_mask)
+            type.__setattr__(enum_class, '_singles_mask_', singles_mask)
+            type.__setattr__(enum_class, '_all_bits_', 2 ** flag_mask.bit_length() - 1)
+            if not sorted_values:
+                enum_class._iter_member_ = enum_class._iter_member_by_def_
+            type.__setattr__(enum_class, '_bit_members_', None)
+            # pseudo-members and inversions depend on the bits of the class
+            for key, member in list(value2member_map.items()):
+                if member_map.get(member._name_) is not member or key != member._value_:
+                    del value2member_map[key]
+            type.__setattr__(enum_class, '_pseudo_member_cache_', None)
+            for member in member_map.values():
+                member.__dict__.pop('_inverted_', None)
+        type.__setattr__(enum_class, '_lookup_indexes_', None)
+        type.__setattr__(enum_class, '_verify_state_', None)
+        #
+        # resolve indexes, see _index_defined_members_
+        ref = weakref.ref(enum_class)
+        names = [member._name_ for member in new_members]
+        value_map = getattribute(enum_class, '_value2class_map_')
+        for value in values:
+            value_map.setdefault(value, ref)
+        getattribute(enum_class, '_name2classes_map_').update((name, (ref, )) for name in names)
+        if defined:
+            EnumExType._index_in_ancestors_(enum_class, values, names)
+
+    def freeze(cls):
+        """
+        Makes cls final, so it can no longer be subclassed, and returns it.
+
+        Final classes can't be abstract, so the abstract hooks and reentrancy guards of EnumExType
+        are replaced with the std implementations, and member access runs at the speed of a std enum.
+        Value lookups and attribute access of final classes are not counted by enumex.instrumentation.
+
+        Also available as the `final=True` class keyword.
+        Raises a TypeError if cls is abstract or has already been subclassed.
+        """
+        getattribute = enum.EnumMeta.__getattribute__
+        if getattribute(cls, '__dict__').get('_isfinalenum_', False):
+            return cls
+        if _is_abstract_enum(cls):
+            raise TypeError(f"cannot freeze abstract enum {cls.__name__!r}")
+        if type.__subclasses__(cls):
+            raise TypeError(f"cannot freeze {cls.__name__!r}, it has already been subclassed")
+
+        # Only abstract enums need the instance hooks, restore the originals they wrapped
+        for name, original in (
+                ('__getattribute__', '_original_getattribute_'),
+                ('__setattr__', '_original_setattribute_'),
+                ('__delattr__', '_original__delattr__'),
+            ):
+            method = getattribute(cls, '__dict__').get(name)
+            if method is not None and hasattr(method, original):
+                while hasattr(method, original):
+                    method = getattr(method, original)
+                type.__setattr__(cls, name, method)
+        if getattribute(cls, '__new__') is EnumEx.__new__:
+            # No need to enforce abstract methods, but the pseudo-member cache must stay bounded
+            bounded = type.__getattribute__(cls, '_pseudo_cache_size_') is not None
+            type.__setattr__(cls, '__new__', _bounded_enum_new if bounded else Enum.__new__)
+
+        type.__setattr__(cls, '_isabstractenum_', False)
+        type.__setattr__(cls, '_isfinalenum_', True)
+        cls.__class__ = _frozen_metaclass(type(cls))
+        return cls
+
     @classmethod
     def _check_for_existing_members_(mcls, class_name, bases):
-        pass # Allow inheritance
+        # Allow inheritance, unless a base is final
+        for chain in bases:
+            for base in chain.__mro__:
+                if isinstance(base, EnumExType) and enum.EnumMeta.__getattribute__(base, '__dict__').get('_isfinalenum_', False):
+                    raise TypeError(
+                            "<enum %r> cannot extend final %r"
+                            % (class_name, base)
+                            )
 
     @classmethod
     def _get_mixins_(mcls, class_name, bases):
@@ -477,6 +1283,9 @@ class EnumExType(enum.EnumMeta, ABCMeta):
     def __getattribute__(cls, name):
 
         attr = super().__getattribute__(name)
+
+        if _instrument is not None:
+            _instrument(cls, 'type_getattribute')
         
         if EnumEx is None or _reentering('type_getattr'):
             return attr
@@ -555,8 +1364,8 @@ class EnumExType(enum.EnumMeta, ABCMeta):
     def _install_abstract_setattr(cls:type):
         original_setattribute = cls.__setattr__
 
-        # Ensures custom_getattribute isn't called more than once
-        if original_setattribute.__name__ == 'custom_getattribute':
+        # Ensures custom_setattribute isn't called more than once
+        if original_setattribute.__name__ == 'custom_setattribute':
             original_setattribute = original_setattribute._original_setattribute_
 
         def custom_setattribute(self, name, value):
@@ -593,8 +1402,8 @@ class EnumExType(enum.EnumMeta, ABCMeta):
     def _install_abstract_delattr(cls:type):
         original___delattr__ = cls.__delattr__
 
-        # Ensures custom_getattribute isn't called more than once
-        if original___delattr__.__name__ == 'custom_getattribute':
+        # Ensures custom_delattr isn't called more than once
+        if original___delattr__.__name__ == 'custom_delattr':
             original___delattr__ = original___delattr__._original__delattr__
 
         def custom_delattr(self, name):
@@ -626,12 +1435,72 @@ class EnumExType(enum.EnumMeta, ABCMeta):
     
 EnumExMeta = EnumExType
 
+class _FrozenEnumExType(EnumExType):
+    """
+    Metaclass of final EnumEx classes, see EnumExType.freeze.
+
+    Final classes are neither abstract nor subclassed, so the std implementations are used instead
+    of the abstract checks, reentrancy guards and instrumentation of EnumExType.
+    """
+    __getattribute__ = type.__getattribute__
+    __getitem__ = enum.EnumMeta.__getitem__
+    __subclasscheck__ = type.__subclasscheck__
+    __instancecheck__ = type.__instancecheck__
+
+def _frozen_metaclass(metacls):
+    """
+    Returns the metaclass to use for final classes of metaclass `metacls`.
+    For EnumExType subclasses, only the methods which haven't been overridden are replaced.
+    """
+    if issubclass(metacls, _FrozenEnumExType):
+        return metacls
+    if metacls is EnumExType:
+        return _FrozenEnumExType
+    frozen = type.__getattribute__(metacls, '__dict__').get('_frozen_metaclass_')
+    if frozen is None:
+        overrides = {
+                name: method
+                for name, method in _FrozenEnumExType.__dict__.items()
+                if callable(method) and getattr(metacls, name) is getattr(EnumExType, name)
+                }
+        overrides['__module__'] = metacls.__module__
+        frozen = type(metacls)(f"_Frozen{metacls.__name__}", (metacls,), overrides)
+        type.__setattr__(metacls, '_frozen_metaclass_', frozen)
+    return frozen
+
 class EnumEx(Enum, metaclass=EnumExMeta):
     
     def __new__(cls, value):
         _enforce_abstract(cls)
-        return super().__new__(cls, value)
+        if _instrument is not None:
+            _instrument(cls, 'value_lookups')
+            value2member_map = enum.EnumMeta.__getattribute__(cls, '_value2member_map_')
+            known = len(value2member_map)
+            member = super().__new__(cls, value)
+            if len(value2member_map) > known:
+                _instrument(cls, 'pseudo_members')
+        else:
+            member = super().__new__(cls, value)
+        if type.__getattribute__(cls, '_pseudo_cache_size_') is not None:
+            _track_pseudo_member(cls, value, member)
+        return member
+
+    @enum.property
+    def ordinal(self):
+        """
+        The position of the member in definition order, assigned when its class is created.
+        Inherited members keep the ordinal of the parent's member. None for pseudo-members.
+        """
+        return self.__dict__.get('_ordinal_')
     
+def _bounded_enum_new(cls, value):
+    """
+    __new__ of final classes created with pseudo_cache_size=N.
+    """
+    member = Enum.__new__(cls, value)
+    _track_pseudo_member(cls, value, member)
+    return member
+
 class ReprEnumEx(ReprEnum, EnumEx):
     """
     Only changes the repr(), leaving str() and format() to the mixed-in type.
@@ -642,11 +1511,17 @@ class IntEnumEx(IntEnum, ReprEnumEx):
     Enum where members are also (and must be) ints
     """
 
+_sort_order = operator.attrgetter('_sort_order_')
+# Sort key of members in definition order, without calling Python level comparisons
+ordinal_key = operator.attrgetter('_ordinal_')
+
 class FlagEx(Flag, EnumEx, boundary=STRICT):
     """
     Support for flags
     """
     def _get_value(self, flag):
+        if _instrument is not None:
+            _instrument(type(self), 'flag_get_value')
         if (isinstance(flag, self.__class__) 
             # If right(flag) is a base of left, return its value to stop it from creating a base instance.
             or (isinstance(flag, FlagEx) and isinstance(self, flag.__class__))
@@ -657,7 +1532,113 @@ class FlagEx(Flag, EnumEx, boundary=STRICT):
         elif self._member_type_ is not object and isinstance(flag, self._member_type_):
             return flag
         return NotImplemented
-        
+
+    @classmethod
+    def _bit_members(cls):
+        """
+        Returns a tuple of the single-bit members of cls indexed by bit position (None for undefined bits),
+        built on first use.
+        """
+        table = type.__getattribute__(cls, '__dict__').get('_bit_members_')
+        if table is None:
+            with _lock:
+                table = type.__getattribute__(cls, '__dict__').get('_bit_members_')
+                if table is None:
+                    getattribute = enum.EnumMeta.__getattribute__
+                    member_map = getattribute(cls, '_member_map_')
+                    table = [None] * getattribute(cls, '_singles_mask_').bit_length()
+                    for name in getattribute(cls, '_member_names_'):
+                        member = member_map[name]
+                        table[member._value_.bit_length() - 1] = member
+                    table = tuple(table)
+                    type.__setattr__(cls, '_bit_members_', table)
+        return table
+
+    @classmethod
+    def _iter_member_by_value_(cls, value):
+        """
+        Extract all members from the value in increasing value order.
+        """
+        table = cls._bit_members()
+        # bits of multi-bit aliases without a single-bit member have no member to yield
+        value &= enum.EnumMeta.__getattribute__(cls, '_singles_mask_')
+        while value:
+            bit = value & -value
+            yield table[bit.bit_length() - 1]
+            value ^= bit
+
+    _iter_member_ = _iter_member_by_value_
+
+    @classmethod
+    def _iter_member_by_def_(cls, value):
+        """
+        Extract all members from the value in definition order.
+        """
+        yield from sorted(cls._iter_member_by_value_(value), key=_sort_order)
+
+    @classmethod
+    def _raw_values(cls, iterable):
+        """
+        Yields the raw values of the flags in iterable, which accepts the same operands as the FlagEx operators:
+        members of cls, its bases and subclasses, and values of the data type.
+        """
+        member_type = cls._member_type_
+        for flag in iterable:
+            if type(flag) is cls or isinstance(flag, FlagEx) and (isinstance(flag, cls) or issubclass(cls, type(flag))):
+                yield flag._value_
+            elif member_type is not object and isinstance(flag, member_type):
+                # int() so the operators of other int based enums aren't used
+                yield int(flag) if isinstance(flag, int) else flag
+            else:
+                raise TypeError(f"unsupported flag type {type(flag).__qualname__!r} for {cls.__qualname__!r}")
+
+    @classmethod
+    def union(cls, iterable):
+        """
+        Returns the flag with the bits of every flag in iterable.
+
+        Only the result is created as a member, with cls(value), so the class _boundary_ is respected.
+        """
+        value = 0
+        for flag_value in cls._raw_values(iterable):
+            value |= flag_value
+        return cls(value)
+
+    @classmethod
+    def intersection(cls, iterable):
+        """
+        Returns the flag with the bits shared by every flag in iterable, or all flags if iterable is empty.
+
+        Only the result is created as a member, with cls(value), so the class _boundary_ is respected.
+        """
+        value = None
+        for flag_value in cls._raw_values(iterable):
+            value = flag_value if value is None else value & flag_value
+        return cls(cls._flag_mask_ if value is None else value)
+
+    @classmethod
+    def count_bits(cls, iterable):
+        """
+        Returns a dict of each single-bit member of cls to the number of flags in iterable which contain it.
+        """
+        singles_mask = cls._singles_mask_
+        bit_counts = {}
+        for value, count in collections.Counter(cls._raw_values(iterable)).items():
+            value &= singles_mask
+            while value:
+                bit = value & -value
+                bit_counts[bit] = bit_counts.get(bit, 0) + count
+                value ^= bit
+        return {member: bit_counts.get(member._value_, 0) for member in cls}
+
+    @classmethod
+    def contains_any(cls, iterable, flag):
+        """
+        Returns True if any flag in iterable shares a bit with `flag`.
+        """
+        mask, = cls._raw_values((flag, ))
+        return any(value & mask for value in cls._raw_values(iterable))
+
 class IntFlagEx(IntFlag, ReprEnumEx, FlagEx, boundary=KEEP):
     """
     Support for integer-based Flags
@@ -668,6 +1649,232 @@ class StrEnumEx(StrEnum, ReprEnumEx):
     Enum where members are also (and must be) strings
     """
 
+class OrderedEnumEx(EnumEx):
+    """
+    Enum where members compare by ordinal (definition order)
+
+    Members of the class, its bases and subclasses can be compared, inherited members keep the ordinal of the parent's member.
+    """
+    def __lt__(self, other):
+        if type(other) is type(self) or isinstance(other, OrderedEnumEx) and _ordinal_comparable(self, other):
+            return self._ordinal_ < other._ordinal_
+        return NotImplemented
+
+    def __le__(self, other):
+        if type(other) is type(self) or isinstance(other, OrderedEnumEx) and _ordinal_comparable(self, other):
+            return self._ordinal_ <= other._ordinal_
+        return NotImplemented
+
+    def __gt__(self, other):
+        if type(other) is type(self) or isinstance(other, OrderedEnumEx) and _ordinal_comparable(self, other):
+            return self._ordinal_ > other._ordinal_
+        return NotImplemented
+
+    def __ge__(self, other):
+        if type(other) is type(self) or isinstance(other, OrderedEnumEx) and _ordinal_comparable(self, other):
+            return self._ordinal_ >= other._ordinal_
+        return NotImplemented
+
+def _ordinal_comparable(member, other):
+    """
+    Returns True if the ordinals of member and other, of different classes, number the same hierarchy.
+    """
+    cls, other_cls = type(member), type(other)
+    return issubclass(cls, other_cls) or issubclass(other_cls, cls)
+
+def _rebind_class_cell(obj, old_class, new_class):
+    """
+    Points the __class__ cell of the functions of obj (a function, staticmethod, classmethod or property),
+    used by zero-argument super() and __class__, from old_class to new_class.
+    """
+    for func in (
+            obj, getattr(obj, '__func__', None),
+            getattr(obj, 'fget', None), getattr(obj, 'fset', None), getattr(obj, 'fdel', None),
+        ):
+        code, closure = getattr(func, '__code__', None), getattr(func, '__closure__', None)
+        if code is None or closure is None:
+            continue
+        for name, cell in zip(code.co_freevars, closure):
+            if name == '__class__' and cell.cell_contents is old_class:
+                cell.cell_contents = new_class
+
+def _create_member(enum_class, name, value, new_member, use_args, member_type):
+    """
+    Returns the member `name` of enum_class for `value`, created as _proto_member.__set_name__ does,
+    without recording it in the class.
+    """
+    args = value if isinstance(value, tuple) else (value, )
+    if member_type is tuple:
+        args = (args, )
+    if use_args:
+        member = new_member(enum_class, *args)
+    else:
+        member = new_member(enum_class)
+    if not hasattr(member, '_value_'):
+        if member_type is object:
+            member._value_ = value
+        else:
+            try:
+                member._value_ = member_type(*args)
+            except Exception as exc:
+                new_exc = TypeError('_value_ not set in __new__, unable to create it')
+                new_exc.__cause__ = exc
+                raise new_exc
+    member._name_ = name
+    member.__objclass__ = enum_class
+    member.__init__(*args)
+    return member
+
+def simple_enumex(etype, *, boundary=None, final=False, cache_str=None, pseudo_cache_size=None, extensible=None):
+    """
+    Class decorator that converts a plain class into a subclass of the EnumEx class `etype`,
+    without EnumExType.__prepare__, _copy_existing_members and _proto_member.
+    Used by the modules generated with `python -m enumex.compile`.
+
+    `etype` is the last base of the class, and may be an EnumEx class with members to inherit from.
+    The bases of the plain class are kept before `etype` (e.g. ABC for abstract enums), and members
+    are inherited from the first base as with the class statement. The keywords are the class keywords
+    of EnumExType. Like enum._simple_enum, __init_subclass__ keywords and _order_ are not supported.
+
+        @simple_enumex(FlagEx, boundary=KEEP)
+        class Color:
+            RED = 1
+            GREEN = 2
+
+        @simple_enumex(Color)
+        class MoreColor:
+            BLUE = 4
+    """
+    def convert_class(cls):
+        metacls = type(etype)
+        cls_name = cls.__name__
+        bases = tuple(base for base in cls.__bases__ if base is not object) + (etype, )
+        metacls._check_for_existing_members_(cls_name, bases)
+        member_type, first_enum, std_base = metacls._get_mixins_(cls_name, bases)
+        is_flag = issubclass(etype, FlagEx)
+        #
+        # sort the class namespace into members and the class body
+        ignore = cls.__dict__.get('_ignore_', ())
+        if isinstance(ignore, str):
+            ignore = ignore.replace(',', ' ').split()
+        inherited = getattr(bases[0], '__members__', None) or {}
+        attrs = {name: member._value_ for name, member in inherited.items()}
+        body = {}
+        for name, obj in cls.__dict__.items():
+            # _abc_impl is set when the plain class derives from ABC, EnumExType doesn't set it
+            if name in ('__dict__', '__weakref__', '_abc_impl', '_ignore_', '_order_') or name in ignore:
+                continue
+            if isinstance(obj, enum.nonmember):
+                body[name] = obj.value
+            elif isinstance(obj, enum.member):
+                attrs[name] = obj.value
+            elif (
+                    enum._is_dunder(name) or enum._is_private(cls_name, name) or enum._is_sunder(name)
+                    or _is_descriptor(obj) or enum._is_internal_class(cls_name, obj)
+                ):
+                body[name] = obj
+            elif name in inherited:
+                raise TypeError('%r already defined as %r' % (name, attrs[name]))
+            else:
+                attrs[name] = obj
+        invalid_names = set(attrs) & {'mro', ''}
+        if invalid_names:
+            raise ValueError('invalid enum member name(s) %s'  % (
+                    ','.join(repr(n) for n in invalid_names)
+                    ))
+        gnv = body.get('_generate_next_value_')
+        if gnv is None:
+            gnv = getattr(std_base, '_generate_next_value_', None)
+        elif type(gnv) is not staticmethod:
+            body['_generate_next_value_'] = staticmethod(gnv)
+        if isinstance(body.get('__new__'), staticmethod):
+            body['__new__'] = body['__new__'].__func__
+        __new__, save_new, use_args = metacls._find_new_(body, member_type, first_enum)
+        body['_new_member_'] = __new__
+        body['_use_args_'] = use_args
+        #
+        # house-keeping structures, as EnumExType.__new__
+        body['_member_names_'] = member_names = []
+        body['_member_map_'] = member_map = {}
+        body['_value2member_map_'] = value2member_map = {}
+        body['_hashable_values_'] = hashable_values = []
+        body['_unhashable_values_'] = unhashable_values = []
+        body['_unhashable_values_map_'] = unhashable_values_map = {}
+        body['_member_type_'] = member_type
+        body['_value2class_map_'] = {}
+        body['_name2classes_map_'] = {}
+        body['_value_repr_'] = metacls._find_data_repr_(cls_name, bases)
+        body['_cache_str_'] = cache_str if cache_str is not None else getattr(first_enum, '_cache_str_', False)
+        body['_pseudo_cache_size_'] = _pseudo_cache_size(pseudo_cache_size, first_enum)
+        body['_extensible_'] = extensible if extensible is not None else getattr(first_enum, '_extensible_', False)
+        if is_flag:
+            body['_boundary_'] = boundary or getattr(first_enum, '_boundary_', None)
+            body['_inverted_'] = None
+        #
+        # resolve auto() values, and invert negative flag values
+        _resolve_auto_values(gnv, attrs, [])
+        if is_flag:
+            bits, inherited = metacls._inherited_flag_bits_(bases)
+            new_values = dict(itertools.islice(attrs.items(), inherited, None))
+            _invert_negative_flags(new_values, bits)
+            attrs.update(new_values)
+        enum_class = metacls(cls_name, bases, body, boundary=boundary, _simple=True)
+        # the methods were compiled for the plain class, super() must see the enum class
+        for obj in body.values():
+            _rebind_class_cell(obj, cls, enum_class)
+        metacls._update_methods_(enum_class, body, bases, member_type, first_enum)
+        #
+        # create the members, as _proto_member.__set_name__
+        flag_mask = singles_mask = 0
+        mro = type.__getattribute__(enum_class, '__mro__')[1:]
+        for name, value in attrs.items():
+            member = _create_member(enum_class, name, value, __new__, use_args, member_type)
+            value = member._value_
+            member._sort_order_ = len(member_names)
+            if is_flag and isinstance(value, int):
+                flag_mask |= value
+                if _is_single_bit(value):
+                    singles_mask |= value
+            try:
+                try:
+                    member = value2member_map[value]
+                except TypeError:
+                    for canonical in member_map.values():
+                        if canonical._value_ == value:
+                            member = canonical
+                            break
+                    else:
+                        raise KeyError
+            except KeyError:
+                if not is_flag or isinstance(value, int) and _is_single_bit(value):
+                    member_names.append(name)
+            if any(_is_descriptor(type.__getattribute__(base, '__dict__').get(name)) for base in mro):
+                # redirect to the descriptor
+                enum.EnumMeta._add_member_(enum_class, name, member)
+            else:
+                type.__setattr__(enum_class, name, member)
+                member_map[name] = member
+            try:
+                value2member_map.setdefault(value, member)
+                if value not in hashable_values:
+                    hashable_values.append(value)
+            except TypeError:
+                unhashable_values.append(value)
+                unhashable_values_map.setdefault(name, []).append(value)
+        if is_flag:
+            enum_class._flag_mask_ = flag_mask
+            enum_class._singles_mask_ = singles_mask
+            enum_class._all_bits_ = 2 ** flag_mask.bit_length() - 1
+            member_list = [m._value_ for m in enum_class]
+            if member_list != sorted(member_list):
+                enum_class._iter_member_ = enum_class._iter_member_by_def_
+        if save_new:
+            enum_class.__new_member__ = __new__
+        enum_class.__new__ = EnumEx.__new__
+        metacls._finalize_(enum_class, bases, final)
+        return enum_class
+    return convert_class
+
 # _stdlib_enumexs = IntEnumEx, StrEnumEx, IntFlagEx
 
 def _enforce_abstract(cls):
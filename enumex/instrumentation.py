@@ -0,0 +1,76 @@
+"""
+Opt-in counters of how often the EnumEx hot paths are hit, per enum class.
+
+Enable with `enumex.instrumentation.enable()`, or by setting the `ENUMEX_INSTRUMENTATION`
+environment variable before importing enumex. While disabled the hot paths only check a
+single module global, and `Cls[name]` is the EnumMeta implementation, as the counting
+`__getitem__` is only installed on EnumExType while enabled.
+
+Counters may undercount slightly when updated from many threads on a free-threaded build.
+"""
+import enum
+import weakref
+from . import enumex as _enumex
+
+__all__ = ['COUNTERS', 'enable', 'disable', 'is_enabled', 'reset', 'snapshot']
+
+COUNTERS = (
+        'value_lookups',        # Cls(value)
+        'name_lookups',         # Cls[name]
+        'type_getattribute',    # EnumExType.__getattribute__
+        'abstract_wrappers',    # Wrappers created for abstract methods/properties
+        'flag_get_value',       # FlagEx._get_value
+        'pseudo_members',       # Composite/pseudo-members created by a value lookup
+        'pseudo_evictions',     # Pseudo-members evicted from the cache of a pseudo_cache_size class
+        )
+
+# Weak so instrumenting doesn't keep dynamically created classes alive
+_counters = weakref.WeakKeyDictionary()
+
+def _count(cls, counter):
+    try:
+        counters = _counters[cls]
+    except KeyError:
+        counters = _counters.setdefault(cls, dict.fromkeys(COUNTERS, 0))
+    counters[counter] += 1
+
+def _getitem(cls, name):
+    _count(cls, 'name_lookups')
+    return enum.EnumMeta.__getitem__(cls, name)
+
+def enable():
+    """
+    Starts counting EnumEx hot path calls.
+    """
+    _enumex._instrument = _count
+    type.__setattr__(_enumex.EnumExType, '__getitem__', _getitem)
+
+def disable():
+    """
+    Stops counting EnumEx hot path calls, existing counters are kept.
+    """
+    _enumex._instrument = None
+    if '__getitem__' in _enumex.EnumExType.__dict__:
+        type.__delattr__(_enumex.EnumExType, '__getitem__')
+
+def is_enabled():
+    return _enumex._instrument is _count
+
+def reset():
+    """
+    Clears all counters.
+    """
+    _counters.clear()
+
+def snapshot():
+    """
+    Returns a dict of `'module.QualName'` to a dict of counter name to count,
+    for every class which has been counted. Classes sharing a name are summed.
+    """
+    result = {}
+    for cls, counters in list(_counters.items()):
+        name = f"{type.__getattribute__(cls, '__module__')}.{type.__getattribute__(cls, '__qualname__')}"
+        totals = result.setdefault(name, dict.fromkeys(COUNTERS, 0))
+        for counter, count in counters.items():
+            totals[counter] += count
+    return result
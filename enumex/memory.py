@@ -0,0 +1,137 @@
+"""
+Reports the memory used by EnumEx classes and their members.
+
+    from enumex import memory
+
+    memory.print_memory_report(mymodule)
+    records = memory.memory_report(MyEnum)     # MyEnum and its subclasses
+
+Sizes are shallow (sys.getsizeof) sizes of the objects each class owns: the class, its __dict__ and
+house-keeping containers, and its members with their __dict__ and values. Names are interned strings
+shared by every class, so they aren't counted.
+"""
+import sys
+import types
+from .enumex import EnumExType, FlagEx, _is_enumex_base_type
+
+__all__ = ['memory_report', 'print_memory_report']
+
+# Per class containers created by EnumExType
+_CONTAINERS = (
+        '_member_names_', '_member_map_', '_value2member_map_', '_hashable_values_',
+        '_unhashable_values_', '_unhashable_values_map_', '_value2class_map_', '_name2classes_map_',
+        )
+
+def _classes(target):
+    """
+    Returns the EnumEx classes of a class (itself and its subclasses) or module (defined in the module and their subclasses).
+    """
+    if isinstance(target, types.ModuleType):
+        roots = [
+                obj for obj in vars(target).values()
+                if isinstance(obj, EnumExType) and type.__getattribute__(obj, '__module__') == target.__name__
+                ]
+    elif isinstance(target, EnumExType):
+        roots = [target]
+    else:
+        raise TypeError(f"memory_report() requires an EnumEx class or a module, not {type(target).__qualname__!r}")
+    classes = {}
+    stack = list(reversed(roots))
+    while stack:
+        cls = stack.pop()
+        if cls in classes or _is_enumex_base_type(cls):
+            continue
+        classes[cls] = None
+        stack.extend(reversed(type.__subclasses__(cls)))
+    return list(classes)
+
+def _member_size(member):
+    size = sys.getsizeof(member)
+    member_dict = getattr(member, '__dict__', None)
+    if member_dict is not None:
+        size += sys.getsizeof(member_dict)
+        value = member_dict.get('_value_')
+        if value is not None and value is not member:
+            size += sys.getsizeof(value)
+    return size
+
+def _record(cls):
+    getattribute = type.__getattribute__
+    class_dict = getattribute(cls, '__dict__')
+    member_map = getattribute(cls, '_member_map_')
+    base = getattribute(cls, '__bases__')[0]
+    inherited_names = getattribute(base, '_member_map_') if isinstance(base, EnumExType) else {}
+
+    class_bytes = sys.getsizeof(cls) + sys.getsizeof(class_dict)
+    for name in _CONTAINERS:
+        container = class_dict.get(name)
+        if container is not None:
+            class_bytes += sys.getsizeof(container)
+
+    # aliases share the member of their canonical name
+    members = {}
+    for name, member in member_map.items():
+        members.setdefault(id(member), (name, member))
+    member_bytes = inherited_bytes = 0
+    inherited = 0
+    for name, member in members.values():
+        size = _member_size(member)
+        member_bytes += size
+        if name in inherited_names:
+            inherited += 1
+            inherited_bytes += size
+    if members:
+        # the share of the containers holding the inherited members
+        inherited_bytes += (class_bytes - sys.getsizeof(cls) - sys.getsizeof(class_dict)) * inherited // len(members)
+
+    pseudo_members = pseudo_bytes = 0
+    for member in list(getattribute(cls, '_value2member_map_').values()):
+        if id(member) not in members:
+            pseudo_members += 1
+            pseudo_bytes += _member_size(member)
+
+    return {
+            'module': getattribute(cls, '__module__'),
+            'qualname': getattribute(cls, '__qualname__'),
+            'members': len(members),
+            'inherited': inherited,
+            'pseudo_members': pseudo_members,
+            'class_bytes': class_bytes,
+            'member_bytes': member_bytes,
+            'inherited_bytes': inherited_bytes,
+            'pseudo_bytes': pseudo_bytes,
+            'total': class_bytes + member_bytes + pseudo_bytes,
+            'flag': issubclass(cls, FlagEx),
+            }
+
+def memory_report(cls_or_module):
+    """
+    Returns a list of dicts, one per EnumEx class of `cls_or_module` (see module docstring), with the keys:
+        module, qualname:   Names of the class
+        members:            Number of distinct members, excluding aliases and pseudo-members
+        inherited:          Number of those members copied from the base class
+        pseudo_members:     Number of cached FlagEx pseudo-members (and other values without a member name)
+        class_bytes:        Bytes of the class, its __dict__ and house-keeping containers
+        member_bytes:       Bytes of the members
+        inherited_bytes:    Bytes of the members and container entries duplicating the base class's members
+        pseudo_bytes:       Bytes of the cached pseudo-members
+        total:              class_bytes + member_bytes + pseudo_bytes
+        flag:               Whether the class is a FlagEx
+    """
+    return [_record(cls) for cls in _classes(cls_or_module)]
+
+def print_memory_report(cls_or_module, file=None):
+    """
+    Prints the memory report of `cls_or_module` and its totals.
+    """
+    file = file or sys.stdout
+    records = memory_report(cls_or_module)
+    columns = ('members', 'inherited', 'pseudo_members', 'class_bytes', 'member_bytes', 'inherited_bytes', 'pseudo_bytes', 'total')
+    print(f"{'class':<40} " + ' '.join(f"{c[:12]:>12}" for c in columns), file=file)
+    for record in records:
+        name = f"{record['module']}.{record['qualname']}"
+        if len(name) > 40:
+            name = '...' + name[-37:]
+        print(f"{name:<40} " + ' '.join(f"{record[c]:>12}" for c in columns), file=file)
+    totals = {c: sum(r[c] for r in records) for c in columns}
+    print(f"{'total':<40} " + ' '.join(f"{totals[c]:>12}" for c in columns), file=file)
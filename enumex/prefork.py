@@ -0,0 +1,39 @@
+"""
+Prepares EnumEx classes to be shared with forked worker processes, e.g. by pre-fork servers.
+
+    import enumex
+    import myapp                    # defines the EnumEx classes
+
+    enumex.prefork_freeze()
+    # fork the workers
+
+Workers share the memory of the parent until they write to it. EnumEx classes build some tables on
+first use (lookup indexes, the bit tables of flags, cached strs), and the garbage collector writes to
+every object it tracks each time it collects the oldest generation, so without preparation each worker
+ends up with its own copy of the pages holding the classes and members.
+
+prefork_freeze builds the lazy tables of every EnumEx class in the parent with prewarm(), then moves every
+object to the permanent generation of the garbage collector with gc.freeze(), so the collections of the
+workers skip them. Reference counts are still updated when members are used, which only copies the pages
+of the members a worker uses.
+"""
+import gc
+from .warming import prewarm
+
+__all__ = ['prefork_freeze']
+
+def prefork_freeze(*, flags_up_to_bits=1, freeze=True):
+    """
+    Builds the lazily built structures of every EnumEx class (see prewarm, flag composites aren't built
+    unless `flags_up_to_bits` is above 1, as they would grow the frozen heap), and unless `freeze` is False,
+    collects and freezes the objects tracked by the garbage collector (see gc.freeze). Call it in the parent
+    process once the classes have been imported, just before forking the workers.
+
+    Returns the number of classes prepared.
+    """
+    count = len(prewarm(flags_up_to_bits=flags_up_to_bits))
+    if freeze:
+        # collected first, so garbage isn't kept forever
+        gc.collect()
+        gc.freeze()
+    return count
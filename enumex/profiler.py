@@ -0,0 +1,277 @@
+"""
+Optional profiler which attributes the wall time spent in enumex internals to the enum class
+and operation it was spent on, built on `sys.monitoring`.
+
+Calls and returns are only monitored for the code objects of enumex internals (and EnumMeta.__getitem__,
+counted for EnumEx classes only). sys.monitoring has no local PY_THROW and PY_UNWIND events, so while
+profiling every exception raised or unwound anywhere in the process also calls the profiler, which
+ignores code outside of enumex. Code which raises many exceptions runs slower while profiling.
+
+    from enumex import profiler
+
+    with profiler.profile():
+        run_workload()
+
+    profiler.stats()                        # {'module.A': {'attribute': {'calls': 10, 'time': 0.0001}, ...}}
+    profiler.dump_collapsed('enumex.folded') # Input for flamegraph.pl / speedscope
+
+Operations are:
+    attribute:      Class and member attribute access (EnumExType.__getattribute__, abstract hooks)
+    value_lookup:   Member lookups (EnumEx.__new__, Cls[name], resolve, lookup)
+    flag_op:        FlagEx operators
+    class_creation: Creating EnumEx classes (EnumExType.__prepare__/__new__)
+Other internals are attributed to the operation which called them.
+"""
+import enum
+import sys
+import threading
+import time
+import types
+from contextlib import contextmanager
+from . import enumex as _enumex
+
+__all__ = ['start', 'stop', 'is_running', 'reset', 'profile', 'stats', 'dump_collapsed']
+
+# Tool ids which are not reserved by sys.monitoring for debuggers, coverage, profilers and optimizers
+_TOOL_IDS = (3, 4)
+_TOOL_NAME = 'enumex.profiler'
+
+_OPERATIONS = {
+        'EnumExType.__getattribute__': 'attribute',
+        'EnumExType._install_abstract_getattribute.<locals>.custom_getattribute': 'attribute',
+        'EnumExType._install_abstract_setattr.<locals>.custom_setattribute': 'attribute',
+        'EnumExType._install_abstract_delattr.<locals>.custom_delattr': 'attribute',
+        'EnumEx.__new__': 'value_lookup',
+        'EnumExType.resolve': 'value_lookup',
+        'EnumExType.resolve_name': 'value_lookup',
+        'EnumExType.lookup': 'value_lookup',
+        'FlagEx._get_value': 'flag_op',
+        'EnumExType.__prepare__': 'class_creation',
+        'EnumExType.__new__': 'class_creation',
+        'simple_enumex.<locals>.convert_class': 'class_creation',
+        }
+
+# Cls[name] is the stdlib implementation unless instrumentation is enabled, its calls on other enums are skipped
+_FOREIGN_CODES = {
+        enum.EnumMeta.__getitem__.__code__: 'value_lookup',
+        }
+
+_tool_id = None
+_codes = {}             # code object -> operation, or None for internals attributed to their caller
+_self_times = {}        # collapsed stack -> nanoseconds spent in the last frame of the stack
+_totals = {}            # (class name, operation) -> [calls, nanoseconds]
+_stats_lock = threading.Lock()
+_thread_state = threading.local()
+
+def _collect_codes():
+    """
+    Returns the code objects of every function in enumex.enumex, including nested functions,
+    mapped to the operation they perform.
+    """
+    codes = {}
+
+    def add(code):
+        codes[code] = _OPERATIONS.get(code.co_qualname)
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                add(const)
+
+    def add_function(obj):
+        obj = getattr(obj, '__func__', obj)
+        code = getattr(obj, '__code__', None)
+        if isinstance(code, types.CodeType) and obj.__module__ == _enumex.__name__:
+            add(code)
+
+    for obj in vars(_enumex).values():
+        if isinstance(obj, type) and obj.__module__ == _enumex.__name__:
+            for attr in type.__getattribute__(obj, '__dict__').values():
+                add_function(attr)
+                if isinstance(attr, property):
+                    for accessor in (attr.fget, attr.fset, attr.fdel):
+                        add_function(accessor)
+        else:
+            add_function(obj)
+    codes.update(_FOREIGN_CODES)
+    return codes
+
+def _qualname(cls):
+    return f"{type.__getattribute__(cls, '__module__')}.{type.__getattribute__(cls, '__qualname__')}"
+
+def _class_name(code, frame):
+    """
+    Returns the name of the enum class the frame is operating on, found from its arguments.
+    """
+    if not code.co_argcount:
+        return None
+    arguments = frame.f_locals
+    first = arguments.get(code.co_varnames[0])
+    if isinstance(first, type) and issubclass(first, _enumex.EnumExType):
+        # A metaclass method, the class being created is named by the next argument
+        name = arguments.get(code.co_varnames[1]) if code.co_argcount > 1 else None
+        if not isinstance(name, str):
+            return None
+        classdict = arguments.get('classdict')
+        if isinstance(classdict, dict) and '__qualname__' in classdict:
+            return f"{classdict.get('__module__')}.{classdict['__qualname__']}"
+        # __prepare__, named from the frame executing the class statement
+        caller = frame.f_back
+        if caller is None:
+            return name
+        module = caller.f_globals.get('__name__')
+        if caller.f_code.co_qualname == '<module>':
+            return f"{module}.{name}"
+        return f"{module}.{caller.f_code.co_qualname}.<locals>.{name}"
+    if isinstance(first, _enumex.EnumExType):
+        return _qualname(first)
+    if isinstance(type(first), _enumex.EnumExType):
+        return _qualname(type(first))
+    return None
+
+def _stack():
+    try:
+        return _thread_state.stack
+    except AttributeError:
+        _thread_state.stack = []
+        return _thread_state.stack
+
+def _on_start(code, instruction_offset):
+    _push(code, False)
+
+def _on_resume(code, instruction_offset, *args):
+    # PY_RESUME and PY_THROW, a generator continues after a yield
+    _push(code, True)
+
+def _push(code, resumed):
+    operation = _codes.get(code, False)
+    if operation is False:
+        return
+    stack = _stack()
+    if stack and operation is None:
+        # Internal helper, attribute it to the caller
+        parent = stack[-1]
+        operation, class_name = parent[1], parent[2]
+    else:
+        class_name = _class_name(code, sys._getframe(2))
+        if class_name is None and code in _FOREIGN_CODES:
+            return
+        class_name = class_name or (stack[-1][2] if stack else None) or '<unknown>'
+        operation = operation or 'other'
+    stack.append([code, operation, class_name, time.perf_counter_ns(), 0, resumed])
+
+def _on_return(code, instruction_offset, *args):
+    # PY_RETURN, PY_UNWIND and PY_YIELD, generators are popped while suspended so they don't hide later calls
+    if code not in _codes:
+        return
+    stack = _stack()
+    if not stack or stack[-1][0] is not code:
+        # Started before profiling began
+        return
+    now = time.perf_counter_ns()
+    frame = stack.pop()
+    elapsed = now - frame[3]
+    key = ';'.join([frame[2], frame[1]] + [f[0].co_qualname for f in stack] + [code.co_qualname])
+    with _stats_lock:
+        _self_times[key] = _self_times.get(key, 0) + elapsed - frame[4]
+        if stack:
+            stack[-1][4] += elapsed
+        else:
+            total = _totals.setdefault((frame[2], frame[1]), [0, 0])
+            # a resumed generator adds its time to the call which started it
+            if not frame[5]:
+                total[0] += 1
+            total[1] += elapsed
+
+def start():
+    """
+    Starts profiling enumex internals on all threads.
+
+    Raises a RuntimeError if no sys.monitoring tool id is available.
+    """
+    global _tool_id, _codes
+    if _tool_id is not None:
+        return
+    monitoring = sys.monitoring
+    for tool_id in _TOOL_IDS:
+        if monitoring.get_tool(tool_id) is None:
+            break
+    else:
+        raise RuntimeError("No sys.monitoring tool id is available for enumex.profiler")
+
+    monitoring.use_tool_id(tool_id, _TOOL_NAME)
+    _codes = _collect_codes()
+    events = monitoring.events
+    monitoring.register_callback(tool_id, events.PY_START, _on_start)
+    monitoring.register_callback(tool_id, events.PY_RESUME, _on_resume)
+    monitoring.register_callback(tool_id, events.PY_THROW, _on_resume)
+    monitoring.register_callback(tool_id, events.PY_RETURN, _on_return)
+    monitoring.register_callback(tool_id, events.PY_YIELD, _on_return)
+    monitoring.register_callback(tool_id, events.PY_UNWIND, _on_return)
+    local_events = events.PY_START | events.PY_RESUME | events.PY_RETURN | events.PY_YIELD
+    for code in _codes:
+        monitoring.set_local_events(tool_id, code, local_events)
+    # PY_THROW and PY_UNWIND can't be local events, the callbacks filter out other code
+    monitoring.set_events(tool_id, events.PY_THROW | events.PY_UNWIND)
+    _tool_id = tool_id
+
+def stop():
+    """
+    Stops profiling, collected stats are kept until reset() is called.
+    """
+    global _tool_id
+    if _tool_id is None:
+        return
+    monitoring = sys.monitoring
+    events = monitoring.events
+    monitoring.set_events(_tool_id, events.NO_EVENTS)
+    for code in _codes:
+        monitoring.set_local_events(_tool_id, code, events.NO_EVENTS)
+    for event in (events.PY_START, events.PY_RESUME, events.PY_THROW, events.PY_RETURN, events.PY_YIELD, events.PY_UNWIND):
+        monitoring.register_callback(_tool_id, event, None)
+    monitoring.free_tool_id(_tool_id)
+    _tool_id = None
+
+def is_running():
+    return _tool_id is not None
+
+def reset():
+    """
+    Clears collected stats.
+    """
+    with _stats_lock:
+        _self_times.clear()
+        _totals.clear()
+
+@contextmanager
+def profile():
+    """
+    Profiles enumex internals for the duration of the with block.
+    """
+    start()
+    try:
+        yield
+    finally:
+        stop()
+
+def stats():
+    """
+    Returns a dict of enum class name to a dict of operation to `{'calls': int, 'time': seconds}`.
+
+    Only the outermost enumex call is counted, so time spent in nested internals isn't counted twice.
+    """
+    result = {}
+    with _stats_lock:
+        totals = list(_totals.items())
+    for (class_name, operation), (calls, nanoseconds) in totals:
+        result.setdefault(class_name, {})[operation] = {'calls': calls, 'time': nanoseconds / 1e9}
+    return result
+
+def dump_collapsed(path):
+    """
+    Writes the collected stacks to `path` in the collapsed stack format used by flamegraph.pl,
+    as `class;operation;function;...;function nanoseconds`.
+    """
+    with _stats_lock:
+        self_times = sorted(_self_times.items())
+    with open(path, 'w') as file:
+        for key, nanoseconds in self_times:
+            file.write(f"{key} {nanoseconds}\n")
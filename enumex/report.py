@@ -0,0 +1,132 @@
+"""
+Records how long each EnumEx class took to create, and in which phase of EnumExType the time was spent.
+
+    from enumex import report
+
+    report.enable()
+    import mymodule
+    report.print_report()
+
+Or from the command line, which imports the given modules with recording enabled:
+
+    python -m enumex.report [-n LIMIT] module [module ...]
+
+Phases are:
+    get_mixins:             EnumExType._get_mixins_ (called by __prepare__ and __new__)
+    copy_existing_members:  Copying inherited members into the class namespace
+    class_body:             Executing the class body (including auto() values)
+    prepare_members:        Converting the namespace into _proto_members and house-keeping structures
+    type_new:               type.__new__, which creates the members (_proto_member.__set_name__)
+    methods:                Fixing up __repr__/__str__/__format__/__reduce_ex__, Flag operators and __new__
+    flag:                   Flag post-processing and _order_ checks
+    index:                  Recording members in the resolve indexes
+    abstract:               update_abstractmethods and installing the abstract hooks
+"""
+import argparse
+import importlib
+import sys
+import threading
+from . import enumex as _enumex
+
+__all__ = ['PHASES', 'enable', 'disable', 'is_enabled', 'reset', 'records', 'print_report', 'main']
+
+PHASES = (
+        'get_mixins', 'copy_existing_members', 'class_body', 'prepare_members',
+        'type_new', 'methods', 'flag', 'index', 'abstract',
+        )
+
+# Records only hold names, so recording doesn't keep dynamically created classes alive
+_records = []
+_records_lock = threading.Lock()
+
+def _record(timer, enum_class):
+    getattribute = type.__getattribute__
+    members = len(getattribute(enum_class, '_member_map_'))
+    phases = dict.fromkeys(PHASES, 0.0)
+    phases.update(timer.phases)
+    record = {
+            'module': getattribute(enum_class, '__module__'),
+            'qualname': getattribute(enum_class, '__qualname__'),
+            'members': members,
+            'inherited': timer.inherited,
+            # Executing the class body is the user's cost, not EnumExType's
+            'total': sum(t for phase, t in phases.items() if phase != 'class_body'),
+            'phases': phases,
+            }
+    with _records_lock:
+        _records.append(record)
+
+def enable():
+    """
+    Starts recording the creation time of new EnumEx classes.
+    """
+    _enumex._creation_timing = _record
+
+def disable():
+    """
+    Stops recording, existing records are kept.
+    """
+    _enumex._creation_timing = None
+
+def is_enabled():
+    return _enumex._creation_timing is _record
+
+def reset():
+    """
+    Clears all records.
+    """
+    with _records_lock:
+        _records.clear()
+
+def records():
+    """
+    Returns a list of dicts, one per recorded class, in creation order with the keys:
+        module, qualname:   Names of the class
+        members:            Number of members, including aliases and inherited members
+        inherited:          Number of members inherited from the base class
+        total:              Seconds spent in EnumExType, excluding the class body
+        phases:             Dict of phase name to seconds, see PHASES
+    """
+    with _records_lock:
+        return [dict(record, phases=dict(record['phases'])) for record in _records]
+
+def print_report(limit=20, file=None):
+    """
+    Prints the `limit` slowest classes to create, and the totals of all recorded classes.
+    """
+    file = file or sys.stdout
+    recorded = sorted(records(), key=lambda r: r['total'], reverse=True)
+
+    columns = ('total',) + PHASES
+    print(f"{'class':<40} {'members':>8} {'inherit':>8} " + ' '.join(f"{c[:10]:>10}" for c in columns), file=file)
+    for record in recorded[:limit]:
+        name = f"{record['module']}.{record['qualname']}"
+        if len(name) > 40:
+            name = '...' + name[-37:]
+        times = [record['total']] + [record['phases'][p] for p in PHASES]
+        print(f"{name:<40} {record['members']:>8} {record['inherited']:>8} "
+              + ' '.join(f"{t * 1000:>10.3f}" for t in times), file=file)
+
+    total = sum(r['total'] for r in recorded)
+    members = sum(r['members'] for r in recorded)
+    print(f"\n{len(recorded)} classes, {members} members, {total * 1000:.3f} ms in EnumExType (times in ms)", file=file)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+            prog='python -m enumex.report',
+            description="Imports modules and reports the EnumEx classes which were slowest to create.",
+            )
+    parser.add_argument('modules', nargs='+', help="modules to import")
+    parser.add_argument('-n', '--limit', type=int, default=20, help="number of classes to show (default: 20)")
+    args = parser.parse_args(argv)
+
+    enable()
+    try:
+        for module in args.modules:
+            importlib.import_module(module)
+    finally:
+        disable()
+    print_report(args.limit)
+
+if __name__ == "__main__":
+    main()
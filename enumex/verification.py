@@ -0,0 +1,181 @@
+"""
+Checks EnumEx classes for constraints, as enum.verify and enum.unique, without re-checking inherited members.
+
+    from enum import UNIQUE, CONTINUOUS, NAMED_FLAGS
+    from enumex import verify, unique
+
+    @verify(UNIQUE, CONTINUOUS)
+    class Color(EnumEx):
+        RED = 1
+        GREEN = 2
+
+    @verify(UNIQUE, CONTINUOUS)
+    class MoreColor(Color):     # Only BLUE is checked
+        BLUE = 3
+
+A summary of each check (e.g. the lowest and highest values and the number of members for CONTINUOUS)
+is cached on the class, and the summary of a subclass is computed from the summary of the class it
+inherited its members from and its new members. Failures are reported by enum.verify / enum.unique,
+with the same errors.
+"""
+import enum
+import itertools
+from enum import UNIQUE, CONTINUOUS, NAMED_FLAGS
+from .enumex import EnumExType, FlagEx, _is_enumex_base_type, _lock
+
+__all__ = ['verify', 'unique']
+
+def _parent(cls):
+    """
+    Returns the class cls copied its members from, or None.
+    """
+    base = type.__getattribute__(cls, '__bases__')[0]
+    if (
+            isinstance(base, EnumExType) and not _is_enumex_base_type(base)
+            and type.__getattribute__(base, '_member_map_')
+        ):
+        return base
+    return None
+
+def _summary(cls, check):
+    """
+    Returns the cached summary of `check` for cls, computing it (and the summaries of its parents) if needed.
+    """
+    states = type.__getattribute__(cls, '__dict__').get('_verify_state_')
+    if states is not None and check in states:
+        return states[check]
+    # summaries are computed from the top of the hierarchy, so each class is summarized once
+    chain = [cls]
+    parent = _parent(cls)
+    while parent is not None:
+        parent_states = type.__getattribute__(parent, '__dict__').get('_verify_state_')
+        if parent_states is not None and check in parent_states:
+            break
+        chain.append(parent)
+        parent = _parent(parent)
+    summary = None if parent is None else type.__getattribute__(parent, '__dict__')['_verify_state_'][check]
+    for enum_class in reversed(chain):
+        summary = _SUMMARIES[check](enum_class, parent, summary)
+        with _lock:
+            states = type.__getattribute__(enum_class, '__dict__').get('_verify_state_')
+            if states is None:
+                states = {}
+                type.__setattr__(enum_class, '_verify_state_', states)
+            states[check] = summary
+        parent = enum_class
+    return summary
+
+def _new_items(cls, parent):
+    """
+    Returns an iterator of the (name, member) items of cls which weren't inherited from parent.
+    Inherited members are copied first, so they are the first items of the member map.
+    """
+    inherited = len(type.__getattribute__(parent, '_member_map_')) if parent is not None else 0
+    return itertools.islice(type.__getattribute__(cls, '_member_map_').items(), inherited, None)
+
+def _new_member_names(cls, parent):
+    inherited = len(type.__getattribute__(parent, '_member_names_')) if parent is not None else 0
+    return type.__getattribute__(cls, '_member_names_')[inherited:]
+
+def _unique_summary(cls, parent, summary):
+    """
+    Number of aliases.
+    """
+    aliases = summary or 0
+    for name, member in _new_items(cls, parent):
+        if member._name_ != name:
+            aliases += 1
+    return aliases
+
+def _continuous_summary(cls, parent, summary):
+    """
+    For enums, (lowest value, highest value, number of members) of int values, or None if a value isn't an int.
+    Not used for flags, which are checked with _singles_mask_.
+    """
+    if parent is not None and summary is None:
+        return None
+    low, high, count = summary or (None, None, 0)
+    member_map = type.__getattribute__(cls, '_member_map_')
+    for name in _new_member_names(cls, parent):
+        value = member_map[name]._value_
+        if type(value) is not int:
+            return None
+        if count:
+            low, high = min(low, value), max(high, value)
+        else:
+            low = high = value
+        count += 1
+    return (low, high, count)
+
+def _named_flags_summary(cls, parent, summary):
+    """
+    Names of the aliases with bits which aren't the value of a member.
+    """
+    singles_mask = type.__getattribute__(cls, '_singles_mask_')
+    member_map = type.__getattribute__(cls, '_member_map_')
+    # new members may name the missing bits of inherited aliases
+    missing = [name for name in summary or () if member_map[name]._value_ & ~singles_mask]
+    canonical = set(_new_member_names(cls, parent))
+    for name, member in _new_items(cls, parent):
+        value = member._value_
+        if name not in canonical and value >= 0 and value & ~singles_mask:
+            missing.append(name)
+    return tuple(missing)
+
+_SUMMARIES = {
+        UNIQUE: _unique_summary,
+        CONTINUOUS: _continuous_summary,
+        NAMED_FLAGS: _named_flags_summary,
+        }
+
+def _passes(cls, check):
+    """
+    Returns True if cls passes `check`, or False if it fails or can only be checked by enum.verify.
+    """
+    is_flag = issubclass(cls, FlagEx)
+    if check is CONTINUOUS and is_flag:
+        singles_mask = type.__getattribute__(cls, '_singles_mask_')
+        if singles_mask.bit_count() < 2:
+            return True
+        singles_mask >>= (singles_mask & -singles_mask).bit_length() - 1
+        return not singles_mask & (singles_mask + 1)
+    if check is NAMED_FLAGS and not is_flag or check not in _SUMMARIES:
+        return False
+    summary = _summary(cls, check)
+    if check is UNIQUE:
+        return not summary
+    if check is CONTINUOUS:
+        if summary is None:
+            return False
+        low, high, count = summary
+        return count < 2 or high - low + 1 == count
+    return not summary
+
+class verify:
+    """
+    Check an EnumEx class for various constraints (see enum.EnumCheck), as enum.verify.
+
+    Summaries of the checks are cached on the class, so verifying a subclass only checks its new members.
+    Other classes are checked by enum.verify.
+    """
+    def __init__(self, *checks):
+        self.checks = checks
+
+    def __call__(self, enumeration):
+        if not isinstance(enumeration, EnumExType):
+            return enum.verify(*self.checks)(enumeration)
+        for check in self.checks:
+            if not _passes(enumeration, check):
+                # reports the failure, or checks what isn't summarized
+                enum.verify(check)(enumeration)
+        return enumeration
+
+def unique(enumeration):
+    """
+    Class decorator for EnumEx classes ensuring unique member values, as enum.unique.
+
+    Verifying a subclass only checks its new members.
+    """
+    if not isinstance(enumeration, EnumExType) or not _passes(enumeration, UNIQUE):
+        return enum.unique(enumeration)
+    return enumeration
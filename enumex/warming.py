@@ -0,0 +1,127 @@
+"""
+Builds the structures EnumEx classes otherwise build on first use, so the first lookups after a deploy
+are as fast as the following ones.
+
+    import enumex
+
+    timings = enumex.prewarm(mymodule)                          # {class: seconds}
+    future = enumex.prewarm(mymodule, background=True)          # concurrent.futures.Future of the timings
+
+Each class builds its lookup indexes, the bit table and member inversions of flags, and with
+cache_str=True the str, repr and format of its members. With flags_up_to_bits=N above 1, flags also
+build their composite pseudo-members of up to N bits set, C(n, 2) of them for n bits and N=2, which are
+kept as long as the class. Flags created with pseudo_cache_size=N only fill the free entries of their
+cache with composites, and don't prebuild inversions. The structures are built as the lookups would
+build them, so prewarming in the background while other threads use the classes is safe.
+"""
+import concurrent.futures
+import itertools
+import threading
+import time
+import types
+from .enumex import EnumEx, EnumExType, FlagEx, _is_abstract_enum, _is_enumex_base_type
+
+__all__ = ['prewarm']
+
+def _classes(targets):
+    """
+    Returns the EnumEx classes of `targets`, classes (and their subclasses) and modules (the classes defined
+    in the module and their subclasses), excluding the base types of enumex.
+    """
+    roots = []
+    for target in targets:
+        if isinstance(target, types.ModuleType):
+            roots.extend(
+                    obj for obj in vars(target).values()
+                    if isinstance(obj, EnumExType) and type.__getattribute__(obj, '__module__') == target.__name__
+                    )
+        elif isinstance(target, EnumExType):
+            roots.append(target)
+        else:
+            raise TypeError(f"prewarm() requires EnumEx classes or modules, not {type(target).__qualname__!r}")
+    classes = {}
+    stack = list(reversed(roots))
+    while stack:
+        cls = stack.pop()
+        if cls in classes:
+            continue
+        classes[cls] = None
+        stack.extend(reversed(type.__subclasses__(cls)))
+    return [cls for cls in classes if not _is_enumex_base_type(cls)]
+
+def _composites(cls, flags_up_to_bits):
+    """
+    Returns the composite pseudo-members of the single-bit members of flag cls with up to
+    flags_up_to_bits bits set, no more than the free entries of the pseudo-member cache of cls.
+    """
+    getattribute = type.__getattribute__
+    bits = [member._value_ for member in cls._bit_members() if member is not None]
+    limit = getattribute(cls, '_pseudo_cache_size_')
+    if limit is not None:
+        # only the free entries, evicting pseudo-members already in use isn't warming
+        limit = max(0, limit - len(getattribute(cls, '__dict__').get('_pseudo_member_cache_') or ()))
+    values = (
+            sum(combination)
+            for count in range(2, flags_up_to_bits + 1)
+            for combination in itertools.combinations(bits, count)
+            )
+    return [cls(value) for value in itertools.islice(values, limit)]
+
+def _warm(cls, flags_up_to_bits):
+    """
+    Builds the structures cls builds on first use.
+    """
+    getattribute = type.__getattribute__
+    members = list(getattribute(cls, '_members_by_ordinal_'))
+    if getattribute(cls, '__dict__').get('_lookup_indexes_') is None:
+        EnumExType._build_lookup_indexes_(cls)
+    if issubclass(cls, FlagEx):
+        cls._bit_members()
+        # abstract classes can't create pseudo-members
+        if not _is_abstract_enum(cls):
+            # with a bounded cache, the inversions would take the entries of the pseudo-members in use
+            if getattribute(cls, '_pseudo_cache_size_') is None:
+                for member in members:
+                    ~member
+            members += _composites(cls, flags_up_to_bits)
+    if getattribute(cls, '_cache_str_'):
+        for member in members:
+            str(member)
+            repr(member)
+            format(member)
+
+def _prewarm(classes, flags_up_to_bits):
+    timings = {}
+    for cls in classes:
+        start = time.perf_counter()
+        _warm(cls, flags_up_to_bits)
+        timings[cls] = time.perf_counter() - start
+    return timings
+
+def prewarm(classes_or_modules=None, *, flags_up_to_bits=1, background=False):
+    """
+    Builds the structures the EnumEx classes of `classes_or_modules` otherwise build on first use (see module
+    docstring), where classes_or_modules is an EnumEx class (with its subclasses), a module, an iterable of
+    them, or None for every EnumEx class.
+
+    Returns a dict of the seconds spent warming each class. When background is True, the classes are
+    warmed by a daemon thread, and a concurrent.futures.Future of the dict is returned instead.
+    """
+    if classes_or_modules is None:
+        classes_or_modules = [EnumEx]
+    elif isinstance(classes_or_modules, (EnumExType, types.ModuleType)):
+        classes_or_modules = [classes_or_modules]
+    classes = _classes(classes_or_modules)
+    if not background:
+        return _prewarm(classes, flags_up_to_bits)
+
+    future = concurrent.futures.Future()
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(_prewarm(classes, flags_up_to_bits))
+        except BaseException as ex:
+            future.set_exception(ex)
+    threading.Thread(target=run, name='enumex-prewarm', daemon=True).start()
+    return future